@@ -9,7 +9,8 @@ structured workflow management.
 
 import asyncio
 
-from src.specforged.server import run_server
+from src.specforged.server import install_event_loop_policy, run_server
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(run_server())
@@ -68,24 +68,29 @@ def _resolve_version() -> str:
 
 __version__ = _resolve_version()
 
-# Conditional imports to avoid dependency issues during testing
+# Server entry points are imported on first access, so importing a light
+# submodule (e.g. the performance CLI) does not load the MCP stack
+_LAZY_EXPORTS = {
+    "create_server": ".server",
+    "run_server": ".server",
+    "specforge_mcp": ".cli",
+    "specforge_http": ".cli",
+}
+
 __all__ = [
     "__version__",
     "__author__",
+    *_LAZY_EXPORTS,
 ]
 
-try:
-    from .cli import specforge_http, specforge_mcp  # noqa: F401
-    from .server import create_server, run_server  # noqa: F401
-
-    __all__.extend(
-        [
-            "create_server",
-            "run_server",
-            "specforge_mcp",
-            "specforge_http",
-        ]
-    )
-except ImportError:
-    # Dependencies not available - likely during testing or build
-    pass
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
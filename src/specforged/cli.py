@@ -6,6 +6,7 @@ Provides command-line interfaces for running SpecForge MCP server variants.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Any
@@ -38,9 +39,8 @@ def specforge_mcp() -> None:
         # If a base directory is explicitly provided, use it;
         # otherwise, rely on server defaults/env
         if args.base_dir:
-            from pathlib import Path
-
-            server = create_server(base_dir=Path(args.base_dir).expanduser().resolve())
+            # create_server expands and normalizes the path itself
+            server = create_server(base_dir=Path(args.base_dir))
             server.run()
         else:
             run_server()
@@ -87,8 +87,6 @@ def specforge_http() -> None:
     )
 
     # Get port from environment or default
-    import os
-
     port = int(os.getenv("PORT", 8000))
 
     print(f"Server starting on port {port}")
@@ -104,8 +102,6 @@ def specforge_http() -> None:
 
 def specforge_new(args: Any) -> None:
     """Entry point for SpecForge project wizard (for pipx)"""
-    from pathlib import Path
-
     from .templates import TemplateManager
     from .wizard import run_wizard
 
@@ -5,7 +5,10 @@ This module provides centralized configuration for all performance optimizations
 including caching, batching, streaming, memory management, and background processing.
 """
 
+import copy
+import json
 import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -189,6 +192,156 @@ class PerformanceConfigModel(BaseModel):
         return v
 
 
+# Predefined profile overrides, built once at import; treated as read-only
+_PROFILE_CONFIGS: Dict[str, Dict[str, Any]] = {
+    PerformanceProfile.MINIMAL: {
+        "cache": {
+            "lru_cache_size": 100,
+            "result_cache_max_size": 50,
+            "enable_parse_caching": False,
+        },
+        "batching": {
+            "max_batch_size": 10,
+            "enable_smart_batching": False,
+            "enable_operation_deduplication": False,
+        },
+        "streaming": {
+            "enable_streaming": False,
+            "enable_compression": False,
+        },
+        "memory": {
+            "max_memory_usage_mb": 30,
+            "enable_memory_monitoring": True,
+            "max_queue_size": 1000,
+        },
+        "background": {
+            "enable_background_processing": False,
+            "enable_fs_optimization": False,
+        },
+        "concurrency": {
+            "max_parallel_operations": 1,
+            "enable_concurrent_processing": False,
+        },
+    },
+    PerformanceProfile.BALANCED: {
+        "cache": {
+            "lru_cache_size": 1000,
+            "result_cache_max_size": 500,
+            "enable_parse_caching": True,
+        },
+        "batching": {
+            "max_batch_size": 50,
+            "enable_smart_batching": True,
+            "enable_operation_deduplication": True,
+        },
+        "streaming": {
+            "enable_streaming": True,
+            "enable_compression": True,
+            "compression_level": 6,
+        },
+        "memory": {
+            "max_memory_usage_mb": 100,
+            "enable_memory_monitoring": True,
+            "max_queue_size": 10000,
+        },
+        "background": {
+            "enable_background_processing": True,
+            "background_cleanup_interval_seconds": 60,
+        },
+        "concurrency": {
+            "max_parallel_operations": 3,
+            "enable_concurrent_processing": True,
+        },
+    },
+    PerformanceProfile.PERFORMANCE: {
+        "cache": {
+            "lru_cache_size": 5000,
+            "result_cache_max_size": 2000,
+            "enable_parse_caching": True,
+        },
+        "batching": {
+            "max_batch_size": 100,
+            "enable_smart_batching": True,
+            "enable_operation_deduplication": True,
+        },
+        "streaming": {
+            "enable_streaming": True,
+            "enable_compression": True,
+            "compression_level": 3,  # Faster compression
+        },
+        "memory": {
+            "max_memory_usage_mb": 500,
+            "enable_memory_monitoring": True,
+            "max_queue_size": 50000,
+            "enable_aggressive_gc": False,
+        },
+        "background": {
+            "enable_background_processing": True,
+            "background_cleanup_interval_seconds": 30,
+        },
+        "concurrency": {
+            "max_parallel_operations": 10,
+            "enable_concurrent_processing": True,
+        },
+    },
+    PerformanceProfile.DEVELOPMENT: {
+        "cache": {
+            "lru_cache_size": 500,
+            "result_cache_max_size": 200,
+            "cache_ttl_seconds": 60,  # Shorter TTL for development
+        },
+        "batching": {
+            "max_batch_size": 20,
+            "batch_timeout_ms": 500,  # Faster processing
+        },
+        "memory": {
+            "max_memory_usage_mb": 200,
+            "enable_memory_monitoring": True,
+            "max_queue_size": 5000,
+        },
+        "background": {
+            "enable_background_processing": True,
+            "background_cleanup_interval_seconds": 120,
+        },
+        "concurrency": {"debounce_delay_ms": 100},  # Faster response in dev
+        "enable_detailed_metrics": True,
+    },
+    PerformanceProfile.PRODUCTION: {
+        "cache": {
+            "lru_cache_size": 2000,
+            "result_cache_max_size": 1000,
+            "enable_parse_caching": True,
+        },
+        "batching": {
+            "max_batch_size": 75,
+            "enable_smart_batching": True,
+            "enable_operation_deduplication": True,
+        },
+        "streaming": {
+            "enable_streaming": True,
+            "enable_compression": True,
+            "compression_level": 6,
+        },
+        "memory": {
+            "max_memory_usage_mb": 150,
+            "enable_memory_monitoring": True,
+            "max_queue_size": 20000,
+            "enable_aggressive_gc": True,
+        },
+        "background": {
+            "enable_background_processing": True,
+            "background_cleanup_interval_seconds": 45,
+            "enable_fs_optimization": True,
+        },
+        "concurrency": {
+            "max_parallel_operations": 5,
+            "enable_concurrent_processing": True,
+        },
+        "enable_detailed_metrics": False,  # Reduce overhead in production
+    },
+}
+
+
 class PerformanceConfigManager:
     """Centralized performance configuration manager."""
 
@@ -251,12 +404,64 @@ class PerformanceConfigManager:
         return self._config
 
     def _load_from_file(self) -> PerformanceConfigModel:
-        """Load configuration from YAML file."""
-        with open(self.config_path, "r") as f:
-            config_dict = yaml.safe_load(f)
+        """Load configuration from YAML file, via its JSON sidecar cache."""
+        st = self.config_path.stat()
+        header = {"mtime": st.st_mtime_ns, "size": st.st_size}
+        cache_path = self.config_path.with_suffix(".cache.json")
+
+        config_dict = self._read_cache(cache_path, header)
+        if config_dict is None:
+            with open(self.config_path, "rb") as f:
+                data = f.read()
+            # Prefer the libyaml C bindings when PyYAML was built with them
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            config_dict = yaml.load(data, Loader=loader) or {}
+            self._write_cache(cache_path, header, config_dict)
 
         return PerformanceConfigModel(**config_dict)
 
+    def _read_cache(
+        self, cache_path: Path, header: Dict[str, int]
+    ) -> Optional[Dict[str, Any]]:
+        """Return cached config data if the sidecar matches the source file."""
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                if json.loads(f.readline()) != header:
+                    return None
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(
+        self, cache_path: Path, header: Dict[str, int], config_dict: Dict[str, Any]
+    ) -> None:
+        """Atomically write the JSON sidecar cache, ignoring any failure."""
+        # The cache is only an optimization; the YAML file stays the source
+        try:
+            payload = json.dumps(header) + "\n" + json.dumps(config_dict)
+        except (TypeError, ValueError):
+            return
+
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=cache_path.parent,
+                prefix=f".{cache_path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_name = f.name
+                f.write(payload)
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
     def _load_from_environment(self) -> PerformanceConfigModel:
         """Load configuration from environment variables."""
         config_dict = {}
@@ -331,154 +536,8 @@ class PerformanceConfigManager:
         return PerformanceProfile.BALANCED
 
     def _load_profile_configs(self) -> Dict[str, Dict[str, Any]]:
-        """Load predefined performance profile configurations."""
-        return {
-            PerformanceProfile.MINIMAL: {
-                "cache": {
-                    "lru_cache_size": 100,
-                    "result_cache_max_size": 50,
-                    "enable_parse_caching": False,
-                },
-                "batching": {
-                    "max_batch_size": 10,
-                    "enable_smart_batching": False,
-                    "enable_operation_deduplication": False,
-                },
-                "streaming": {
-                    "enable_streaming": False,
-                    "enable_compression": False,
-                },
-                "memory": {
-                    "max_memory_usage_mb": 30,
-                    "enable_memory_monitoring": True,
-                    "max_queue_size": 1000,
-                },
-                "background": {
-                    "enable_background_processing": False,
-                    "enable_fs_optimization": False,
-                },
-                "concurrency": {
-                    "max_parallel_operations": 1,
-                    "enable_concurrent_processing": False,
-                },
-            },
-            PerformanceProfile.BALANCED: {
-                "cache": {
-                    "lru_cache_size": 1000,
-                    "result_cache_max_size": 500,
-                    "enable_parse_caching": True,
-                },
-                "batching": {
-                    "max_batch_size": 50,
-                    "enable_smart_batching": True,
-                    "enable_operation_deduplication": True,
-                },
-                "streaming": {
-                    "enable_streaming": True,
-                    "enable_compression": True,
-                    "compression_level": 6,
-                },
-                "memory": {
-                    "max_memory_usage_mb": 100,
-                    "enable_memory_monitoring": True,
-                    "max_queue_size": 10000,
-                },
-                "background": {
-                    "enable_background_processing": True,
-                    "background_cleanup_interval_seconds": 60,
-                },
-                "concurrency": {
-                    "max_parallel_operations": 3,
-                    "enable_concurrent_processing": True,
-                },
-            },
-            PerformanceProfile.PERFORMANCE: {
-                "cache": {
-                    "lru_cache_size": 5000,
-                    "result_cache_max_size": 2000,
-                    "enable_parse_caching": True,
-                },
-                "batching": {
-                    "max_batch_size": 100,
-                    "enable_smart_batching": True,
-                    "enable_operation_deduplication": True,
-                },
-                "streaming": {
-                    "enable_streaming": True,
-                    "enable_compression": True,
-                    "compression_level": 3,  # Faster compression
-                },
-                "memory": {
-                    "max_memory_usage_mb": 500,
-                    "enable_memory_monitoring": True,
-                    "max_queue_size": 50000,
-                    "enable_aggressive_gc": False,
-                },
-                "background": {
-                    "enable_background_processing": True,
-                    "background_cleanup_interval_seconds": 30,
-                },
-                "concurrency": {
-                    "max_parallel_operations": 10,
-                    "enable_concurrent_processing": True,
-                },
-            },
-            PerformanceProfile.DEVELOPMENT: {
-                "cache": {
-                    "lru_cache_size": 500,
-                    "result_cache_max_size": 200,
-                    "cache_ttl_seconds": 60,  # Shorter TTL for development
-                },
-                "batching": {
-                    "max_batch_size": 20,
-                    "batch_timeout_ms": 500,  # Faster processing
-                },
-                "memory": {
-                    "max_memory_usage_mb": 200,
-                    "enable_memory_monitoring": True,
-                    "max_queue_size": 5000,
-                },
-                "background": {
-                    "enable_background_processing": True,
-                    "background_cleanup_interval_seconds": 120,
-                },
-                "concurrency": {"debounce_delay_ms": 100},  # Faster response in dev
-                "enable_detailed_metrics": True,
-            },
-            PerformanceProfile.PRODUCTION: {
-                "cache": {
-                    "lru_cache_size": 2000,
-                    "result_cache_max_size": 1000,
-                    "enable_parse_caching": True,
-                },
-                "batching": {
-                    "max_batch_size": 75,
-                    "enable_smart_batching": True,
-                    "enable_operation_deduplication": True,
-                },
-                "streaming": {
-                    "enable_streaming": True,
-                    "enable_compression": True,
-                    "compression_level": 6,
-                },
-                "memory": {
-                    "max_memory_usage_mb": 150,
-                    "enable_memory_monitoring": True,
-                    "max_queue_size": 20000,
-                    "enable_aggressive_gc": True,
-                },
-                "background": {
-                    "enable_background_processing": True,
-                    "background_cleanup_interval_seconds": 45,
-                    "enable_fs_optimization": True,
-                },
-                "concurrency": {
-                    "max_parallel_operations": 5,
-                    "enable_concurrent_processing": True,
-                },
-                "enable_detailed_metrics": False,  # Reduce overhead in production
-            },
-        }
+        """Return the predefined performance profile configurations."""
+        return _PROFILE_CONFIGS
 
     def _config_to_dict(self, config: PerformanceConfigModel) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -591,7 +650,8 @@ class PerformanceConfigManager:
             ):
                 self._update_dict_recursive(target[key], value)
             else:
-                target[key] = value
+                # Copy nested dicts so targets never alias the shared profiles
+                target[key] = copy.deepcopy(value) if isinstance(value, dict) else value
 
     def _set_nested_value(self, target: Dict[str, Any], path: str, value: Any) -> None:
         """Set nested dictionary value using dot notation."""
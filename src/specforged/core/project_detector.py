@@ -74,9 +74,24 @@ class ProjectDetector:
     Ensures all file operations are relative to where the user is working.
     """
 
-    def __init__(self, working_dir: Optional[Path] = None):
-        """Initialize with intelligent workspace detection."""
+    def __init__(self, working_dir: Optional[Path] = None, trusted: bool = False):
+        """
+        Initialize with intelligent workspace detection.
+
+        Args:
+            working_dir: Directory to start detection from
+            trusted: Use working_dir as the project root as-is, without walking
+                up to a marker, when it is an existing directory
+        """
+        # Marker lookups and path resolution are cached per project root
+        self._project_info_cache: dict[Path, dict] = {}
+        self._specs_dir_cache: dict[tuple[Path, str], Path] = {}
+
         # 1) explicit working_dir wins
+        if working_dir and trusted and Path(working_dir).is_dir():
+            # Resolve once so symlinked or ".." roots still contain their files
+            self.project_root = Path(working_dir).resolve()
+            return
         if working_dir:
             self.project_root = _ascend_to_project_root(Path(working_dir))
             return
@@ -120,7 +135,12 @@ class ProjectDetector:
         Returns:
             Path to the specifications directory.
         """
-        return (self.project_root / subdir).resolve()
+        key = (self.project_root, subdir)
+        specs_dir = self._specs_dir_cache.get(key)
+        if specs_dir is None:
+            specs_dir = (self.project_root / subdir).resolve()
+            self._specs_dir_cache[key] = specs_dir
+        return specs_dir
 
     def validate_path(self, target_path_str: str) -> Path:
         """
@@ -151,9 +171,13 @@ class ProjectDetector:
 
     def get_project_info(self) -> dict:
         """Get information about the detected project."""
-        return {
-            "project_root": str(self.project_root),
-            "markers_found": [
-                m for m in PROJECT_MARKERS if (self.project_root / m).exists()
-            ],
-        }
+        info = self._project_info_cache.get(self.project_root)
+        if info is None:
+            info = {
+                "project_root": str(self.project_root),
+                "markers_found": [
+                    m for m in PROJECT_MARKERS if (self.project_root / m).exists()
+                ],
+            }
+            self._project_info_cache[self.project_root] = info
+        return {**info, "markers_found": list(info["markers_found"])}
@@ -9,14 +9,15 @@ between the extension and MCP server.
 import asyncio
 import json
 import logging
+import os
 import sys
 import time
-from collections import OrderedDict, deque
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 import aiofiles
 from pydantic import BaseModel, Field, ValidationError
@@ -24,6 +25,15 @@ from pydantic import BaseModel, Field, ValidationError
 from ..config.performance import get_performance_config
 from .spec_manager import SpecificationManager
 
+# orjson parses the sync state faster; stdlib json is the fallback
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
 
 class OperationType(str, Enum):
     """Supported operation types for the queue processor."""
@@ -839,6 +849,15 @@ class QueueProcessor:
             {}
         )  # fingerprint -> operation_id
 
+        # Status counts of the last queue loaded or saved, keyed by the queue
+        # file's identity so status polls only re-parse it after it changes
+        self._status_counts: Counter = Counter()
+        self._status_counts_key: Optional[Tuple[int, int, int]] = None
+        self._status_last_processed: Optional[datetime] = None
+
+        # Monotonic time of the last queue processing pass
+        self._last_process_ts: Optional[float] = None
+
     async def process_operation_queue(self) -> None:
         """
         Process all pending operations in the queue with comprehensive error recovery.
@@ -846,6 +865,7 @@ class QueueProcessor:
         This is the main entry point called by the MCP server to process
         any pending operations before handling user requests.
         """
+        self._last_process_ts = time.monotonic()
         try:
             # Start background processing if enabled
             if (
@@ -905,6 +925,25 @@ class QueueProcessor:
             # Update error metrics
             self.perf_metrics.last_updated = datetime.now(timezone.utc)
 
+    async def process_operation_queue_if_due(self, min_interval: float) -> bool:
+        """
+        Process the operation queue unless it was processed recently.
+
+        Args:
+            min_interval: Minimum number of seconds between processing passes
+
+        Returns:
+            True if the queue was processed, False if the call was throttled
+        """
+        if (
+            self._last_process_ts is not None
+            and time.monotonic() - self._last_process_ts < min_interval
+        ):
+            return False
+
+        await self.process_operation_queue()
+        return True
+
     async def _process_operations_sequential(self, operations: List[Operation]) -> int:
         """Process operations sequentially without batching (fallback mode)."""
         processed_count = 0
@@ -1263,11 +1302,14 @@ class QueueProcessor:
         start_time = time.time()
 
         if not self.queue_file.exists():
-            return OperationQueue()
+            queue = OperationQueue()
+            self._record_status_counts(queue)
+            return queue
 
         try:
             # Use streaming parser for better performance on large files
             queue = await self.streaming_parser.parse_large_queue(self.queue_file)
+            self._record_status_counts(queue)
 
             # Update performance metrics
             parse_time = (time.time() - start_time) * 1000
@@ -1304,6 +1346,7 @@ class QueueProcessor:
             await self._atomic_write_compressed_json(self.queue_file, data)
         else:
             await self.atomic_write_json(self.queue_file, data)
+        self._record_status_counts(queue)
 
         # Update performance metrics
         io_time = (time.time() - start_time) * 1000
@@ -1311,6 +1354,55 @@ class QueueProcessor:
             self.perf_metrics.file_io_time_ms * 0.9 + io_time * 0.1
         )
 
+    def _queue_file_key(self) -> Tuple[int, int, int]:
+        """Identify the current queue file contents by inode, mtime and size."""
+        try:
+            file_stat = os.stat(self.queue_file)
+        except FileNotFoundError:
+            return (0, 0, -1)
+        return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+    def _record_status_counts(self, queue: OperationQueue) -> None:
+        """Remember per-status counts for the queue just loaded or saved."""
+        self._status_counts = Counter(op.status for op in queue.operations)
+        self._status_counts_key = self._queue_file_key()
+        self._status_last_processed = queue.last_processed
+
+    async def get_status_snapshot(self) -> Dict[str, Any]:
+        """
+        Get operation counts by status without rescanning an unchanged queue.
+
+        The queue file is only reloaded when it changed since this processor
+        last loaded or saved it (e.g. the extension queued new operations).
+
+        Returns:
+            Dictionary with total, per-status counts and last_processed
+        """
+        if self._status_counts_key != self._queue_file_key():
+            await self.load_operation_queue()
+
+        counts = self._status_counts
+        return {
+            "total": sum(counts.values()),
+            "pending": counts[OperationStatus.PENDING],
+            "in_progress": counts[OperationStatus.IN_PROGRESS],
+            "failed": counts[OperationStatus.FAILED],
+            "completed": counts[OperationStatus.COMPLETED],
+            "last_processed": self._status_last_processed,
+        }
+
+    def known_failed_count(self) -> Optional[int]:
+        """
+        Number of failed operations in the last queue this processor loaded or
+        saved, or None if it has not seen the queue yet.
+
+        Operations only become failed inside this processor, which records
+        every queue it saves, so a zero here needs no further I/O to trust.
+        """
+        if self._status_counts_key is None:
+            return None
+        return self._status_counts[OperationStatus.FAILED]
+
     async def update_operation_status(
         self, operation_id: str, status: OperationStatus
     ) -> None:
@@ -1422,7 +1514,11 @@ class QueueProcessor:
                     content = await f.read()
 
                 if content.strip():
-                    data = json.loads(content)
+                    data = (
+                        orjson.loads(content)
+                        if ORJSON_AVAILABLE
+                        else json.loads(content)
+                    )
                     sync_state = SyncState(**data)
             except (json.JSONDecodeError, ValidationError) as e:
                 self.logger.error(f"Failed to load sync state: {e}")
@@ -26,7 +26,12 @@ from .rate_limiter import (
     RateLimiter,
     RateLimitExceeded,
 )
-from .secure_file_ops import AtomicFileWriter, SecureFileError, SecureFileOperations
+from .secure_file_ops import (
+    AtomicFileWriter,
+    BatchWriter,
+    SecureFileError,
+    SecureFileOperations,
+)
 
 __all__ = [
     # Input validation
@@ -49,6 +54,7 @@ __all__ = [
     "SecureFileError",
     "SecureFileOperations",
     "AtomicFileWriter",
+    "BatchWriter",
     # Audit logging
     "SecurityAuditLogger",
     "SecurityEvent",
@@ -13,7 +13,7 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 class RateLimitStrategy(Enum):
@@ -94,7 +94,7 @@ class TokenBucket:
         self.last_refill = time.time()
         self._lock = threading.Lock()
 
-    def consume(self, tokens: int = 1) -> bool:
+    def consume(self, tokens: int = 1) -> Tuple[bool, float]:
         """
         Try to consume tokens from bucket.
 
@@ -102,7 +102,8 @@ class TokenBucket:
             tokens: Number of tokens to consume
 
         Returns:
-            True if tokens were consumed successfully
+            Tuple of (consumed, retry_after). retry_after is 0.0 when the
+            tokens were consumed, otherwise the seconds to wait before retrying
         """
         with self._lock:
             now = time.time()
@@ -116,9 +117,10 @@ class TokenBucket:
             # Try to consume requested tokens
             if self.tokens >= tokens:
                 self.tokens -= tokens
-                return True
+                return True, 0.0
 
-            return False
+            # Compute retry-after while the bucket is freshly refilled
+            return False, (tokens - self.tokens) / self.refill_rate
 
     def get_retry_after(self, tokens: int = 1) -> float:
         """Get time to wait before retry for given tokens."""
@@ -146,8 +148,14 @@ class SlidingWindow:
         self.requests = deque()
         self._lock = threading.Lock()
 
-    def is_allowed(self) -> bool:
-        """Check if request is allowed."""
+    def is_allowed(self) -> Tuple[bool, float]:
+        """
+        Check if request is allowed.
+
+        Returns:
+            Tuple of (allowed, retry_after). retry_after is 0.0 when the
+            request was allowed, otherwise the seconds to wait before retrying
+        """
         with self._lock:
             now = time.time()
 
@@ -158,9 +166,9 @@ class SlidingWindow:
             # Check if under limit
             if len(self.requests) < self.limit:
                 self.requests.append(now)
-                return True
+                return True, 0.0
 
-            return False
+            return False, self.window_size - (now - self.requests[0])
 
     def get_retry_after(self) -> float:
         """Get time to wait before retry."""
@@ -208,11 +216,10 @@ class RateLimiter:
         """Initialize rate limiter with configuration."""
         self.config = config
         self.clients: Dict[str, ClientRateLimitState] = {}
-        self.global_stats = {
-            "total_requests": 0,
-            "rejected_requests": 0,
-            "banned_clients": 0,
-        }
+        # Plain integer counters; the stats dict is only built on demand
+        self._stat_total = 0
+        self._stat_rejected = 0
+        self._stat_banned = 0
         self._lock = threading.RLock()
         self.logger = logging.getLogger(__name__)
 
@@ -235,13 +242,13 @@ class RateLimiter:
             client_state = self._get_or_create_client_state(client_id)
 
             # Update global stats
-            self.global_stats["total_requests"] += 1
+            self._stat_total += 1
             client_state.total_requests += 1
             client_state.last_request = datetime.now()
 
             # Check if client is banned
             if client_state.is_currently_banned():
-                self.global_stats["rejected_requests"] += 1
+                self._stat_rejected += 1
                 retry_after = (client_state.ban_until - datetime.now()).total_seconds()
                 raise RateLimitExceeded(
                     f"Client {client_id} is temporarily banned until {client_state.ban_until}",
@@ -250,9 +257,9 @@ class RateLimiter:
                 )
 
             # Check token bucket (general rate limiting)
-            if not client_state.token_bucket.consume(request_size):
+            allowed, retry_after = client_state.token_bucket.consume(request_size)
+            if not allowed:
                 self._record_violation(client_state, "token_bucket")
-                retry_after = client_state.token_bucket.get_retry_after(request_size)
                 raise RateLimitExceeded(
                     f"Token bucket limit exceeded for client {client_id}",
                     retry_after,
@@ -262,9 +269,9 @@ class RateLimiter:
             # Check operation-specific limits
             if operation_type in self.config.operation_limits:
                 window = client_state.operation_windows[operation_type]
-                if not window.is_allowed():
+                allowed, retry_after = window.is_allowed()
+                if not allowed:
                     self._record_violation(client_state, f"operation_{operation_type}")
-                    retry_after = window.get_retry_after()
                     raise RateLimitExceeded(
                         f"Operation limit exceeded for {operation_type}",
                         retry_after,
@@ -312,7 +319,7 @@ class RateLimiter:
         client_state.consecutive_violations += 1
 
         # Update global stats
-        self.global_stats["rejected_requests"] += 1
+        self._stat_rejected += 1
 
         # Log violation
         self.logger.warning(
@@ -336,7 +343,7 @@ class RateLimiter:
         client_state.is_banned = True
         client_state.ban_until = datetime.now() + ban_duration
 
-        self.global_stats["banned_clients"] += 1
+        self._stat_banned += 1
 
         self.logger.error(
             f"Client {client_state.client_id} has been temporarily banned "
@@ -417,7 +424,9 @@ class RateLimiter:
             )
 
             return {
-                **self.global_stats,
+                "total_requests": self._stat_total,
+                "rejected_requests": self._stat_rejected,
+                "banned_clients": self._stat_banned,
                 "active_clients": active_clients,
                 "currently_banned_clients": banned_clients,
                 "config": {
@@ -491,6 +500,8 @@ class ClientRateLimiter:
         operation_type: str,
         operation_params: Dict[str, Any],
         client_info: Optional[Dict[str, Any]] = None,
+        *,
+        content_bytes: Optional[int] = None,
     ) -> None:
         """
         Check if an operation is allowed under current rate limits.
@@ -499,6 +510,8 @@ class ClientRateLimiter:
             operation_type: Type of operation
             operation_params: Parameters for the operation
             client_info: Optional client information for identification
+            content_bytes: Optional precomputed UTF-8 size of the content, used
+                to skip re-measuring the payload
 
         Raises:
             RateLimitExceeded: If operation exceeds rate limits
@@ -508,9 +521,9 @@ class ClientRateLimiter:
         client_id = self.generate_client_id(client_info)
 
         # Calculate request weight based on operation
-        request_weight = self._calculate_request_weight(
-            operation_type, operation_params
-        )
+        if content_bytes is None:
+            content_bytes = self._content_size(operation_params)
+        request_weight = self._calculate_request_weight(operation_type, content_bytes)
 
         # Check rate limits
         try:
@@ -526,9 +539,19 @@ class ClientRateLimiter:
             )
             raise
 
-    def _calculate_request_weight(
-        self, operation_type: str, operation_params: Dict[str, Any]
-    ) -> int:
+    @staticmethod
+    def _content_size(operation_params: Dict[str, Any]) -> int:
+        """Return the UTF-8 byte size of the operation content, if any."""
+        content = operation_params.get("content")
+        if not isinstance(content, str):
+            return 0
+
+        # ASCII text has one byte per character, so avoid re-encoding it
+        if content.isascii():
+            return len(content)
+        return len(content.encode("utf-8"))
+
+    def _calculate_request_weight(self, operation_type: str, content_bytes: int) -> int:
         """Calculate the weight/cost of a request based on its complexity."""
         base_weights = {
             "create_spec": 3,  # Creating specs is more expensive
@@ -545,16 +568,10 @@ class ClientRateLimiter:
 
         base_weight = base_weights.get(operation_type, 1)
 
-        # Adjust weight based on content size
-        if "content" in operation_params:
-            content = operation_params["content"]
-            if isinstance(content, str):
-                # Add weight for large content
-                content_kb = len(content.encode("utf-8")) // 1024
-                if content_kb > 10:  # More than 10KB
-                    base_weight += min(
-                        5, content_kb // 10
-                    )  # Max +5 for very large content
+        # Add weight for large content
+        content_kb = content_bytes // 1024
+        if content_kb > 10:  # More than 10KB
+            base_weight += min(5, content_kb // 10)  # Max +5 for very large content
 
         return base_weight
 
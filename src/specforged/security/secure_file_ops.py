@@ -5,20 +5,79 @@ This module provides secure file operations that prevent race conditions,
 ensure data integrity, and maintain proper file permissions.
 """
 
+import codecs
 import fcntl
 import hashlib
+import itertools
 import json
 import logging
+import mmap
 import os
+import re
 import shutil
+import stat
 import tempfile
+import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Optional, TextIO, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 from .path_security import SecurePathHandler
 
+logger = logging.getLogger(__name__)
+
+# Source of unique temporary file names for AtomicFileWriter
+_temp_counter = itertools.count()
+
+# CRC-32C is hardware accelerated (SSE4.2 / ARMv8 CRC) when google-crc32c is
+# installed; otherwise fall back to zlib's CRC-32 for change detection.
+try:
+    import google_crc32c
+
+    CRC32C_AVAILABLE = True
+except ImportError:
+    CRC32C_AVAILABLE = False
+    google_crc32c = None  # type: ignore
+
+# orjson parses JSON natively; stdlib json is the fallback
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+HASH_CACHE_MAX_ENTRIES = 4096
+OVERWRITE_BLOCK_SIZE = 1024 * 1024
+DIR_CACHE_MAX_ENTRIES = 16
+COPY_CHUNK_SIZE = 1 << 30
+LOCK_POLL_INITIAL_SECONDS = 0.001
+LOCK_POLL_MAX_SECONDS = 0.05
+HASH_WINDOW_SIZE = 16 * 1024 * 1024
+
+# Files matching either of these are overwritten before being unlinked
+_SENSITIVE_SUFFIXES = frozenset({".key", ".pem", ".p12", ".json", ".yml", ".yaml"})
+_SENSITIVE_NAME_RE = re.compile(r"secret|key", re.IGNORECASE)
+
 
 class SecureFileError(Exception):
     """Raised when secure file operations fail."""
@@ -40,6 +99,9 @@ class AtomicFileWriter:
         mode: str = "w",
         encoding: str = "utf-8",
         backup: bool = True,
+        batch: Optional["BatchWriter"] = None,
+        dir_cache: Optional["DirectoryHandleCache"] = None,
+        mode_bits: int = 0o644,
     ):
         """
         Initialize atomic file writer.
@@ -49,30 +111,47 @@ class AtomicFileWriter:
             mode: File open mode ('w', 'wb', etc.)
             encoding: Text encoding (for text mode)
             backup: Whether to create backup of existing file
+            batch: Optional batch that defers fsync and commit until the
+                batch itself is committed
+            dir_cache: Optional cache of open directory handles used to fsync
+                the target directory after the rename
+            mode_bits: Permissions applied to the file before it is committed
         """
         self.target_path = Path(target_path)
         self.mode = mode
         self.encoding = encoding if "b" not in mode else None
         self.backup = backup
+        self.batch = batch
+        self.dir_cache = dir_cache
+        self.mode_bits = mode_bits
 
         self.temp_path: Optional[Path] = None
         self.backup_path: Optional[Path] = None
         self.file_handle: Optional[Union[TextIO, BinaryIO]] = None
 
-        self.logger = logging.getLogger(__name__)
-
     def __enter__(self):
         """Enter context manager."""
         # Create temporary file in same directory as target
         temp_dir = self.target_path.parent
         temp_prefix = f".{self.target_path.name}.tmp."
 
-        # Create temporary file
-        fd, temp_path = tempfile.mkstemp(
-            prefix=temp_prefix, dir=temp_dir, text="b" not in self.mode
-        )
+        # Create temporary file. A per-process counter gives a unique name
+        # without mkstemp's random-name generation; mkstemp remains the
+        # fallback if a stale file from a recycled PID is in the way.
+        temp_path = temp_dir / f"{temp_prefix}{os.getpid()}.{next(_temp_counter)}"
+        try:
+            fd = os.open(
+                temp_path,
+                os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC,
+                0o600,
+            )
+        except FileExistsError:
+            fd, fallback_path = tempfile.mkstemp(
+                prefix=temp_prefix, dir=temp_dir, text="b" not in self.mode
+            )
+            temp_path = Path(fallback_path)
 
-        self.temp_path = Path(temp_path)
+        self.temp_path = temp_path
 
         # Open the temporary file with desired mode
         if "b" in self.mode:
@@ -92,59 +171,306 @@ class AtomicFileWriter:
         """Exit context manager."""
         try:
             if self.file_handle:
-                # Ensure data is written to disk
+                # Set final permissions through the open descriptor
+                os.fchmod(self.file_handle.fileno(), self.mode_bits)
+
+                # Ensure data is written to disk (batches fsync on commit)
                 self.file_handle.flush()
-                os.fsync(self.file_handle.fileno())
+                if self.batch is None:
+                    os.fsync(self.file_handle.fileno())
                 self.file_handle.close()
 
-            if exc_type is None:  # No exception occurred
-                self._commit()
-            else:
+            if exc_type is not None:
                 self._rollback()
+            elif self.batch is not None:
+                self.batch.add(self)
+            else:
+                self._commit()
+                # Persist the rename itself, not just the file contents
+                if self.dir_cache is not None:
+                    self.dir_cache.fsync(self.target_path.parent)
+                else:
+                    _fsync_directory(self.target_path.parent)
 
         except Exception as e:
-            self.logger.error(f"Error during atomic file operation cleanup: {e}")
+            logger.error("Error during atomic file operation cleanup: %s", e)
             self._rollback()
             raise SecureFileError(f"Atomic file operation failed: {e}")
 
     def _commit(self):
         """Commit the temporary file to target location."""
-        if not self.temp_path or not self.temp_path.exists():
+        if not self.temp_path:
             raise SecureFileError("Temporary file missing during commit")
 
         # Create backup if requested and target exists
-        if self.backup and self.target_path.exists():
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"{self.target_path.name}.backup.{timestamp}"
-            self.backup_path = self.target_path.parent / backup_name
+        if self.backup:
+            # Nanosecond suffix: writes within the same second keep distinct
+            # backups, and it avoids formatting a datetime on every commit
+            backup_name = f"{self.target_path.name}.backup.{time.time_ns():020d}"
+            backup_path: Optional[Path] = self.target_path.parent / backup_name
 
             try:
-                shutil.copy2(self.target_path, self.backup_path)
-                self.logger.debug(f"Created backup: {self.backup_path}")
+                # The rename below swaps in a new inode, so a hardlink keeps the
+                # old contents intact without copying them
+                try:
+                    os.link(self.target_path, backup_path)
+                except FileNotFoundError:
+                    backup_path = None
+                except OSError:
+                    # Cross-device, unsupported filesystem or name collision
+                    shutil.copy2(self.target_path, backup_path)
+                if backup_path is not None:
+                    self.backup_path = backup_path
+                    logger.debug("Created backup: %s", backup_path)
             except Exception as e:
-                self.logger.warning(f"Failed to create backup: {e}")
-
-        # Set appropriate permissions before moving
-        self.temp_path.chmod(0o644)
+                logger.warning("Failed to create backup: %s", e)
 
         # Atomic move
         try:
             self.temp_path.replace(self.target_path)
-            self.logger.debug(f"Atomically wrote file: {self.target_path}")
+            logger.debug("Atomically wrote file: %s", self.target_path)
+        except FileNotFoundError:
+            raise SecureFileError("Temporary file missing during commit")
         except Exception as e:
             self._rollback()
             raise SecureFileError(f"Failed to commit file {self.target_path}: {e}")
 
     def _rollback(self):
         """Clean up temporary file on failure."""
-        if self.temp_path and self.temp_path.exists():
+        if self.temp_path:
             try:
                 self.temp_path.unlink()
-                self.logger.debug(f"Cleaned up temporary file: {self.temp_path}")
+                logger.debug("Cleaned up temporary file: %s", self.temp_path)
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                self.logger.error(
-                    f"Failed to clean up temporary file {self.temp_path}: {e}"
+                logger.error(
+                    "Failed to clean up temporary file %s: %s", self.temp_path, e
+                )
+
+
+class BatchWriter:
+    """
+    Group commit for several atomic writes.
+
+    Writers attached to a batch only flush their temporary files. On commit
+    the batch fsyncs every temporary file, performs all renames and then
+    fsyncs each affected directory once instead of once per file.
+    """
+
+    def __init__(self, dir_cache: Optional["DirectoryHandleCache"] = None) -> None:
+        """Initialize an empty batch."""
+        self.writers: List[AtomicFileWriter] = []
+        self.dir_cache = dir_cache
+
+    def add(self, writer: AtomicFileWriter) -> None:
+        """Queue a finished writer for commit."""
+        self.writers.append(writer)
+
+    def has_pending(self, target_path: Path) -> bool:
+        """Check whether a write to target_path is queued in this batch."""
+        return any(writer.target_path == target_path for writer in self.writers)
+
+    def commit(self) -> None:
+        """Durably commit every queued write."""
+        try:
+            for writer in self.writers:
+                fd = os.open(str(writer.temp_path), os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+            directories = []
+            for writer in self.writers:
+                writer._commit()
+                if writer.target_path.parent not in directories:
+                    directories.append(writer.target_path.parent)
+
+            for directory in directories:
+                if self.dir_cache is not None:
+                    self.dir_cache.fsync(directory)
+                else:
+                    _fsync_directory(directory)
+
+        except Exception as e:
+            self.rollback()
+            raise SecureFileError(f"Batch commit failed: {e}")
+
+        logger.debug("Committed batch of %s writes", len(self.writers))
+        self.writers = []
+
+    def rollback(self) -> None:
+        """Discard every queued write that has not been committed yet."""
+        for writer in self.writers:
+            writer._rollback()
+        self.writers = []
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry update (e.g. a rename) to disk."""
+    fd = os.open(str(directory), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _hash_mapped_windows(hash_obj: Any, fd: int, size: int) -> None:
+    """
+    Feed a large file to a hash object through a sliding mmap window.
+
+    The next window is prefetched while the current one is hashed, and
+    windows already consumed are released so the resident set stays bounded.
+    """
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            for offset in range(0, size, HASH_WINDOW_SIZE):
+                mm.madvise(
+                    mmap.MADV_WILLNEED,
+                    offset,
+                    min(HASH_WINDOW_SIZE * 2, size - offset),
                 )
+                hash_obj.update(view[offset : offset + HASH_WINDOW_SIZE])
+                if offset >= HASH_WINDOW_SIZE:
+                    mm.madvise(
+                        mmap.MADV_DONTNEED, offset - HASH_WINDOW_SIZE, HASH_WINDOW_SIZE
+                    )
+
+
+def _fingerprint_mapped(data: Any, size: int) -> str:
+    """
+    Checksum a mapped file without a Python read loop.
+
+    zlib takes the whole mapping in one call; google-crc32c only accepts
+    bytes, so it is fed window-sized slices of the mapping instead.
+    """
+    if CRC32C_AVAILABLE:
+        crc = 0
+        for offset in range(0, size, FINGERPRINT_CHUNK_SIZE):
+            crc = google_crc32c.extend(
+                crc, data[offset : offset + FINGERPRINT_CHUNK_SIZE]
+            )
+        return f"crc32c:{crc:08x}"
+
+    with memoryview(data) as view:
+        return f"crc32:{zlib.crc32(view):08x}"
+
+
+def _access_from_stat(file_stat: os.stat_result) -> Tuple[bool, bool, bool]:
+    """
+    Derive (readable, writable, executable) for the real user from a stat.
+
+    Mirrors os.access() using permission bits only, saving one syscall per
+    check; ACLs and read-only mounts are not taken into account.
+    """
+    mode = file_stat.st_mode
+    uid = os.getuid()
+
+    if uid == 0:
+        any_exec = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+        return True, True, bool(mode & any_exec)
+
+    if file_stat.st_uid == uid:
+        bits = (mode >> 6) & 0o7
+    elif file_stat.st_gid == os.getgid() or file_stat.st_gid in os.getgroups():
+        bits = (mode >> 3) & 0o7
+    else:
+        bits = mode & 0o7
+
+    return bool(bits & 0o4), bool(bits & 0o2), bool(bits & 0o1)
+
+
+def _copy_file_contents(source: Path, dest: Path) -> None:
+    """
+    Copy file bytes without routing them through Python buffers.
+
+    Tries copy_file_range (an O(1) reflink on CoW filesystems), then
+    sendfile, and finally falls back to copyfileobj with a large buffer.
+    """
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        src_fd = src.fileno()
+        dst_fd = dst.fileno()
+        remaining = os.fstat(src_fd).st_size
+
+        if hasattr(os, "copy_file_range"):
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        src_fd, dst_fd, min(remaining, COPY_CHUNK_SIZE)
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return
+            except OSError:
+                pass  # Unsupported here; fall through to the next strategy
+
+        # Restart from the beginning for the fallbacks
+        src.seek(0)
+        dst.seek(0)
+        dst.truncate()
+
+        try:
+            offset = 0
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK_SIZE)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError:
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+
+        shutil.copyfileobj(src, dst, OVERWRITE_BLOCK_SIZE)
+
+
+class DirectoryHandleCache:
+    """
+    Small LRU of open directory file descriptors.
+
+    Repeated writes into the same directory reuse one O_DIRECTORY handle for
+    the post-rename fsync instead of opening the directory every time.
+    """
+
+    def __init__(self, max_entries: int = DIR_CACHE_MAX_ENTRIES) -> None:
+        """Initialize the cache with a maximum number of open handles."""
+        self.max_entries = max_entries
+        self._fds: "OrderedDict[Path, Tuple[int, Tuple[int, int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fsync(self, directory: Path) -> None:
+        """fsync a directory, opening and caching its handle if needed."""
+        dir_stat = os.stat(directory)
+        identity = (dir_stat.st_dev, dir_stat.st_ino)
+
+        with self._lock:
+            cached = self._fds.get(directory)
+            if cached is not None and cached[1] != identity:
+                # Directory was replaced since it was cached; drop stale handle
+                os.close(self._fds.pop(directory)[0])
+                cached = None
+
+            if cached is None:
+                fd = os.open(str(directory), os.O_RDONLY | os.O_DIRECTORY)
+                self._fds[directory] = (fd, identity)
+                if len(self._fds) > self.max_entries:
+                    _, (evicted_fd, _) = self._fds.popitem(last=False)
+                    os.close(evicted_fd)
+            else:
+                fd = cached[0]
+                self._fds.move_to_end(directory)
+
+            os.fsync(fd)
+
+    def close(self) -> None:
+        """Close every cached directory handle."""
+        with self._lock:
+            for fd, _ in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
 
 
 class SecureFileOperations:
@@ -153,7 +479,55 @@ class SecureFileOperations:
     def __init__(self, path_handler: SecurePathHandler):
         """Initialize with a secure path handler."""
         self.path_handler = path_handler
-        self.logger = logging.getLogger(__name__)
+
+        # LRU of file digests keyed by (dev, ino, mtime_ns, ctime_ns, size, algo)
+        self._hash_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._hash_cache_lock = threading.Lock()
+
+        # Active batch for write_file_safely(), see batch()
+        self._batch: Optional[BatchWriter] = None
+
+        # Reused directory handles for post-rename fsyncs, released on close()
+        # or when this instance is garbage collected
+        self._dir_cache = DirectoryHandleCache()
+        self._finalizer = weakref.finalize(self, self._dir_cache.close)
+
+    def close(self) -> None:
+        """Release cached directory handles."""
+        self._finalizer()
+
+    def __enter__(self) -> "SecureFileOperations":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context manager, releasing cached directory handles."""
+        self.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[BatchWriter]:
+        """
+        Group several writes so they share one commit.
+
+        Files written through this instance inside the block only become
+        visible when the block exits without an exception; on error every
+        queued write is discarded.
+
+        Yields:
+            The active BatchWriter
+        """
+        previous = self._batch
+        batch_writer = BatchWriter(dir_cache=self._dir_cache)
+        self._batch = batch_writer
+        try:
+            yield batch_writer
+        except BaseException:
+            batch_writer.rollback()
+            raise
+        else:
+            batch_writer.commit()
+        finally:
+            self._batch = previous
 
     def read_file_safely(
         self, file_path: Union[str, Path], max_size: int = 10 * 1024 * 1024
@@ -171,6 +545,68 @@ class SecureFileOperations:
         Raises:
             SecureFileError: If file operation fails or is unsafe
         """
+        validated_path = self._validate_read_path(file_path, max_size)
+
+        try:
+            with open(validated_path, "rb") as f:
+                # Acquire shared lock for reading
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+                if os.fstat(f.fileno()).st_size == 0:
+                    content = ""
+                else:
+                    # Decode straight from the mapping, skipping a bytes copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content, _ = codecs.utf_8_decode(mm, "strict", True)
+
+            # Match text-mode universal newline handling
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+            logger.debug("Successfully read file: %s", validated_path)
+            return content
+
+        except Exception as e:
+            raise SecureFileError(f"Failed to read file {validated_path}: {e}")
+
+    def read_bytes_safely(
+        self, file_path: Union[str, Path], max_size: int = 10 * 1024 * 1024
+    ) -> bytes:
+        """
+        Safely read a file as raw bytes with size limits.
+
+        Useful when the caller parses the content itself (e.g. JSON), which
+        avoids a UTF-8 decode into an intermediate string.
+
+        Args:
+            file_path: Path to file to read
+            max_size: Maximum file size in bytes
+
+        Returns:
+            File contents as bytes
+
+        Raises:
+            SecureFileError: If file operation fails or is unsafe
+        """
+        validated_path = self._validate_read_path(file_path, max_size)
+
+        try:
+            with open(validated_path, "rb") as f:
+                # Acquire shared lock for reading
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+                if os.fstat(f.fileno()).st_size == 0:
+                    content = b""
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = mm[:]
+
+            logger.debug("Successfully read file: %s", validated_path)
+            return content
+
+        except Exception as e:
+            raise SecureFileError(f"Failed to read file {validated_path}: {e}")
+
+    def _validate_read_path(self, file_path: Union[str, Path], max_size: int) -> Path:
+        """Validate a read target against size limits and permissions."""
         validated_path = self.path_handler.path_validator.validate_file_path(
             file_path, must_exist=True
         )
@@ -189,17 +625,7 @@ class SecureFileOperations:
         if not self.path_handler.check_file_permissions(validated_path, "r"):
             raise SecureFileError(f"Insufficient permissions to read {validated_path}")
 
-        try:
-            with open(validated_path, "r", encoding="utf-8") as f:
-                # Acquire shared lock for reading
-                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                content = f.read()
-
-            self.logger.debug(f"Successfully read file: {validated_path}")
-            return content
-
-        except Exception as e:
-            raise SecureFileError(f"Failed to read file {validated_path}: {e}")
+        return validated_path
 
     def write_file_safely(
         self,
@@ -215,6 +641,31 @@ class SecureFileOperations:
             content: Content to write
             create_backup: Whether to create backup of existing file
         """
+        validated_path = self._prepare_write_path(file_path)
+        self._write_bytes(validated_path, content.encode("utf-8"), create_backup)
+
+    def _write_bytes(
+        self, validated_path: Path, content_bytes: bytes, create_backup: bool
+    ) -> None:
+        """Atomically write already-encoded content to a validated path."""
+        # A queued batch write to this path commits after the file on disk is
+        # compared, so the comparison only holds when nothing is pending
+        pending = self._batch is not None and self._batch.has_pending(validated_path)
+        if not pending and self._has_same_content(validated_path, content_bytes):
+            logger.debug("Content unchanged, skipping write: %s", validated_path)
+            return
+
+        try:
+            with self._atomic_writer(validated_path, "wb", create_backup) as f:
+                f.write(content_bytes)
+
+            self._finish_write(validated_path)
+
+        except Exception as e:
+            raise SecureFileError(f"Failed to write file {validated_path}: {e}")
+
+    def _prepare_write_path(self, file_path: Union[str, Path]) -> Path:
+        """Validate a write target and make sure its directory is writable."""
         validated_path = self.path_handler.path_validator.validate_file_path(file_path)
 
         # Ensure parent directory exists
@@ -226,17 +677,27 @@ class SecureFileOperations:
                 f"No write permission to directory {validated_path.parent}"
             )
 
-        try:
-            with AtomicFileWriter(validated_path, mode="w", backup=create_backup) as f:
-                f.write(content)
+        return validated_path
+
+    def _atomic_writer(
+        self, validated_path: Path, mode: str, create_backup: bool
+    ) -> AtomicFileWriter:
+        """Create an atomic writer bound to the active batch and dir cache."""
+        return AtomicFileWriter(
+            validated_path,
+            mode=mode,
+            backup=create_backup,
+            batch=self._batch,
+            dir_cache=self._dir_cache,
+        )
 
-            # Set secure permissions
-            self.path_handler.set_secure_file_permissions(validated_path, 0o644)
+    def _finish_write(self, validated_path: Path) -> None:
+        """Log the outcome of a committed or queued write."""
+        if self._batch is not None:
+            logger.debug("Queued batched write: %s", validated_path)
+            return
 
-            self.logger.info(f"Successfully wrote file: {validated_path}")
-
-        except Exception as e:
-            raise SecureFileError(f"Failed to write file {validated_path}: {e}")
+        logger.info("Successfully wrote file: %s", validated_path)
 
     def read_json_safely(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -248,7 +709,13 @@ class SecureFileOperations:
         Returns:
             Parsed JSON data
         """
-        content = self.read_file_safely(file_path)
+        content = self.read_bytes_safely(file_path)
+
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN written by json.dump; stdlib decides below
 
         try:
             return json.loads(content)
@@ -271,14 +738,19 @@ class SecureFileOperations:
             create_backup: Whether to create backup
             indent: JSON indentation
         """
+        validated_path = self._prepare_write_path(file_path)
+
+        # Stream the encoder output straight into the temporary file instead
+        # of building the whole document as one string first
         try:
-            content = json.dumps(
-                data, indent=indent, ensure_ascii=False, sort_keys=True
-            )
+            with self._atomic_writer(validated_path, "w", create_backup) as f:
+                json.dump(data, f, indent=indent, ensure_ascii=False, sort_keys=True)
         except (TypeError, ValueError) as e:
             raise SecureFileError(f"Cannot serialize data to JSON: {e}")
+        except Exception as e:
+            raise SecureFileError(f"Failed to write file {validated_path}: {e}")
 
-        self.write_file_safely(file_path, content, create_backup)
+        self._finish_write(validated_path)
 
     def copy_file_safely(
         self, source_path: Union[str, Path], dest_path: Union[str, Path]
@@ -298,12 +770,20 @@ class SecureFileOperations:
         # Ensure destination directory exists
         self.path_handler.ensure_directory_exists(validated_dest.parent)
 
+        if self._files_have_same_content(validated_source, validated_dest):
+            logger.debug(
+                "Destination already matches source, skipping copy: %s",
+                validated_dest,
+            )
+            return
+
         try:
             # Use atomic copy operation
             temp_dest = validated_dest.with_suffix(validated_dest.suffix + ".tmp")
 
-            # Copy with metadata preservation
-            shutil.copy2(validated_source, temp_dest)
+            # Copy in-kernel, then preserve metadata like shutil.copy2
+            _copy_file_contents(validated_source, temp_dest)
+            shutil.copystat(validated_source, temp_dest)
 
             # Set secure permissions
             temp_dest.chmod(0o644)
@@ -311,8 +791,8 @@ class SecureFileOperations:
             # Atomic move to final location
             temp_dest.replace(validated_dest)
 
-            self.logger.info(
-                f"Successfully copied {validated_source} to {validated_dest}"
+            logger.info(
+                "Successfully copied %s to %s", validated_source, validated_dest
             )
 
         except Exception as e:
@@ -328,6 +808,28 @@ class SecureFileOperations:
                 f"Failed to copy {validated_source} to {validated_dest}: {e}"
             )
 
+    def _has_same_content(self, path: Path, content_bytes: bytes) -> bool:
+        """Check whether an existing file already holds exactly these bytes."""
+        # The digest cache key includes ctime, so an edit that restores the
+        # old mtime still misses the cache and the file is re-read
+        try:
+            if path.stat().st_size != len(content_bytes):
+                return False
+            existing_hash = self.calculate_file_hash(path, "sha256")
+        except (OSError, SecureFileError):
+            return False
+
+        return existing_hash == hashlib.sha256(content_bytes).hexdigest()
+
+    def _files_have_same_content(self, source: Path, dest: Path) -> bool:
+        """Check whether two existing files have identical content."""
+        try:
+            if source.stat().st_size != dest.stat().st_size:
+                return False
+            return self.calculate_file_hash(source) == self.calculate_file_hash(dest)
+        except (OSError, SecureFileError):
+            return False
+
     def delete_file_safely(
         self, file_path: Union[str, Path], require_confirmation: bool = True
     ) -> None:
@@ -340,14 +842,16 @@ class SecureFileOperations:
         """
         validated_path = self.path_handler.path_validator.validate_file_path(file_path)
 
-        if not validated_path.exists():
+        try:
+            file_stat = os.lstat(validated_path)
+        except FileNotFoundError:
             if require_confirmation:
                 raise SecureFileError(f"File does not exist: {validated_path}")
             else:
                 return  # Nothing to delete
 
         # Check if it's actually a file
-        if not validated_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise SecureFileError(f"Path is not a file: {validated_path}")
 
         try:
@@ -356,13 +860,16 @@ class SecureFileOperations:
                 self._secure_overwrite(validated_path)
 
             validated_path.unlink()
-            self.logger.info(f"Successfully deleted file: {validated_path}")
+            logger.info("Successfully deleted file: %s", validated_path)
 
         except Exception as e:
             raise SecureFileError(f"Failed to delete file {validated_path}: {e}")
 
     def calculate_file_hash(
-        self, file_path: Union[str, Path], algorithm: str = "sha256"
+        self,
+        file_path: Union[str, Path],
+        algorithm: str = "sha256",
+        use_cache: bool = True,
     ) -> str:
         """
         Calculate cryptographic hash of a file.
@@ -370,6 +877,8 @@ class SecureFileOperations:
         Args:
             file_path: Path to file
             algorithm: Hash algorithm ('sha256', 'sha1', 'md5')
+            use_cache: Reuse the digest of an unchanged file; pass False to
+                always hash the current content
 
         Returns:
             Hexadecimal hash digest
@@ -379,17 +888,93 @@ class SecureFileOperations:
         )
 
         try:
-            hash_obj = hashlib.new(algorithm)
+            fd = os.open(
+                validated_path,
+                os.O_RDONLY | os.O_CLOEXEC | os.O_NOFOLLOW | os.O_NOCTTY,
+            )
+            with os.fdopen(fd, "rb", buffering=0) as f:
+                # Unchanged files reuse their digest. ctime is part of the key
+                # because utime() can restore an old mtime but not the ctime
+                file_stat = os.fstat(fd)
+                cache_key = (
+                    file_stat.st_dev,
+                    file_stat.st_ino,
+                    file_stat.st_mtime_ns,
+                    file_stat.st_ctime_ns,
+                    file_stat.st_size,
+                    algorithm,
+                )
+                if use_cache:
+                    with self._hash_cache_lock:
+                        cached = self._hash_cache.get(cache_key)
+                        if cached is not None:
+                            self._hash_cache.move_to_end(cache_key)
+                            return cached
+
+                # The file is read once front to back: read ahead aggressively
+                # and drop its pages afterwards instead of evicting others
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+                # Let OpenSSL consume the file in C without re-entering Python
+                if file_stat.st_size >= HASH_WINDOW_SIZE * 2 and hasattr(
+                    mmap, "MADV_WILLNEED"
+                ):
+                    hash_obj = hashlib.new(algorithm)
+                    _hash_mapped_windows(hash_obj, fd, file_stat.st_size)
+                    digest = hash_obj.hexdigest()
+                elif hasattr(hashlib, "file_digest"):
+                    digest = hashlib.file_digest(f, algorithm).hexdigest()
+                else:
+                    hash_obj = hashlib.new(algorithm)
+                    if file_stat.st_size > 0:
+                        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                            hash_obj.update(mm)
+                    digest = hash_obj.hexdigest()
+
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+            with self._hash_cache_lock:
+                self._hash_cache[cache_key] = digest
+                if len(self._hash_cache) > HASH_CACHE_MAX_ENTRIES:
+                    self._hash_cache.popitem(last=False)
+
+            return digest
 
-            with open(validated_path, "rb") as f:
-                # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hash_obj.update(chunk)
+        except Exception as e:
+            raise SecureFileError(f"Failed to calculate hash for {validated_path}: {e}")
+
+    def calculate_file_fingerprint(self, file_path: Union[str, Path]) -> str:
+        """
+        Calculate a fast, non-cryptographic fingerprint of a file.
+
+        Intended for change detection and deduplication only; use
+        calculate_file_hash() whenever tampering resistance matters.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Fingerprint in the form "<algorithm>:<hex digest>"
+        """
+        validated_path = self.path_handler.path_validator.validate_file_path(
+            file_path, must_exist=True
+        )
 
-            return hash_obj.hexdigest()
+        try:
+            with open(validated_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return _fingerprint_mapped(b"", 0)  # mmap rejects empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return _fingerprint_mapped(mm, size)
 
         except Exception as e:
-            raise SecureFileError(f"Failed to calculate hash for {validated_path}: {e}")
+            raise SecureFileError(
+                f"Failed to calculate fingerprint for {validated_path}: {e}"
+            )
 
     def verify_file_integrity(
         self,
@@ -408,7 +993,8 @@ class SecureFileOperations:
         Returns:
             True if file integrity is verified
         """
-        actual_hash = self.calculate_file_hash(file_path, algorithm)
+        # Tamper detection must never trust a cached digest
+        actual_hash = self.calculate_file_hash(file_path, algorithm, use_cache=False)
         return actual_hash.lower() == expected_hash.lower()
 
     @contextmanager
@@ -441,28 +1027,36 @@ class SecureFileOperations:
                         self._secure_overwrite(temp_path)
                     temp_path.unlink()
                 except Exception as e:
-                    self.logger.error(
-                        f"Failed to clean up temporary file {temp_path}: {e}"
+                    logger.error(
+                        "Failed to clean up temporary file %s: %s", temp_path, e
                     )
 
-    def get_file_info(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+    def get_file_info(
+        self, file_path: Union[str, Path], purpose: str = "security"
+    ) -> Dict[str, Any]:
         """
         Get comprehensive file information.
 
         Args:
             file_path: Path to file
+            purpose: "security" includes only a SHA-256 digest; "integrity"
+                includes only the fast fingerprint for change detection
 
         Returns:
             Dictionary with file information
         """
+        if purpose not in ("security", "integrity"):
+            raise ValueError(f"Unknown file info purpose: {purpose}")
+
         validated_path = self.path_handler.path_validator.validate_file_path(
             file_path, must_exist=True
         )
 
         try:
             file_stat = validated_path.stat()
+            is_readable, is_writable, is_executable = _access_from_stat(file_stat)
 
-            return {
+            info = {
                 "path": str(validated_path),
                 "size": file_stat.st_size,
                 "mode": oct(file_stat.st_mode),
@@ -471,50 +1065,81 @@ class SecureFileOperations:
                 "modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
                 "accessed": datetime.fromtimestamp(file_stat.st_atime).isoformat(),
                 "created": datetime.fromtimestamp(file_stat.st_ctime).isoformat(),
-                "is_readable": os.access(validated_path, os.R_OK),
-                "is_writable": os.access(validated_path, os.W_OK),
-                "is_executable": os.access(validated_path, os.X_OK),
-                "hash_sha256": self.calculate_file_hash(validated_path, "sha256"),
+                "is_readable": is_readable,
+                "is_writable": is_writable,
+                "is_executable": is_executable,
+                "fingerprint": None,
+                "hash_sha256": None,
             }
 
+            # Read the content once, with the one digest the purpose needs
+            if purpose == "security":
+                info["hash_sha256"] = self.calculate_file_hash(validated_path, "sha256")
+            else:
+                info["fingerprint"] = self.calculate_file_fingerprint(validated_path)
+
+            return info
+
         except Exception as e:
             raise SecureFileError(f"Failed to get file info for {validated_path}: {e}")
 
+    def get_file_infos(
+        self,
+        file_paths: Iterable[Union[str, Path]],
+        purpose: str = "security",
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get file information for many files concurrently.
+
+        Hashing releases the GIL inside OpenSSL, so per-file work runs in a
+        thread pool and scales with the number of cores.
+
+        Args:
+            file_paths: Paths to inspect
+            purpose: Passed through to get_file_info()
+            max_workers: Thread pool size (defaults to the CPU count)
+
+        Returns:
+            File information dictionaries in the same order as file_paths
+        """
+        paths = list(file_paths)
+        if not paths:
+            return []
+
+        workers = max_workers or min(len(paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda path: self.get_file_info(path, purpose), paths)
+            )
+
     def _should_secure_delete(self, file_path: Path) -> bool:
         """Check if a file should be securely deleted (overwritten)."""
         # Secure delete for sensitive file types or if explicitly requested
-        sensitive_extensions = {
-            ".key",
-            ".pem",
-            ".p12",
-            ".json",
-            ".yml",
-            ".yaml",
-        }
-
-        return (
-            file_path.suffix.lower() in sensitive_extensions
-            or "secret" in file_path.name.lower()
-            or "key" in file_path.name.lower()
+        return file_path.suffix.lower() in _SENSITIVE_SUFFIXES or bool(
+            _SENSITIVE_NAME_RE.search(file_path.name)
         )
 
-    def _secure_overwrite(self, file_path: Path, passes: int = 3) -> None:
+    def _secure_overwrite(self, file_path: Path, passes: int = 1) -> None:
         """Securely overwrite a file before deletion."""
         try:
-            file_size = file_path.stat().st_size
+            with open(file_path, "r+b", buffering=0) as f:
+                file_size = os.fstat(f.fileno()).st_size
 
-            with open(file_path, "r+b") as f:
                 for _ in range(passes):
                     f.seek(0)
-                    # Overwrite with random data
-                    f.write(os.urandom(file_size))
-                    f.flush()
+                    # Overwrite with random data in bounded blocks
+                    remaining = file_size
+                    while remaining > 0:
+                        block = min(remaining, OVERWRITE_BLOCK_SIZE)
+                        f.write(os.urandom(block))
+                        remaining -= block
                     os.fsync(f.fileno())
 
-            self.logger.debug(f"Securely overwritten file: {file_path}")
+            logger.debug("Securely overwritten file: %s", file_path)
 
         except Exception as e:
-            self.logger.warning(f"Failed to securely overwrite {file_path}: {e}")
+            logger.warning("Failed to securely overwrite %s: %s", file_path, e)
 
 
 @contextmanager
@@ -540,23 +1165,21 @@ def secure_file_lock(
     try:
         file_handle = open(file_path, mode)
 
-        # Try to acquire lock with timeout
-        import signal
-
-        def timeout_handler(signum, frame):
-            raise TimeoutError("Lock acquisition timeout")
-
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(int(timeout))
-
-        try:
-            fcntl.flock(file_handle.fileno(), lock_type)
-            signal.alarm(0)  # Cancel alarm
-        except Exception:
-            signal.alarm(0)  # Cancel alarm
-            raise SecureFileError(f"Failed to acquire lock on {file_path}")
-        finally:
-            signal.signal(signal.SIGALRM, old_handler)
+        # Poll a non-blocking lock with exponential backoff; unlike SIGALRM
+        # this is thread-safe and leaves process-wide signal state untouched
+        deadline = time.monotonic() + timeout
+        backoff = LOCK_POLL_INITIAL_SECONDS
+        while True:
+            try:
+                fcntl.flock(file_handle.fileno(), lock_type | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise SecureFileError(f"Failed to acquire lock on {file_path}")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, LOCK_POLL_MAX_SECONDS)
+            except OSError:
+                raise SecureFileError(f"Failed to acquire lock on {file_path}")
 
         yield file_handle
 
@@ -566,4 +1189,4 @@ def secure_file_lock(
                 fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
                 file_handle.close()
             except Exception as e:
-                logging.getLogger(__name__).error(f"Error releasing file lock: {e}")
+                logger.error("Error releasing file lock: %s", e)
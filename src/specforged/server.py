@@ -2,12 +2,36 @@
 Main SpecForge MCP Server implementation.
 """
 
+import asyncio
+import json
+import logging
+import os
+import stat
 from datetime import datetime
+from logging.handlers import MemoryHandler
 from pathlib import Path
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+# uvloop provides a faster event loop; the default asyncio loop is the fallback
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None  # type: ignore
+
+# orjson parses the polled sync state faster; stdlib json is the fallback
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
 from .core import ModeClassifier, ProjectDetector, QueueProcessor, SpecificationManager
 from .prompts import setup_prompts
 from .resources import setup_resources
@@ -27,6 +51,50 @@ from .tools import (
     setup_workflow_tools,
 )
 
+logger = logging.getLogger(__name__)
+
+# Minimum time between queue processing passes triggered by status polls
+STATUS_PROCESS_INTERVAL_SECONDS = 5.0
+
+# Skeleton of a successful get_server_status response. Copying it presizes the
+# dict with every key in order; handlers only fill in the per-call values.
+_STATUS_RESPONSE_TEMPLATE = {
+    "server_status": "online",
+    "timestamp": None,
+    "mcp_server_online": True,
+    "project_root": None,
+    "specifications": None,
+    "operation_queue": None,
+    "sync_state": None,
+    "security": None,
+    "health": None,
+}
+
+# Ranking used to fold individual health checks into an overall status
+_HEALTH_SEVERITY = {"healthy": 0, "degraded": 1, "unhealthy": 2}
+
+
+def _is_directory(path: Path) -> bool:
+    """Check existence and type with a single stat() call"""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _read_sync_state(path: Path) -> Optional[dict]:
+    """Read and parse the sync state file, or None if it is missing or empty"""
+    try:
+        with path.open("rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    if not content.strip():
+        return None
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 def create_server(
     name: Optional[str] = None,
@@ -63,7 +131,10 @@ def create_server(
             p = Path(config.project_root).expanduser()
             if p.is_absolute() and p.exists():
                 wd_candidate = p
-        project_detector = ProjectDetector(working_dir=wd_candidate)
+        # A configured absolute root is taken as-is, skipping the marker walk
+        project_detector = ProjectDetector(
+            working_dir=wd_candidate, trusted=wd_candidate is not None
+        )
 
         # Base dir from configuration
         if Path(config.base_dir).is_absolute():
@@ -73,16 +144,16 @@ def create_server(
 
     # Log project detection info for debugging
     project_info = project_detector.get_project_info()
-    print(f"SpecForge: Detected project root: {project_info['project_root']}")
-    print(f"SpecForge: Project markers found: {project_info['markers_found']}")
-    print(f"SpecForge: Using specifications directory: {specs_base}")
+    logger.info("Detected project root: %s", project_info["project_root"])
+    logger.info("Project markers found: %s", project_info["markers_found"])
+    logger.info("Using specifications directory: %s", specs_base)
 
     spec_manager = SpecificationManager(specs_base)
 
     # Initialize security components using configuration
     if config.security_audit_enabled:
+        # SecurityAuditLogger creates the log directory (and any parents)
         audit_log_path = specs_base / "security" / "audit.log"
-        audit_log_path.parent.mkdir(exist_ok=True)
         security_audit_logger = SecurityAuditLogger(audit_log_path)
     else:
         security_audit_logger = None
@@ -120,7 +191,9 @@ def create_server(
     mcp.input_validator = input_validator  # type: ignore
 
     # Add server status and health check tools
-    setup_server_tools(mcp, queue_processor, spec_manager)
+    setup_server_tools(
+        mcp, queue_processor, spec_manager, security_audit_logger, rate_limiter
+    )
 
     return mcp
 
@@ -129,6 +202,8 @@ def setup_server_tools(
     mcp: FastMCP,
     queue_processor: QueueProcessor,
     spec_manager: SpecificationManager,
+    security_audit_logger: Optional[SecurityAuditLogger] = None,
+    rate_limiter: Optional[ClientRateLimiter] = None,
 ) -> None:
     """Setup server status and health check tools"""
 
@@ -140,35 +215,23 @@ def setup_server_tools(
         Returns detailed information about server status, queue processing,
         and specification management health.
         """
+        timestamp = datetime.now().isoformat()
         try:
-            # Process queue and update status
-            await queue_processor.process_operation_queue()
-
-            # Load current sync state
-            sync_state = None
-            if queue_processor.sync_file.exists():
-                import json
-
-                import aiofiles
+            # Process the queue at most once per interval; frequent status
+            # polls should report state, not keep draining the queue
+            await queue_processor.process_operation_queue_if_due(
+                STATUS_PROCESS_INTERVAL_SECONDS
+            )
 
-                async with aiofiles.open(
-                    queue_processor.sync_file, "r", encoding="utf-8"
-                ) as f:
-                    content = await f.read()
-                if content.strip():
-                    sync_data = json.loads(content)
-                    sync_state = sync_data
+            # Load current sync state in a single worker-thread hop
+            sync_state = await asyncio.to_thread(
+                _read_sync_state, queue_processor.sync_file
+            )
 
             # Load operation queue status
-            queue = await queue_processor.load_operation_queue()
-            pending_ops = len([op for op in queue.operations if op.status == "pending"])
-            in_progress_ops = len(
-                [op for op in queue.operations if op.status == "in_progress"]
-            )
-            failed_ops = len([op for op in queue.operations if op.status == "failed"])
-            completed_ops = len(
-                [op for op in queue.operations if op.status == "completed"]
-            )
+            queue_status = await queue_processor.get_status_snapshot()
+            pending_ops = queue_status["pending"]
+            failed_ops = queue_status["failed"]
 
             # Get specification stats
             spec_count = len(spec_manager.specs)
@@ -177,8 +240,8 @@ def setup_server_tools(
             # Get security statistics if available
             security_stats = {}
             try:
-                if hasattr(mcp, "security_audit_logger") and mcp.security_audit_logger:
-                    audit_stats = mcp.security_audit_logger.get_security_stats()
+                if security_audit_logger:
+                    audit_stats = security_audit_logger.get_security_stats()
                     security_stats["audit_events"] = audit_stats.get("total_events", 0)
                     security_stats["security_alerts"] = audit_stats.get(
                         "alerts_sent", 0
@@ -186,8 +249,8 @@ def setup_server_tools(
                 else:
                     security_stats["audit_events"] = "disabled"
 
-                if hasattr(mcp, "rate_limiter") and mcp.rate_limiter:
-                    rate_stats = mcp.rate_limiter.get_system_status()
+                if rate_limiter:
+                    rate_stats = rate_limiter.get_system_status()
                     security_stats["rate_limiting"] = {
                         "active_clients": rate_stats.get("active_clients", 0),
                         "global_stats": rate_stats.get("global_stats", {}),
@@ -198,39 +261,37 @@ def setup_server_tools(
             except Exception as e:
                 security_stats = {"error": f"Failed to get security stats: {e}"}
 
-            return {
-                "server_status": "online",
-                "timestamp": datetime.now().isoformat(),
-                "mcp_server_online": True,
-                "project_root": str(queue_processor.project_root),
-                "specifications": {
-                    "total_count": spec_count,
-                    "current_spec": current_spec,
-                    "base_directory": str(spec_manager.base_dir),
-                },
-                "operation_queue": {
-                    "total_operations": len(queue.operations),
-                    "pending": pending_ops,
-                    "in_progress": in_progress_ops,
-                    "failed": failed_ops,
-                    "completed": completed_ops,
-                    "last_processed": (
-                        queue.last_processed.isoformat()
-                        if queue.last_processed
-                        else None
-                    ),
-                },
-                "sync_state": sync_state,
-                "security": security_stats,
-                "health": (
-                    "healthy" if pending_ops == 0 and failed_ops == 0 else "degraded"
+            response = _STATUS_RESPONSE_TEMPLATE.copy()
+            response["timestamp"] = timestamp
+            response["project_root"] = str(queue_processor.project_root)
+            response["specifications"] = {
+                "total_count": spec_count,
+                "current_spec": current_spec,
+                "base_directory": str(spec_manager.base_dir),
+            }
+            response["operation_queue"] = {
+                "total_operations": queue_status["total"],
+                "pending": pending_ops,
+                "in_progress": queue_status["in_progress"],
+                "failed": failed_ops,
+                "completed": queue_status["completed"],
+                "last_processed": (
+                    queue_status["last_processed"].isoformat()
+                    if queue_status["last_processed"]
+                    else None
                 ),
             }
+            response["sync_state"] = sync_state
+            response["security"] = security_stats
+            response["health"] = (
+                "healthy" if pending_ops == 0 and failed_ops == 0 else "degraded"
+            )
+            return response
 
         except Exception as e:
             return {
                 "server_status": "error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "error": str(e),
                 "health": "unhealthy",
             }
@@ -243,69 +304,62 @@ def setup_server_tools(
         Checks queue processor, specification manager, and file system health.
         Returns simple health status suitable for monitoring.
         """
-        health_status = "healthy"
-        checks = {}
+        timestamp = datetime.now().isoformat()
 
-        try:
-            # Check queue processor
-            queue = await queue_processor.load_operation_queue()
-            failed_ops = len([op for op in queue.operations if op.status == "failed"])
-            checks["queue_processor"] = {
+        async def check_queue_processor() -> dict:
+            # Skip even the queue file stat when no failures are known
+            failed_ops = queue_processor.known_failed_count()
+            if failed_ops != 0:
+                failed_ops = (await queue_processor.get_status_snapshot())["failed"]
+            return {
                 "status": "healthy" if failed_ops == 0 else "degraded",
                 "failed_operations": failed_ops,
             }
 
-            if failed_ops > 0:
-                health_status = "degraded"
-
-        except Exception as e:
-            checks["queue_processor"] = {
-                "status": "unhealthy",
-                "error": str(e),
-            }
-            health_status = "unhealthy"
-
-        try:
-            # Check specification manager
+        async def check_specification_manager() -> dict:
             spec_count = len(spec_manager.specs)
-            base_dir_exists = spec_manager.base_dir.exists()
-            checks["specification_manager"] = {
+            base_dir_exists = await asyncio.to_thread(
+                _is_directory, spec_manager.base_dir
+            )
+            return {
                 "status": "healthy" if base_dir_exists else "degraded",
                 "spec_count": spec_count,
                 "base_directory_exists": base_dir_exists,
             }
 
-            if not base_dir_exists:
-                health_status = "degraded"
-
-        except Exception as e:
-            checks["specification_manager"] = {
-                "status": "unhealthy",
-                "error": str(e),
-            }
-            health_status = "unhealthy"
-
-        try:
-            # Check file system access
-            project_root_writable = (
-                queue_processor.project_root.exists()
-                and queue_processor.project_root.is_dir()
+        async def check_filesystem() -> dict:
+            project_root_writable = await asyncio.to_thread(
+                _is_directory, queue_processor.project_root
             )
-            checks["filesystem"] = {
+            return {
                 "status": "healthy" if project_root_writable else "unhealthy",
                 "project_root_accessible": project_root_writable,
             }
 
-            if not project_root_writable:
-                health_status = "unhealthy"
+        # Run the checks concurrently so the stat calls overlap the queue I/O
+        names = ("queue_processor", "specification_manager", "filesystem")
+        results = await asyncio.gather(
+            check_queue_processor(),
+            check_specification_manager(),
+            check_filesystem(),
+            return_exceptions=True,
+        )
 
-        except Exception as e:
-            checks["filesystem"] = {"status": "unhealthy", "error": str(e)}
-            health_status = "unhealthy"
+        checks = {}
+        for check_name, result in zip(names, results):
+            if isinstance(result, Exception):
+                result = {"status": "unhealthy", "error": str(result)}
+            checks[check_name] = result
+
+        # Overall health is the worst status reported by any check
+        health_status = max(
+            (check["status"] for check in checks.values()),
+            key=_HEALTH_SEVERITY.__getitem__,
+        )
 
         return {
             "health": health_status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "checks": checks,
         }
 
@@ -317,6 +371,7 @@ def setup_server_tools(
         Manually trigger heartbeat update and process any pending operations.
         Useful for ensuring server availability is correctly reported.
         """
+        timestamp = datetime.now().isoformat()
         try:
             await queue_processor.update_heartbeat()
             await queue_processor.process_operation_queue()
@@ -324,52 +379,80 @@ def setup_server_tools(
             return {
                 "status": "success",
                 "message": "Heartbeat updated and operations processed",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
 
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"Failed to update heartbeat: {e}",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
             }
 
 
+def install_event_loop_policy() -> None:
+    """
+    Make uvloop the event loop for loops created from now on, if installed.
+
+    Call this before asyncio.run(); it has no effect on a loop that is
+    already running.
+    """
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 async def run_server() -> None:
     """Run the SpecForge MCP server"""
-    print("Starting SpecForge MCP Server...")
-    print("Mode Classification: Enabled")
-    print("Spec Management: Ready")
-    print("Queue Processing: Enabled")
-    print("Workflow Phases: Requirements → Design → Planning → Execution")
+    # Log to stderr since stdout carries the MCP stdio protocol. Startup
+    # messages are buffered and written out together once startup finishes.
+    console_handler = logging.StreamHandler()
+    startup_handler = MemoryHandler(capacity=16, target=console_handler)
+    logger.addHandler(startup_handler)
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+
+    logger.info("Starting SpecForge MCP Server...")
+    logger.info("Mode Classification: Enabled")
+    logger.info("Spec Management: Ready")
+    logger.info("Queue Processing: Enabled")
+    logger.info("Workflow Phases: Requirements → Design → Planning → Execution")
 
-    server = create_server()
-    queue_processor = getattr(server, "queue_processor", None)
+    try:
+        server = create_server()
+        queue_processor = getattr(server, "queue_processor", None)
 
-    if queue_processor:
-        print(f"Queue Processor: Ready (Project: {queue_processor.project_root})")
+        if queue_processor:
+            logger.info(
+                "Queue Processor: Ready (Project: %s)", queue_processor.project_root
+            )
 
-        # Process initial operation queue and update heartbeat
-        try:
-            print("Processing initial operation queue...")
-            await queue_processor.process_operation_queue()
-            print("✓ Initial queue processing complete")
-        except Exception as e:
-            print(f"⚠ Warning: Initial queue processing failed: {e}")
+            # Process initial operation queue and update heartbeat
+            try:
+                logger.info("Processing initial operation queue...")
+                await queue_processor.process_operation_queue()
+                logger.info("Initial queue processing complete")
+            except Exception as e:
+                logger.warning("Initial queue processing failed: %s", e)
+    finally:
+        # Flush the buffered startup messages and log directly from here on
+        logger.removeHandler(startup_handler)
+        startup_handler.close()
+        logger.addHandler(console_handler)
 
     try:
         server.run()
     except KeyboardInterrupt:
         # Graceful shutdown on Ctrl-C
-        print("\nReceived Ctrl-C. Shutting down gracefully...")
+        logger.info("Received Ctrl-C. Shutting down gracefully...")
 
         # Cleanup operations during shutdown
         if queue_processor:
             try:
-                print("Cleaning up operation queue...")
+                logger.info("Cleaning up operation queue...")
                 await queue_processor.update_sync_state()  # Final heartbeat update
-                print("✓ Operation queue cleanup complete")
+                logger.info("Operation queue cleanup complete")
             except Exception as e:
-                print(f"⚠ Warning: Cleanup failed: {e}")
+                logger.warning("Cleanup failed: %s", e)
     finally:
-        print("Server stopped.")
+        logger.info("Server stopped.")
+        logger.removeHandler(console_handler)
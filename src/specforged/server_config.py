@@ -8,15 +8,128 @@ Supports multiple configuration sources with proper precedence:
 4. Default values (lowest priority)
 """
 
+import copy
+import functools
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Candidate configuration file names, in order of preference
+USER_CONFIG_NAMES = ("config.yaml", "config.yml", "specforged.yaml", "specforged.yml")
+PROJECT_CONFIG_NAMES = (
+    ".specforged.yaml",
+    ".specforged.yml",
+    "specforged.yaml",
+    "specforged.yml",
+)
+
+# Common project markers
+PROJECT_MARKERS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",  # VCS
+        "package.json",
+        "pyproject.toml",
+        "Cargo.toml",  # Package managers
+        ".specforged.yaml",
+        ".specforged.yml",  # Our config
+        "requirements.txt",
+        "setup.py",
+        "setup.cfg",  # Python
+    }
+)
 
 
-@dataclass
+@functools.lru_cache(maxsize=32)
+def _detect_project_root_cached(cwd: str) -> Path:
+    """Walk up from cwd to the nearest project marker, memoized per cwd"""
+    # Walk up the directory tree on plain strings, listing each level once
+    parent = cwd
+    while True:
+        try:
+            with os.scandir(parent) as entries:
+                if any(entry.name in PROJECT_MARKERS for entry in entries):
+                    return Path(parent)
+        except OSError:
+            # Unreadable or vanished directory: keep walking up
+            pass
+        grandparent = os.path.dirname(parent)
+        if grandparent == parent:
+            break
+        parent = grandparent
+
+    # Fallback to current directory
+    return Path(cwd)
+
+
+# Environment variable mappings, split by value type: variable -> config key
+_ENV_STR = {
+    "SPECFORGED_NAME": "name",
+    "SPECFORGED_HOST": "host",
+    "SPECFORGED_LOG_LEVEL": "log_level",
+    "SPECFORGE_PROJECT_ROOT": "project_root",
+    "SPECFORGE_BASE_DIR": "base_dir",
+}
+_ENV_INT = {
+    "SPECFORGED_PORT": "port",
+    "SPECFORGED_MAX_REQUESTS": "max_requests_per_minute",
+}
+_ENV_BOOL = {
+    "SPECFORGED_DEBUG": "debug_mode",
+    "SPECFORGED_AUTO_RELOAD": "auto_reload",
+    "SPECFORGED_CORS_ENABLED": "cors_enabled",
+    "SPECFORGED_SECURITY_AUDIT": "security_audit_enabled",
+    "SPECFORGED_RATE_LIMITING": "rate_limiting_enabled",
+}
+_ENV_PREFIXES = ("SPECFORGED_", "SPECFORGE_")
+_TRUE_SET = frozenset({"true", "1", "yes", "on"})
+
+
+def _present_config_names(directory: Path, names: Tuple[str, ...]) -> List[str]:
+    """Return the candidate names found in directory, in order of preference"""
+    try:
+        with os.scandir(directory) as entries:
+            found = {entry.name for entry in entries}
+    except OSError:
+        return []
+    return [name for name in names if name in found]
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config file, memoized on its path, mtime and size"""
+    import yaml
+
+    # The whole document is parsed: a truncated prefix can still be valid YAML
+    # with later keys or the tail of a value silently dropped
+    with open(path, "rb") as f:
+        data = f.read()
+    # Prefer the libyaml C bindings when PyYAML was built with them
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(data, Loader=loader) or {}
+
+
+def _dump_yaml(config: Dict[str, Any], path: Path) -> None:
+    """Write a config dict as block-style YAML with sorted keys"""
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(config, f, Dumper=dumper, default_flow_style=False, sort_keys=True)
+
+
+def _read_yaml_file(path: str) -> Dict[str, Any]:
+    """Return the parsed contents of a YAML config file"""
+    file_stat = os.stat(path)
+    # Callers get their own copy so the cached document is never mutated
+    return copy.deepcopy(
+        _parse_yaml_cached(path, file_stat.st_mtime_ns, file_stat.st_size)
+    )
+
+
+@dataclass(slots=True)
 class ServerConfig:
     """Server configuration options"""
 
@@ -43,7 +156,8 @@ class ServerConfig:
 
     # HTTP server specific
     cors_enabled: bool = True
-    cors_origins: list = field(default_factory=lambda: ["*"])
+    # Immutable default shared by every instance; config files may supply a list
+    cors_origins: Sequence[str] = ("*",)
 
     # Development options
     debug_mode: bool = False
@@ -63,50 +177,19 @@ class ConfigurationLoader:
 
     def _detect_project_root(self) -> Path:
         """Detect project root by looking for common markers"""
-        current = Path.cwd()
-
-        # Common project markers
-        markers = [
-            ".git",
-            ".hg",
-            ".svn",  # VCS
-            "package.json",
-            "pyproject.toml",
-            "Cargo.toml",  # Package managers
-            ".specforged.yaml",
-            ".specforged.yml",  # Our config
-            "requirements.txt",
-            "setup.py",
-            "setup.cfg",  # Python
-        ]
-
-        # Walk up the directory tree
-        for parent in [current] + list(current.parents):
-            for marker in markers:
-                if (parent / marker).exists():
-                    return parent
-
-        # Fallback to current directory
-        return current
+        return _detect_project_root_cached(str(Path.cwd()))
 
     def load_config(self) -> ServerConfig:
         """Load configuration from all sources with proper precedence"""
-        # Start with defaults
-        config_dict = {}
-
-        # 1. Load user-level configuration
-        user_config = self._load_user_config()
-        if user_config:
-            config_dict.update(user_config)
-
-        # 2. Load project-level configuration
-        project_config = self._load_project_config()
-        if project_config:
-            config_dict.update(project_config)
-
-        # 3. Override with environment variables
-        env_config = self._load_env_config()
-        config_dict.update(env_config)
+        # Sources in increasing precedence: user file, project file, environment
+        sources = (
+            self._load_user_config(),
+            self._load_project_config(),
+            self._load_env_config(),
+        )
+        config_dict = {
+            key: value for source in sources if source for key, value in source.items()
+        }
 
         # Create config object
         config = ServerConfig(**config_dict)
@@ -119,107 +202,90 @@ class ConfigurationLoader:
 
     def _load_user_config(self) -> Optional[Dict[str, Any]]:
         """Load user-level configuration from ~/.specforged/config.yaml"""
-        config_file = self.user_config_dir / "config.yaml"
-
-        if not config_file.exists():
-            # Try alternative names
-            for alt_name in [
-                "config.yml",
-                "specforged.yaml",
-                "specforged.yml",
-            ]:
-                alt_file = self.user_config_dir / alt_name
-                if alt_file.exists():
-                    config_file = alt_file
-                    break
-            else:
+        present = _present_config_names(self.user_config_dir, USER_CONFIG_NAMES)
+        if not present:
+            return None
+
+        # Imported only once there is a file to parse
+        import yaml
+
+        user_dir_str = str(self.user_config_dir)
+        for config_name in present:
+            config_file = os.path.join(user_dir_str, config_name)
+            try:
+                return _read_yaml_file(config_file)
+            except FileNotFoundError:
+                # Removed since the directory was listed
+                continue
+            except (yaml.YAMLError, IOError) as e:
+                print(f"Warning: Failed to load user config from {config_file}: {e}")
                 return None
 
-        try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
-        except (yaml.YAMLError, IOError) as e:
-            print(f"Warning: Failed to load user config from {config_file}: {e}")
-            return None
+        return None
 
     def _load_project_config(self) -> Optional[Dict[str, Any]]:
         """Load project-level configuration from .specforged.yaml"""
+        present = _present_config_names(self.project_root, PROJECT_CONFIG_NAMES)
+        if not present:
+            return None
+
+        import yaml
+
         # Try different config file names
-        config_names = [
-            ".specforged.yaml",
-            ".specforged.yml",
-            "specforged.yaml",
-            "specforged.yml",
-        ]
-
-        for config_name in config_names:
-            config_file = self.project_root / config_name
-            if config_file.exists():
-                try:
-                    with open(config_file, "r", encoding="utf-8") as f:
-                        return yaml.safe_load(f) or {}
-                except (yaml.YAMLError, IOError) as e:
-                    print(
-                        f"Warning: Failed to load project config from {config_file}: {e}"
-                    )
-                    continue
+        root_str = str(self.project_root)
+        for config_name in present:
+            config_file = os.path.join(root_str, config_name)
+            try:
+                return _read_yaml_file(config_file)
+            except FileNotFoundError:
+                continue
+            except (yaml.YAMLError, IOError) as e:
+                print(f"Warning: Failed to load project config from {config_file}: {e}")
+                continue
 
         return None
 
     def _load_env_config(self) -> Dict[str, Any]:
         """Load configuration from environment variables"""
+        env = os.environ
+        # Most environments set none of our variables; one scan settles that
+        if not any(name.startswith(_ENV_PREFIXES) for name in env):
+            return {}
+
+        env_get = env.get
         env_config = {}
 
-        # Environment variable mappings
-        env_mappings = {
-            "SPECFORGED_NAME": "name",
-            "SPECFORGED_PORT": ("port", int),
-            "SPECFORGED_HOST": "host",
-            "SPECFORGED_LOG_LEVEL": "log_level",
-            "SPECFORGE_PROJECT_ROOT": "project_root",
-            "SPECFORGE_BASE_DIR": "base_dir",
-            "SPECFORGED_DEBUG": ("debug_mode", bool),
-            "SPECFORGED_AUTO_RELOAD": ("auto_reload", bool),
-            "SPECFORGED_CORS_ENABLED": ("cors_enabled", bool),
-            "SPECFORGED_SECURITY_AUDIT": ("security_audit_enabled", bool),
-            "SPECFORGED_RATE_LIMITING": ("rate_limiting_enabled", bool),
-            "SPECFORGED_MAX_REQUESTS": ("max_requests_per_minute", int),
-        }
+        for env_var, key in _ENV_STR.items():
+            env_value = env_get(env_var)
+            if env_value is not None:
+                env_config[key] = env_value
+
+        for env_var, key in _ENV_INT.items():
+            env_value = env_get(env_var)
+            if env_value is not None:
+                try:
+                    env_config[key] = int(env_value)
+                except ValueError as e:
+                    print(f"Warning: Invalid value for {env_var}: {env_value} ({e})")
 
-        for env_var, config_key in env_mappings.items():
-            env_value = os.environ.get(env_var)
+        for env_var, key in _ENV_BOOL.items():
+            env_value = env_get(env_var)
             if env_value is not None:
-                if isinstance(config_key, tuple):
-                    key, converter = config_key
-                    try:
-                        if converter == bool:
-                            env_config[key] = env_value.lower() in (
-                                "true",
-                                "1",
-                                "yes",
-                                "on",
-                            )
-                        else:
-                            env_config[key] = converter(env_value)
-                    except (ValueError, TypeError) as e:
-                        print(
-                            f"Warning: Invalid value for {env_var}: {env_value} ({e})"
-                        )
-                else:
-                    env_config[config_key] = env_value
+                env_config[key] = env_value.lower() in _TRUE_SET
 
         return env_config
 
     def save_user_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to user config file"""
+        import yaml
+
         try:
             # Ensure config directory exists
             self.user_config_dir.mkdir(parents=True, exist_ok=True)
 
             config_file = self.user_config_dir / "config.yaml"
 
-            with open(config_file, "w", encoding="utf-8") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=True)
+            _dump_yaml(config, config_file)
 
             return True
 
@@ -229,11 +295,12 @@ class ConfigurationLoader:
 
     def save_project_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to project config file"""
+        import yaml
+
         try:
             config_file = self.project_root / ".specforged.yaml"
 
-            with open(config_file, "w", encoding="utf-8") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=True)
+            _dump_yaml(config, config_file)
 
             return True
 
@@ -274,6 +341,20 @@ class ConfigurationLoader:
         return self.save_user_config(clean_config)
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_loader(
+    project_root: Optional[Path], cwd: Optional[str], home: Path
+) -> ConfigurationLoader:
+    """Build one loader per project root, working directory and home directory"""
+    return ConfigurationLoader(project_root)
+
+
+def _get_loader(project_root: Optional[Path] = None) -> ConfigurationLoader:
+    """Return a shared loader; auto-detection depends on cwd, user config on HOME"""
+    cwd = None if project_root else os.getcwd()
+    return _cached_loader(project_root, cwd, Path.home())
+
+
 def load_configuration(project_root: Optional[Path] = None) -> ServerConfig:
     """
     Load SpecForged configuration from all sources.
@@ -284,8 +365,7 @@ def load_configuration(project_root: Optional[Path] = None) -> ServerConfig:
     Returns:
         ServerConfig: Complete configuration object
     """
-    loader = ConfigurationLoader(project_root)
-    return loader.load_config()
+    return _get_loader(project_root).load_config()
 
 
 def get_config_paths(project_root: Optional[Path] = None) -> Dict[str, Path]:
@@ -295,7 +375,7 @@ def get_config_paths(project_root: Optional[Path] = None) -> Dict[str, Path]:
     Returns:
         Dict mapping config type to file path
     """
-    loader = ConfigurationLoader(project_root)
+    loader = _get_loader(project_root)
 
     return {
         "user": loader.user_config_dir / "config.yaml",
@@ -12,6 +12,32 @@ from smithery.decorators import smithery
 
 from .server import create_server
 
+# Static tool responses, built once and serialized read-only by FastMCP
+_DEFAULT_SERVER_CONFIG = {
+    "project_path": ".",
+    "spec_folder": ".specifications",
+    "filesystem_tools_enabled": False,
+    "mode_classification_enabled": True,
+    "deployment_type": "smithery",
+    "server_name": "SpecForge-Smithery",
+}
+
+_DEPLOYMENT_INFO = {
+    "deployment_platform": "smithery",
+    "capabilities": [
+        "mode_classification",
+        "specification_analysis",
+        "requirements_guidance",
+        "workflow_planning",
+        "task_management",
+    ],
+    "limitations": [
+        "no_local_file_writes",
+        "read_only_filesystem_access",
+    ],
+    "recommended_usage": "Use with VS Code extension for full file operation support",
+}
+
 
 class ConfigSchema(BaseModel):
     """Configuration schema for Smithery-deployed SpecForged server"""
@@ -76,35 +102,12 @@ def create_smithery_server() -> FastMCP:
                 "server_name": "SpecForge-Smithery",
             }
         else:
-            return {
-                "project_path": ".",
-                "spec_folder": ".specifications",
-                "filesystem_tools_enabled": False,
-                "mode_classification_enabled": True,
-                "deployment_type": "smithery",
-                "server_name": "SpecForge-Smithery",
-            }
+            return _DEFAULT_SERVER_CONFIG
 
     @server.tool()
     def get_deployment_info() -> dict:
         """Get deployment-specific information"""
-        return {
-            "deployment_platform": "smithery",
-            "capabilities": [
-                "mode_classification",
-                "specification_analysis",
-                "requirements_guidance",
-                "workflow_planning",
-                "task_management",
-            ],
-            "limitations": [
-                "no_local_file_writes",
-                "read_only_filesystem_access",
-            ],
-            "recommended_usage": (
-                "Use with VS Code extension for full file operation support"
-            ),
-        }
+        return _DEPLOYMENT_INFO
 
     return server
 
@@ -5,12 +5,40 @@ Provides pre-built templates for common project types to accelerate
 specification creation and provide best practices.
 """
 
-from typing import Any, Dict, List, Optional
+import functools
+from types import MappingProxyType
+from typing import Any, Callable, List, Mapping, Optional
 
+from ..models import EARSRequirement
 from .rest_api import get_rest_api_tasks, get_rest_api_template
 from .web_app import get_web_app_tasks, get_web_app_template
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only views and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Build a mutable copy of a value produced by _freeze"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _frozen_template(template_func: Callable[[], Any]) -> Optional[Mapping[str, Any]]:
+    """Read-only view of a memoized template, built once per template"""
+    result = template_func()
+    return _freeze(result) if isinstance(result, dict) else None
+
+
 class TemplateManager:
     """Manages project templates for the wizard"""
 
@@ -29,24 +57,29 @@ class TemplateManager:
                 "description": "RESTful API service with CRUD operations",
             },
         }
+        # Read-only summary, built once since the registry never changes
+        self._available = MappingProxyType(
+            {
+                key: MappingProxyType(
+                    {
+                        "name": str(template["name"]),
+                        "description": str(template["description"]),
+                    }
+                )
+                for key, template in self.templates.items()
+            }
+        )
 
-    def get_available_templates(self) -> Dict[str, Dict[str, str]]:
+    def get_available_templates(self) -> Mapping[str, Mapping[str, str]]:
         """Get list of available templates"""
-        return {
-            key: {
-                "name": str(template["name"]),
-                "description": str(template["description"]),
-            }
-            for key, template in self.templates.items()
-        }
+        return self._available
 
-    def get_template(self, template_key: str) -> Optional[Dict[str, Any]]:
-        """Get template data by key"""
+    def get_template(self, template_key: str) -> Optional[Mapping[str, Any]]:
+        """Get template data by key as a shared, read-only view"""
         if template_key in self.templates:
             template_func = self.templates[template_key]["get_template"]
             if callable(template_func):
-                result = template_func()
-                return result if isinstance(result, dict) else None
+                return _frozen_template(template_func)
             return None
         return None
 
@@ -56,7 +89,7 @@ class TemplateManager:
             task_func = self.templates[template_key]["get_tasks"]
             if callable(task_func):
                 result = task_func()
-                return result if isinstance(result, list) else None
+                return list(result) if isinstance(result, list) else None
             return None
         return None
 
@@ -69,36 +102,36 @@ class TemplateManager:
             return False
 
         try:
+            add_user_story = spec_manager.add_user_story
+
             # Add user stories from template
-            for story_data in template.get("user_stories", []):
-                story = spec_manager.add_user_story(
-                    spec_id,
-                    story_data["as_a"],
-                    story_data["i_want"],
-                    story_data["so_that"],
-                )
+            for story_data in template.get("user_stories", ()):
+                as_a = story_data["as_a"]
+                i_want = story_data["i_want"]
+                so_that = story_data["so_that"]
+                story = add_user_story(spec_id, as_a, i_want, so_that)
 
                 # Add EARS requirements
-                for ears_data in story_data.get("ears_requirements", []):
-                    from ..models import EARSRequirement
-
+                requirements = story.requirements
+                for ears_data in story_data.get("ears_requirements", ()):
                     ears_req = EARSRequirement(
-                        id=f"{story.id}-R{len(story.requirements) + 1:02d}",
+                        id=f"{story.id}-R{len(requirements) + 1:02d}",
                         condition=ears_data["condition"],
                         system_response=ears_data["system_response"],
                     )
-                    story.requirements.append(ears_req)
-
-            # Update design from template
-            spec = spec_manager.specs[spec_id]
-            spec.design.update(
-                {
-                    "architecture": template.get("architecture", ""),
-                    "components": template.get("components", []),
-                    "data_models": template.get("data_models", ""),
-                    "sequence_diagrams": template.get("sequence_diagrams", []),
-                }
-            )
+                    requirements.append(ears_req)
+
+            # Update design from template, with mutable copies for the spec
+            design = {
+                key: _thaw(template.get(key, default))
+                for key, default in (
+                    ("architecture", ""),
+                    ("components", []),
+                    ("data_models", ""),
+                    ("sequence_diagrams", []),
+                )
+            }
+            spec_manager.specs[spec_id].design.update(design)
 
             # Save changes
             spec_manager.save_specification(spec_id)
@@ -2,9 +2,88 @@
 REST API Project Template for SpecForge
 """
 
+import functools
 from typing import Any, Dict, List
 
+# Large static strings are stripped once at import time
+_DATA_MODELS = """
+interface APIKey {
+  id: string;
+  keyHash: string;
+  userId: string;
+  name: string;
+  permissions: string[];
+  rateLimit: number;
+  isActive: boolean;
+  createdAt: Date;
+  expiresAt?: Date;
+}
+interface APIResponse<T> {
+  success: boolean;
+  data?: T;
+  error?: {
+    code: string;
+    message: string;
+    details?: Record<string, any>;
+  };
+  meta?: {
+    pagination?: {
+      page: number;
+      limit: number;
+      total: number;
+    };
+  };
+}
+interface Resource {
+  id: string;
+  name: string;
+  description: string;
+  status: 'active' | 'inactive' | 'deleted';
+  createdAt: Date;
+  updatedAt: Date;
+  createdBy: string;
+  metadata: Record<string, any>;
+}
+""".strip()
+
+_SEQ_AUTH = """
+sequenceDiagram
+    participant C as Client
+    participant G as API Gateway
+    participant A as Auth Service
+    participant S as Service
+    participant D as Database
+    C->>G: Request with API Key
+    G->>A: Validate API Key
+    A->>D: Check key and permissions
+    D-->>A: Key valid with permissions
+    A-->>G: Authentication success
+    G->>S: Forward request with context
+    S->>D: Process business logic
+    D-->>S: Return data
+    S-->>G: Service response
+    G-->>C: API response
+""".strip()
+
+_SEQ_CRUD = """
+sequenceDiagram
+    participant C as Client
+    participant API as API Controller
+    participant S as Service Layer
+    participant V as Validator
+    participant D as Database
+    C->>API: POST /resources
+    API->>V: Validate input
+    V-->>API: Validation passed
+    API->>S: Create resource
+    S->>D: Insert record
+    D-->>S: Record created
+    S-->>API: Resource created
+    API-->>C: 201 Created + resource data
+""".strip()
 
+
+@functools.lru_cache(maxsize=1)
 def get_rest_api_template() -> Dict[str, Any]:
     """Get REST API service project template"""
     return {
@@ -109,90 +188,21 @@ def get_rest_api_template() -> Dict[str, Any]:
                 "description": "Input validation and sanitization",
             },
         ],
-        "data_models": """
-interface APIKey {
-  id: string;
-  keyHash: string;
-  userId: string;
-  name: string;
-  permissions: string[];
-  rateLimit: number;
-  isActive: boolean;
-  createdAt: Date;
-  expiresAt?: Date;
-}
-interface APIResponse<T> {
-  success: boolean;
-  data?: T;
-  error?: {
-    code: string;
-    message: string;
-    details?: Record<string, any>;
-  };
-  meta?: {
-    pagination?: {
-      page: number;
-      limit: number;
-      total: number;
-    };
-  };
-}
-interface Resource {
-  id: string;
-  name: string;
-  description: string;
-  status: 'active' | 'inactive' | 'deleted';
-  createdAt: Date;
-  updatedAt: Date;
-  createdBy: string;
-  metadata: Record<string, any>;
-}
-        """.strip(),
+        "data_models": _DATA_MODELS,
         "sequence_diagrams": [
             {
                 "title": "API Authentication Flow",
-                "mermaid": """
-sequenceDiagram
-    participant C as Client
-    participant G as API Gateway
-    participant A as Auth Service
-    participant S as Service
-    participant D as Database
-    C->>G: Request with API Key
-    G->>A: Validate API Key
-    A->>D: Check key and permissions
-    D-->>A: Key valid with permissions
-    A-->>G: Authentication success
-    G->>S: Forward request with context
-    S->>D: Process business logic
-    D-->>S: Return data
-    S-->>G: Service response
-    G-->>C: API response
-                """.strip(),
+                "mermaid": _SEQ_AUTH,
             },
             {
                 "title": "CRUD Operations Flow",
-                "mermaid": """
-sequenceDiagram
-    participant C as Client
-    participant API as API Controller
-    participant S as Service Layer
-    participant V as Validator
-    participant D as Database
-    C->>API: POST /resources
-    API->>V: Validate input
-    V-->>API: Validation passed
-    API->>S: Create resource
-    S->>D: Insert record
-    D-->>S: Record created
-    S-->>API: Resource created
-    API-->>C: 201 Created + resource data
-                """.strip(),
+                "mermaid": _SEQ_CRUD,
             },
         ],
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_rest_api_tasks() -> List[str]:
     """Get common REST API implementation tasks"""
     return [
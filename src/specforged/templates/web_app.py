@@ -2,9 +2,76 @@
 Web Application Project Template for SpecForge
 """
 
+import functools
+import json
 from typing import Any, Dict, List
 
+# Large static strings are stripped once at import time
+_DATA_MODELS = """
+interface User {
+  id: string;
+  email: string;
+  username: string;
+  firstName: string;
+  lastName: string;
+  avatar?: string;
+  createdAt: Date;
+  updatedAt: Date;
+  isActive: boolean;
+}
+interface Session {
+  id: string;
+  userId: string;
+  token: string;
+  expiresAt: Date;
+  createdAt: Date;
+}
+interface UserProfile {
+  userId: string;
+  bio?: string;
+  location?: string;
+  website?: string;
+  preferences: Record<string, any>;
+}
+""".strip()
+
+_SEQ_REGISTRATION = """
+sequenceDiagram
+    participant U as User
+    participant F as Frontend
+    participant A as Auth Service
+    participant D as Database
+    participant E as Email Service
+    U->>F: Submit registration form
+    F->>A: POST /auth/register
+    A->>D: Check if email exists
+    D-->>A: Email available
+    A->>D: Create user record
+    D-->>A: User created
+    A->>E: Send confirmation email
+    E-->>A: Email sent
+    A-->>F: Registration successful
+    F-->>U: Show confirmation message
+""".strip()
+
+_SEQ_LOGIN = """
+sequenceDiagram
+    participant U as User
+    participant F as Frontend
+    participant A as Auth Service
+    participant D as Database
+    U->>F: Enter credentials
+    F->>A: POST /auth/login
+    A->>D: Validate credentials
+    D-->>A: Credentials valid
+    A->>A: Generate JWT token
+    A-->>F: Return token + user data
+    F->>F: Store token
+    F-->>U: Redirect to dashboard
+""".strip()
+
 
+@functools.lru_cache(maxsize=1)
 def get_web_app_template() -> Dict[str, Any]:
     """Get web application project template"""
     return {
@@ -99,77 +166,29 @@ def get_web_app_template() -> Dict[str, Any]:
                 "description": ("Cloud storage for user-uploaded files and assets"),
             },
         ],
-        "data_models": """
-interface User {
-  id: string;
-  email: string;
-  username: string;
-  firstName: string;
-  lastName: string;
-  avatar?: string;
-  createdAt: Date;
-  updatedAt: Date;
-  isActive: boolean;
-}
-interface Session {
-  id: string;
-  userId: string;
-  token: string;
-  expiresAt: Date;
-  createdAt: Date;
-}
-interface UserProfile {
-  userId: string;
-  bio?: string;
-  location?: string;
-  website?: string;
-  preferences: Record<string, any>;
-}
-        """.strip(),
+        "data_models": _DATA_MODELS,
         "sequence_diagrams": [
             {
                 "title": "User Registration Flow",
-                "mermaid": """
-sequenceDiagram
-    participant U as User
-    participant F as Frontend
-    participant A as Auth Service
-    participant D as Database
-    participant E as Email Service
-    U->>F: Submit registration form
-    F->>A: POST /auth/register
-    A->>D: Check if email exists
-    D-->>A: Email available
-    A->>D: Create user record
-    D-->>A: User created
-    A->>E: Send confirmation email
-    E-->>A: Email sent
-    A-->>F: Registration successful
-    F-->>U: Show confirmation message
-                """.strip(),
+                "mermaid": _SEQ_REGISTRATION,
             },
             {
                 "title": "User Login Flow",
-                "mermaid": """
-sequenceDiagram
-    participant U as User
-    participant F as Frontend
-    participant A as Auth Service
-    participant D as Database
-    U->>F: Enter credentials
-    F->>A: POST /auth/login
-    A->>D: Validate credentials
-    D-->>A: Credentials valid
-    A->>A: Generate JWT token
-    A-->>F: Return token + user data
-    F->>F: Store token
-    F-->>U: Redirect to dashboard
-                """.strip(),
+                "mermaid": _SEQ_LOGIN,
             },
         ],
     }
 
 
+@functools.lru_cache(maxsize=1)
+def get_web_app_template_json() -> bytes:
+    """Get the web application template as compact UTF-8 JSON, serialized once"""
+    return json.dumps(
+        get_web_app_template(), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
 def get_web_app_tasks() -> List[str]:
     """Get common web app implementation tasks"""
     return [
@@ -2,16 +2,26 @@
 MCP tools for SpecForge server.
 """
 
-from .classification import setup_classification_tools
-from .filesystem import setup_filesystem_tools
-from .planning import setup_planning_tools
-from .specifications import setup_spec_tools
-from .workflow import setup_workflow_tools
+# Tool modules are imported on first access, so standalone submodules such
+# as the performance CLI can be imported without the MCP server stack
+_LAZY_EXPORTS = {
+    "setup_classification_tools": ".classification",
+    "setup_spec_tools": ".specifications",
+    "setup_workflow_tools": ".workflow",
+    "setup_planning_tools": ".planning",
+    "setup_filesystem_tools": ".filesystem",
+}
 
-__all__ = [
-    "setup_classification_tools",
-    "setup_spec_tools",
-    "setup_workflow_tools",
-    "setup_planning_tools",
-    "setup_filesystem_tools",
-]
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
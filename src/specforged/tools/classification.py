@@ -2,24 +2,46 @@
 Mode classification MCP tools.
 """
 
-from typing import Any, Dict
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Union
 
 from mcp.server.fastmcp import Context, FastMCP
 
 from ..core.classifier import ModeClassifier
 
+# Bounds for the per-registration classification cache
+CLASSIFICATION_CACHE_SIZE = 512
+# Longer inputs are keyed by digest so the cache does not pin large strings
+CLASSIFICATION_KEY_MAX_CHARS = 1024
+
 
 def setup_classification_tools(mcp: FastMCP, classifier: ModeClassifier) -> None:
     """Setup classification-related MCP tools"""
 
+    # classify() is a pure function of its input, so retries hit this cache
+    cache: "OrderedDict[Union[str, bytes], Dict[str, Any]]" = OrderedDict()
+
     @mcp.tool()
     async def classify_mode(user_input: str, ctx: Context) -> Dict[str, Any]:
         """
         Classify user input to determine routing mode.
         Returns confidence scores for chat, do, and spec modes.
         """
-        classification = classifier.classify(user_input)
-
-        await ctx.info(f"Classified as {classification.primary_mode.value} mode")
-
-        return classification.to_dict()
+        key: Union[str, bytes] = user_input
+        if len(user_input) > CLASSIFICATION_KEY_MAX_CHARS:
+            key = hashlib.blake2b(user_input.encode(), digest_size=16).digest()
+
+        result = cache.get(key)
+        if result is None:
+            result = classifier.classify(user_input).to_dict()
+            cache[key] = result
+            if len(cache) > CLASSIFICATION_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        await ctx.info(f"Classified as {result['mode']} mode")
+
+        # Callers get their own copy of the mutable reasoning list
+        return dict(result, reasoning=list(result["reasoning"]))
@@ -1,25 +1,236 @@
 # src/specforged/tools/filesystem.py
-from typing import Any, Dict
+import asyncio
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
-import aiofiles
 from mcp.server.fastmcp import Context, FastMCP
 
 from ..core.spec_manager import SpecificationManager
 
+# Files at least this large are edited in chunks instead of in memory
+STREAM_EDIT_THRESHOLD = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Upper bound on remembered parent directories per tool registration
+MAX_ENSURED_DIRS = 1024
+
+# Budget for the per-registration cache of file contents
+CONTENT_CACHE_MAX_ENTRIES = 64
+CONTENT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _ContentCache:
+    """LRU cache of decoded file contents, keyed by path and validated by stat"""
+
+    def __init__(
+        self,
+        max_entries: int = CONTENT_CACHE_MAX_ENTRIES,
+        max_bytes: int = CONTENT_CACHE_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Path, Tuple[Tuple[int, ...], str]]" = OrderedDict()
+        self._size = 0
+
+    @staticmethod
+    def signature(file_stat: os.stat_result) -> Tuple[int, ...]:
+        return (
+            file_stat.st_ino,
+            file_stat.st_mtime_ns,
+            file_stat.st_ctime_ns,
+            file_stat.st_size,
+        )
+
+    def get(self, path: Path, signature: Tuple[int, ...]) -> Optional[str]:
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != signature:
+            return None
+        self._entries.move_to_end(path)
+        return entry[1]
+
+    def put(self, path: Path, signature: Tuple[int, ...], content: str) -> None:
+        self.discard(path)
+        if len(content) > self.max_bytes:
+            return
+        self._entries[path] = (signature, content)
+        self._size += len(content)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def discard(self, path: Path) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    """Append data with unbuffered O_APPEND writes, creating the file if needed"""
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _read_raw_text(path: Path) -> str:
+    """Read UTF-8 text with line endings left as stored, like _stream_replace"""
+    with open(path, encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _translate_newlines(content: str) -> str:
+    """Translate CRLF and lone CR to LF, as a default text-mode read would"""
+    if "\r" not in content:
+        return content
+    return content.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _newline_of(content: str) -> str:
+    """Newline style of text read with newline="", judged by its first break"""
+    index = content.find("\n")
+    return "\r\n" if index > 0 and content[index - 1] == "\r" else "\n"
+
+
+def _file_newline(path: Path) -> str:
+    """Newline style of a file, judged by its first line break"""
+    previous = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                return "\n"
+            index = chunk.find(b"\n")
+            if index >= 0:
+                before = chunk[index - 1 : index] if index else previous
+                return "\r\n" if before == b"\r" else "\n"
+            previous = chunk[-1:]
+
+
+def _with_newlines(text: str, newline: str) -> str:
+    """Rewrite the line breaks in text to the given newline style"""
+    text = text.replace("\r\n", "\n")
+    return text if newline == "\n" else text.replace("\n", newline)
+
+
+def _write_text(path: Path, content: str, write_mode: str) -> None:
+    """Write or append UTF-8 text to path; run in a worker thread"""
+    if write_mode == "a":
+        _append_bytes(path, content.encode("utf-8"))
+        return
+    with open(path, write_mode, encoding="utf-8") as f:
+        f.write(content)
+
+
+def _stream_replace(path: Path, old: bytes, new: bytes, expected: int) -> int:
+    """
+    Replace old with new throughout path, one chunk at a time.
+
+    The result goes to a sibling temporary file that only replaces path when
+    exactly `expected` occurrences were found. Returns the occurrence count.
+    """
+    keep = len(old) - 1
+    occurrences = 0
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with open(path, "rb") as src, os.fdopen(fd, "wb") as dst:
+            carry = b""
+            while True:
+                chunk = src.read(STREAM_CHUNK_SIZE)
+                buffer = carry + chunk
+                pieces = []
+                start = 0
+                while True:
+                    index = buffer.find(old, start)
+                    if index < 0:
+                        break
+                    occurrences += 1
+                    pieces.append(buffer[start:index])
+                    pieces.append(new)
+                    start = index + len(old)
+                # A match cannot start in the last len(old) - 1 bytes of a
+                # chunk, so carry them over to the next read
+                cut = len(buffer) if not chunk else max(start, len(buffer) - keep)
+                pieces.append(buffer[start:cut])
+                carry = buffer[cut:]
+                # Past the expected count the edit fails; only keep counting
+                if occurrences <= expected:
+                    dst.write(b"".join(pieces))
+                if not chunk:
+                    break
+        if occurrences == expected:
+            shutil.copymode(path, tmp_name)
+            os.replace(tmp_name, path)
+            tmp_name = ""
+    finally:
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+    return occurrences
+
+
+def _count_mismatch(occurrences: int, expected: int) -> Dict[str, Any]:
+    """Error response for an edit whose match count is not the expected one"""
+    return {
+        "status": "error",
+        "message": (
+            f"Found {occurrences} occurrence(s), expected {expected}. "
+            "Provide a more specific old_string to ensure precise replacement."
+        ),
+    }
+
 
 def setup_filesystem_tools(mcp: FastMCP, spec_manager: SpecificationManager) -> None:
     """Setup filesystem-related MCP tools, constrained to the detected project root.
 
     Tools:
     - read_file(path): Read a UTF-8 text file within the project.
-    - write_file(path, content, mode): Write/append UTF-8 text within the project.
-    - edit_block(file_path, old_string, new_string, expected_replacements):
-      Safe text replacement.
+    - fs_write(action, path, ...): Write, append, create a directory, or
+      replace exact text ('edit_block') within the project.
+    - batch_execute(operations): Run several of the above in one call.
+
+    The write-side operations share one tool so that only one tool
+    description is sent to the model for all of them.
 
     All paths are validated to be inside the project root using
     ProjectDetector.validate_path.
     """
 
+    # Parent directories write_file has already created. validate_path itself
+    # is not memoized: its resolve() is what catches a symlink swapped in later.
+    ensured_dirs: Set[Path] = set()
+
+    def ensure_parent(path: Path) -> None:
+        parent = path.parent
+        if parent not in ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            if len(ensured_dirs) >= MAX_ENSURED_DIRS:
+                ensured_dirs.clear()
+            ensured_dirs.add(parent)
+
+    # Unchanged files are served from memory on repeated reads. Contents keep
+    # their stored line endings so edit_block matches the same text whether or
+    # not the file is large enough to be streamed.
+    content_cache = _ContentCache()
+
+    async def cached_read(path: Path) -> str:
+        signature = _ContentCache.signature(path.stat())
+        content = content_cache.get(path, signature)
+        if content is None:
+            content = await asyncio.to_thread(_read_raw_text, path)
+            content_cache.put(path, signature, content)
+        return content
+
     @mcp.tool()
     async def read_file(path: str, ctx: Context) -> Dict[str, Any]:
         """
@@ -31,11 +242,11 @@ def setup_filesystem_tools(mcp: FastMCP, spec_manager: SpecificationManager) ->
         """
         try:
             validated_path = spec_manager.project_detector.validate_path(path)
-            async with aiofiles.open(validated_path, mode="r", encoding="utf-8") as f:
-                content = await f.read()
+            path_str = os.fspath(validated_path)
+            content = _translate_newlines(await cached_read(validated_path))
             return {
                 "status": "success",
-                "path": str(validated_path),
+                "path": path_str,
                 "content": content,
             }
         except FileNotFoundError:
@@ -48,7 +259,6 @@ def setup_filesystem_tools(mcp: FastMCP, spec_manager: SpecificationManager) ->
                 "message": f"Error reading file {path}: {e}",
             }
 
-    @mcp.tool()
     async def create_directory(
         path: str, ctx: Context, exist_ok: bool = True
     ) -> Dict[str, Any]:
@@ -62,11 +272,12 @@ def setup_filesystem_tools(mcp: FastMCP, spec_manager: SpecificationManager) ->
         """
         try:
             validated_path = spec_manager.project_detector.validate_path(path)
+            path_str = os.fspath(validated_path)
             validated_path.mkdir(parents=True, exist_ok=exist_ok)
             return {
                 "status": "success",
-                "message": f"Directory ensured: {validated_path}",
-                "path": str(validated_path),
+                "message": f"Directory ensured: {path_str}",
+                "path": path_str,
             }
         except PermissionError as e:
             return {"status": "error", "message": str(e)}
@@ -76,7 +287,6 @@ def setup_filesystem_tools(mcp: FastMCP, spec_manager: SpecificationManager) ->
                 "message": f"Error creating directory {path}: {e}",
             }
 
-    @mcp.tool()
     async def write_file(
         path: str, content: str, ctx: Context, mode: str = "rewrite"
     ) -> Dict[str, Any]:
@@ -92,22 +302,26 @@ def setup_filesystem_tools(mcp: FastMCP, spec_manager: SpecificationManager) ->
         """
         try:
             validated_path = spec_manager.project_detector.validate_path(path)
-            validated_path.parent.mkdir(parents=True, exist_ok=True)
-            if mode == "rewrite":
-                async with aiofiles.open(
-                    file=validated_path, mode="w", encoding="utf-8"
-                ) as f:
-                    await f.write(content)
-            else:
-                async with aiofiles.open(
-                    file=validated_path, mode="a", encoding="utf-8"
-                ) as f:
-                    await f.write(content)
+            path_str = os.fspath(validated_path)
+            write_mode = "w" if mode == "rewrite" else "a"
+            content_cache.discard(validated_path)
+            ensure_parent(validated_path)
+            try:
+                await asyncio.to_thread(
+                    _write_text, validated_path, content, write_mode
+                )
+            except FileNotFoundError:
+                # The parent was removed after we last created it
+                ensured_dirs.discard(validated_path.parent)
+                ensure_parent(validated_path)
+                await asyncio.to_thread(
+                    _write_text, validated_path, content, write_mode
+                )
             action = "written" if mode == "rewrite" else "appended"
             return {
                 "status": "success",
-                "message": f"Content {action} to {validated_path}",
-                "path": str(validated_path),
+                "message": f"Content {action} to {path_str}",
+                "path": path_str,
             }
         except PermissionError as e:
             return {"status": "error", "message": str(e)}
@@ -117,7 +331,6 @@ def setup_filesystem_tools(mcp: FastMCP, spec_manager: SpecificationManager) ->
                 "message": f"Error writing to file {path}: {e}",
             }
 
-    @mcp.tool()
     async def edit_block(
         file_path: str,
         old_string: str,
@@ -138,35 +351,66 @@ def setup_filesystem_tools(mcp: FastMCP, spec_manager: SpecificationManager) ->
         """
         try:
             validated_path = spec_manager.project_detector.validate_path(file_path)
-            async with aiofiles.open(validated_path, mode="r", encoding="utf-8") as f:
-                content = await f.read()
-
-            occurrences = content.count(old_string)
-            if occurrences != expected_replacements:
+            path_str = os.fspath(validated_path)
+            # Degenerate edits are settled before touching the file
+            if not old_string:
+                return {"status": "error", "message": "old_string must be non-empty"}
+            if expected_replacements < 1:
                 return {
                     "status": "error",
-                    "message": (
-                        f"Found {occurrences} occurrence(s), expected "
-                        f"{expected_replacements}. "
-                        "Provide a more specific old_string to ensure "
-                        "precise replacement."
-                    ),
+                    "message": "expected_replacements must be >= 1",
+                }
+            if old_string == new_string:
+                return {
+                    "status": "success",
+                    "message": "No changes: old_string equals new_string.",
+                    "path": path_str,
                 }
 
-            if occurrences == 0:
+            # read_file returns LF text, so old_string and new_string are
+            # converted to the file's own line endings before matching
+            if validated_path.stat().st_size >= STREAM_EDIT_THRESHOLD:
+                content_cache.discard(validated_path)
+                newline = await asyncio.to_thread(_file_newline, validated_path)
+                occurrences = await asyncio.to_thread(
+                    _stream_replace,
+                    validated_path,
+                    _with_newlines(old_string, newline).encode("utf-8"),
+                    _with_newlines(new_string, newline).encode("utf-8"),
+                    expected_replacements,
+                )
+                if occurrences != expected_replacements:
+                    return _count_mismatch(occurrences, expected_replacements)
                 return {
-                    "status": "error",
-                    "message": f"Search string not found in {file_path}.",
+                    "status": "success",
+                    "message": (f"Replaced {occurrences} occurrence(s) in {path_str}."),
+                    "path": path_str,
                 }
 
-            new_content = content.replace(old_string, new_string, expected_replacements)
-            async with aiofiles.open(validated_path, mode="w", encoding="utf-8") as f:
-                await f.write(new_content)
+            content = await cached_read(validated_path)
+            newline = _newline_of(content)
+            old_string = _with_newlines(old_string, newline)
+            new_string = _with_newlines(new_string, newline)
+
+            # One scan: stop splitting once we know there are too many matches
+            parts = content.split(old_string, expected_replacements + 1)
+            occurrences = len(parts) - 1
+            if occurrences > expected_replacements:
+                # Only the error message needs the exact count
+                occurrences = content.count(old_string)
+            if occurrences != expected_replacements:
+                return _count_mismatch(occurrences, expected_replacements)
+
+            new_content = new_string.join(parts)
+            content_cache.discard(validated_path)
+            await asyncio.to_thread(
+                validated_path.write_text, new_content, encoding="utf-8", newline=""
+            )
 
             return {
                 "status": "success",
-                "message": f"Replaced {occurrences} occurrence(s) in {validated_path}.",
-                "path": str(validated_path),
+                "message": f"Replaced {occurrences} occurrence(s) in {path_str}.",
+                "path": path_str,
             }
         except FileNotFoundError:
             return {
@@ -180,3 +424,102 @@ def setup_filesystem_tools(mcp: FastMCP, spec_manager: SpecificationManager) ->
                 "status": "error",
                 "message": f"Error editing file {file_path}: {e}",
             }
+
+    @mcp.tool()
+    async def fs_write(
+        action: Literal["write", "append", "mkdir", "edit_block"],
+        path: str,
+        ctx: Context,
+        content: str = "",
+        old_string: str = "",
+        new_string: str = "",
+        expected_replacements: int = 1,
+        exist_ok: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Modify files within the project directory.
+
+        Args:
+            action: 'write' overwrites the file with content, 'append' appends
+                content, 'mkdir' creates a directory recursively, 'edit_block'
+                replaces old_string with new_string.
+            path: Relative or absolute path (must resolve under project root).
+            content: Text for 'write' and 'append'.
+            old_string: Exact text to replace for 'edit_block'.
+            new_string: Replacement text for 'edit_block'.
+            expected_replacements: Occurrences 'edit_block' must find (default: 1).
+            exist_ok: For 'mkdir', do not error if the directory exists.
+        """
+        if action == "write" or action == "append":
+            mode = "rewrite" if action == "write" else "append"
+            return await write_file(path, content, ctx, mode=mode)
+        if action == "mkdir":
+            return await create_directory(path, ctx, exist_ok=exist_ok)
+        if action == "edit_block":
+            return await edit_block(
+                path, old_string, new_string, ctx, expected_replacements
+            )
+        return {"status": "error", "message": f"Unknown action: {action}"}
+
+    batch_handlers = {"read_file": read_file, "fs_write": fs_write}
+
+    @mcp.tool()
+    async def batch_execute(
+        operations: List[Dict[str, Any]],
+        ctx: Context,
+        max_concurrent: int = 8,
+        stop_on_error: bool = False,
+        timeout_ms: int = 30000,
+    ) -> Dict[str, Any]:
+        """
+        Run several filesystem operations in one call, concurrently.
+
+        Operations run in parallel, so their relative order is not guaranteed;
+        do not batch operations that depend on each other's results.
+
+        Args:
+            operations: List of {"tool": name, "args": {...}} entries, where name
+                is read_file or fs_write.
+            max_concurrent: Maximum number of operations running at once.
+            stop_on_error: Skip operations not yet started once one has failed.
+            timeout_ms: Time limit for each operation in milliseconds.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        timeout = timeout_ms / 1000
+        failed = asyncio.Event()
+
+        async def run(operation: Dict[str, Any]) -> Dict[str, Any]:
+            tool = operation.get("tool")
+            handler = batch_handlers.get(tool)
+            if handler is None:
+                result = {"status": "error", "message": f"Unknown tool: {tool}"}
+            else:
+                async with semaphore:
+                    if stop_on_error and failed.is_set():
+                        return {
+                            "status": "skipped",
+                            "message": "Skipped after an earlier failure",
+                        }
+                    try:
+                        result = await asyncio.wait_for(
+                            handler(ctx=ctx, **operation.get("args", {})), timeout
+                        )
+                    except asyncio.TimeoutError:
+                        result = {
+                            "status": "error",
+                            "message": f"{tool} timed out after {timeout_ms} ms",
+                        }
+                    except TypeError as e:
+                        result = {
+                            "status": "error",
+                            "message": f"Invalid arguments for {tool}: {e}",
+                        }
+            if result["status"] != "success":
+                failed.set()
+            return result
+
+        results = await asyncio.gather(*(run(op) for op in operations))
+        return {
+            "status": "error" if failed.is_set() else "success",
+            "results": list(results),
+        }
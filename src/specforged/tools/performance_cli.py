@@ -6,34 +6,124 @@ A command-line interface for monitoring, benchmarking, and optimizing
 the performance of the SpecForge MCP ecosystem.
 """
 
-import asyncio
+import ast
 import json
+import mmap
+import os
 import sys
-import time
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from specforged.config.performance import (
     PerformanceConfigManager,
+    PerformanceConfigModel,
     PerformanceProfile,
-    get_performance_config,
 )
 
-# Try to import test modules (they may not be available in production)
+# orjson serializes results and parses queues faster; stdlib json is the fallback
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+# ijson counts queue statuses without materializing the whole document
 try:
-    from tests.test_performance_benchmarks import PerformanceBenchmarks
+    import ijson
 
-    BENCHMARKS_AVAILABLE = True
+    IJSON_AVAILABLE = True
 except ImportError:
-    BENCHMARKS_AVAILABLE = False
+    IJSON_AVAILABLE = False
+    ijson = None  # type: ignore
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Batches this large are unlinked from a thread pool
+UNLINK_PARALLEL_THRESHOLD = 16
+UNLINK_MAX_WORKERS = 32
+
+# (path, stat) pairs collected by scan_cleanup_candidates
+FileStats = List[Tuple[str, os.stat_result]]
+
+
+@lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
 
-console = Console()
+@lru_cache(maxsize=8)
+def get_config_manager(config_path: Optional[Path]) -> PerformanceConfigManager:
+    """Return a shared configuration manager for a config path."""
+    return PerformanceConfigManager(config_path)
+
+
+@lru_cache(maxsize=16)
+def _load_config_cached(
+    config_path: Optional[Path], profile: Optional[str], source_key: Tuple
+) -> PerformanceConfigModel:
+    """Load a configuration; source_key only invalidates the cache entry."""
+    return get_config_manager(config_path).load_config(profile)
+
+
+def load_performance_config(
+    config_path: Optional[Path], profile: Optional[str] = None
+) -> PerformanceConfigModel:
+    """Load a configuration, reusing earlier loads of unchanged sources."""
+    try:
+        st = config_path.stat() if config_path else None
+        file_key = (st.st_mtime_ns, st.st_size) if st else None
+    except FileNotFoundError:
+        file_key = None
+    # Without a file the configuration comes from the environment
+    env_key = tuple(
+        sorted(
+            (name, value)
+            for name, value in os.environ.items()
+            if name.startswith("SPECFORGE_") or name == "NODE_ENV"
+        )
+    )
+    config = _load_config_cached(config_path, profile, (file_key, env_key))
+    # Callers get their own copy so the cached model is never mutated
+    return config.model_copy(deep=True)
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, stringifying unknown types."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+def load_json(content: bytes) -> Any:
+    """Parse UTF-8 JSON content."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 @click.group()
@@ -60,27 +150,29 @@ def cli():
 @click.option("--config-path", type=click.Path(), help="Path to configuration file")
 def config(profile: Optional[str], config_path: Optional[str]):
     """Show current performance configuration."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
     try:
-        config_mgr = PerformanceConfigManager(
-            Path(config_path) if config_path else None
+        perf_config = load_performance_config(
+            Path(config_path) if config_path else None, profile
         )
-        perf_config = config_mgr.load_config(profile)
 
-        console.print(
-            Panel.fit(
-                f"[bold green]SpecForge Performance Configuration[/bold green]\n"
-                f"Profile: [bold cyan]{perf_config.profile}[/bold cyan]",
-                border_style="green",
-            )
+        panel = Panel.fit(
+            f"[bold green]SpecForge Performance Configuration[/bold green]\n"
+            f"Profile: [bold cyan]{perf_config.profile}[/bold cyan]",
+            border_style="green",
         )
 
         # Cache Configuration
-        table = Table(title="Cache Configuration", show_header=True)
-        table.add_column("Setting", style="cyan", no_wrap=True)
-        table.add_column("Value", style="magenta")
+        cache_table = Table(title="Cache Configuration", show_header=True)
+        cache_table.add_column("Setting", style="cyan", no_wrap=True)
+        cache_table.add_column("Value", style="magenta")
 
-        table.add_row("LRU Cache Size", str(perf_config.cache.lru_cache_size))
-        table.add_row(
+        cache_table.add_row("LRU Cache Size", str(perf_config.cache.lru_cache_size))
+        cache_table.add_row(
             "Result Caching",
             (
                 "✅ Enabled"
@@ -88,24 +180,27 @@ def config(profile: Optional[str], config_path: Optional[str]):
                 else "❌ Disabled"
             ),
         )
-        table.add_row("Result Cache Size", str(perf_config.cache.result_cache_max_size))
-        table.add_row(
+        cache_table.add_row(
+            "Result Cache Size", str(perf_config.cache.result_cache_max_size)
+        )
+        cache_table.add_row(
             "Cache TTL (seconds)",
             str(perf_config.cache.result_cache_ttl_seconds),
         )
-        console.print(table)
 
         # Batching Configuration
-        table = Table(title="Batching Configuration", show_header=True)
-        table.add_column("Setting", style="cyan", no_wrap=True)
-        table.add_column("Value", style="magenta")
+        batching_table = Table(title="Batching Configuration", show_header=True)
+        batching_table.add_column("Setting", style="cyan", no_wrap=True)
+        batching_table.add_column("Value", style="magenta")
 
-        table.add_row(
+        batching_table.add_row(
             "Batching Enabled",
             ("✅ Enabled" if perf_config.batching.enable_batching else "❌ Disabled"),
         )
-        table.add_row("Max Batch Size", str(perf_config.batching.max_batch_size))
-        table.add_row(
+        batching_table.add_row(
+            "Max Batch Size", str(perf_config.batching.max_batch_size)
+        )
+        batching_table.add_row(
             "Smart Batching",
             (
                 "✅ Enabled"
@@ -113,7 +208,7 @@ def config(profile: Optional[str], config_path: Optional[str]):
                 else "❌ Disabled"
             ),
         )
-        table.add_row(
+        batching_table.add_row(
             "Operation Deduplication",
             (
                 "✅ Enabled"
@@ -121,15 +216,16 @@ def config(profile: Optional[str], config_path: Optional[str]):
                 else "❌ Disabled"
             ),
         )
-        console.print(table)
 
         # Memory Configuration
-        table = Table(title="Memory Configuration", show_header=True)
-        table.add_column("Setting", style="cyan", no_wrap=True)
-        table.add_column("Value", style="magenta")
+        memory_table = Table(title="Memory Configuration", show_header=True)
+        memory_table.add_column("Setting", style="cyan", no_wrap=True)
+        memory_table.add_column("Value", style="magenta")
 
-        table.add_row("Max Memory (MB)", str(perf_config.memory.max_memory_usage_mb))
-        table.add_row(
+        memory_table.add_row(
+            "Max Memory (MB)", str(perf_config.memory.max_memory_usage_mb)
+        )
+        memory_table.add_row(
             "Memory Monitoring",
             (
                 "✅ Enabled"
@@ -137,8 +233,8 @@ def config(profile: Optional[str], config_path: Optional[str]):
                 else "❌ Disabled"
             ),
         )
-        table.add_row("Max Queue Size", str(perf_config.memory.max_queue_size))
-        table.add_row(
+        memory_table.add_row("Max Queue Size", str(perf_config.memory.max_queue_size))
+        memory_table.add_row(
             "Auto Compaction",
             (
                 "✅ Enabled"
@@ -146,7 +242,9 @@ def config(profile: Optional[str], config_path: Optional[str]):
                 else "❌ Disabled"
             ),
         )
-        console.print(table)
+
+        # Render everything in a single console write
+        console.print(Group(panel, cache_table, batching_table, memory_table))
 
     except Exception as e:
         console.print(f"[bold red]Error loading configuration: {e}[/bold red]")
@@ -174,6 +272,7 @@ def config(profile: Optional[str], config_path: Optional[str]):
 @click.option("--force", is_flag=True, help="Force overwrite existing configuration")
 def set_profile(profile: str, config_path: Optional[str], force: bool):
     """Set performance profile."""
+    console = get_console()
     try:
         save_path = (
             Path(config_path) if config_path else Path("specforge-performance.yml")
@@ -184,9 +283,9 @@ def set_profile(profile: str, config_path: Optional[str], force: bool):
                 console.print("[yellow]Operation cancelled.[/yellow]")
                 return
 
-        config_mgr = PerformanceConfigManager(save_path)
-        perf_config = config_mgr.load_config(profile)
-        config_mgr.save_config(perf_config, save_path)
+        perf_config = load_performance_config(save_path, profile)
+        get_config_manager(save_path).save_config(perf_config, save_path)
+        _load_config_cached.cache_clear()
 
         console.print(
             f"[bold green]✅ Performance profile set to '{profile}'[/bold green]"
@@ -198,6 +297,17 @@ def set_profile(profile: str, config_path: Optional[str], force: bool):
         sys.exit(1)
 
 
+def parse_setting_value(value: str) -> Any:
+    """Parse a command-line setting value as a Python literal or plain string."""
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
 @cli.command()
 @click.option(
     "--setting",
@@ -208,20 +318,13 @@ def set_profile(profile: str, config_path: Optional[str], force: bool):
 @click.option("--config-path", type=click.Path(), help="Path to configuration file")
 def update(setting: str, value: str, config_path: Optional[str]):
     """Update a specific configuration setting."""
+    console = get_console()
     try:
         config_mgr = PerformanceConfigManager(
             Path(config_path) if config_path else None
         )
 
-        # Parse value based on type
-        if value.lower() in ("true", "false"):
-            parsed_value = value.lower() == "true"
-        elif value.isdigit():
-            parsed_value = int(value)
-        elif "." in value and value.replace(".", "").isdigit():
-            parsed_value = float(value)
-        else:
-            parsed_value = value
+        parsed_value = parse_setting_value(value)
 
         # Create update dictionary
         updates = {}
@@ -252,11 +355,19 @@ def update(setting: str, value: str, config_path: Optional[str]):
 )
 def benchmark(output: Optional[str], format: str):
     """Run performance benchmarks."""
-    if not BENCHMARKS_AVAILABLE:
+    console = get_console()
+    # Test modules may not be available in production installs
+    try:
+        from tests.test_performance_benchmarks import PerformanceBenchmarks
+    except ImportError:
         console.print("[bold red]❌ Performance benchmarks not available.[/bold red]")
         console.print("[dim]Install with: pip install -e .[dev][/dim]")
         sys.exit(1)
 
+    import asyncio
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     async def run_benchmarks():
         benchmarks = PerformanceBenchmarks()
 
@@ -270,18 +381,17 @@ def benchmark(output: Optional[str], format: str):
             progress.complete_task(task)
 
         if format == "json":
-            results_json = json.dumps(results, indent=2, default=str)
+            results_json = dump_json(results)
             if output:
-                Path(output).write_text(results_json)
+                Path(output).write_bytes(results_json)
                 console.print(f"[green]Results saved to {output}[/green]")
             else:
-                console.print(results_json)
+                console.print(results_json.decode("utf-8"))
         else:
             display_benchmark_results(results)
             if output:
                 # Save as JSON even when displaying as table
-                results_json = json.dumps(results, indent=2, default=str)
-                Path(output).write_text(results_json)
+                Path(output).write_bytes(dump_json(results))
                 console.print(f"[dim]Results also saved to {output}[/dim]")
 
     try:
@@ -293,6 +403,11 @@ def benchmark(output: Optional[str], format: str):
 
 def display_benchmark_results(results: Dict[str, Any]):
     """Display benchmark results in a nice table format."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     # Overall status
     passed_count = sum(
         1 for result in results.values() if result.get("status", "").startswith("✅")
@@ -305,12 +420,10 @@ def display_benchmark_results(results: Dict[str, Any]):
         if passed_count == total_count
         else "yellow" if passed_count > 0 else "red"
     )
-    console.print(
-        Panel(
-            f"[bold {status_color}]{passed_count}/{total_count} benchmarks passed[/bold {status_color}]",  # noqa: E501
-            title="Benchmark Results",
-            border_style=status_color,
-        )
+    panel = Panel(
+        f"[bold {status_color}]{passed_count}/{total_count} benchmarks passed[/bold {status_color}]",  # noqa: E501
+        title="Benchmark Results",
+        border_style=status_color,
     )
 
     # Results table
@@ -352,10 +465,8 @@ def display_benchmark_results(results: Dict[str, Any]):
 
         table.add_row(name, status, key_metric, key_value)
 
-    console.print(table)
-
     # Performance targets
-    console.print("\n[bold cyan]Performance Targets:[/bold cyan]")
+    target_lines = ["\n[bold cyan]Performance Targets:[/bold cyan]"]
     targets = [
         (
             "Cache hit rate",
@@ -387,7 +498,30 @@ def display_benchmark_results(results: Dict[str, Any]):
 
     for target, requirement, met in targets:
         status = "✅" if met else "❌"
-        console.print(f"  {status} {target}: {requirement}")
+        target_lines.append(f"  {status} {target}: {requirement}")
+
+    # Render everything in a single console write
+    get_console().print(Group(panel, table, Text.from_markup("\n".join(target_lines))))
+
+
+def format_grid(
+    headers: Sequence[str],
+    rows: Sequence[Sequence[str]],
+    right_aligned: Collection[int] = (),
+) -> str:
+    """Format rows as a plain-text grid with column widths computed once."""
+    from rich.cells import cell_len
+
+    widths = [max(cell_len(cell) for cell in column) for column in zip(headers, *rows)]
+
+    def format_row(row: Sequence[str]) -> str:
+        cells = []
+        for index, (cell, width) in enumerate(zip(row, widths)):
+            padding = " " * (width - cell_len(cell))
+            cells.append(padding + cell if index in right_aligned else cell + padding)
+        return "  ".join(cells).rstrip()
+
+    return "\n".join(format_row(row) for row in (headers, *rows))
 
 
 @cli.command()
@@ -400,10 +534,15 @@ def display_benchmark_results(results: Dict[str, Any]):
 @click.option("--interval", default=30, help="Monitoring interval in seconds")
 def monitor(project_root: Optional[str], watch: bool, interval: int):
     """Monitor performance metrics."""
+    from rich.console import Group
+    from rich.table import Table
+    from rich.text import Text
+
+    console = get_console()
     # This would integrate with the actual queue processor if available
-    console.print(
+    renderables: List[Any] = [
         "[yellow]⚠️  Performance monitoring requires a running MCP server.[/yellow]"
-    )
+    ]
 
     if project_root:
         project_path = Path(project_root)
@@ -415,37 +554,46 @@ def monitor(project_root: Optional[str], watch: bool, interval: int):
             "mcp-results.json",
         ]
 
-        table = Table(title="MCP File Status", show_header=True)
-        table.add_column("File", style="cyan")
-        table.add_column("Status", justify="center")
-        table.add_column("Size", style="magenta", justify="right")
-        table.add_column("Modified", style="green")
-
+        rows = []
         for filename in files_to_check:
-            file_path = project_path / filename
-            if file_path.exists():
-                stat = file_path.stat()
-                status = "✅ Found"
-                size = f"{stat.st_size / 1024:.1f} KB"
-                modified = time.strftime(
-                    "%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime)
-                )
-            else:
+            try:
+                stat = (project_path / filename).stat()
+            except FileNotFoundError:
                 status = "❌ Missing"
                 size = "-"
                 modified = "-"
+            else:
+                status = "✅ Found"
+                size = f"{stat.st_size / 1024:.1f} KB"
+                modified = datetime.fromtimestamp(stat.st_mtime).isoformat(
+                    sep=" ", timespec="seconds"
+                )
 
-            table.add_row(filename, status, size, modified)
-
-        console.print(table)
+            rows.append((filename, status, size, modified))
+
+        if console.is_terminal:
+            table = Table(title="MCP File Status", show_header=True)
+            table.add_column("File", style="cyan")
+            table.add_column("Status", justify="center")
+            table.add_column("Size", style="magenta", justify="right")
+            table.add_column("Modified", style="green")
+            for row in rows:
+                table.add_row(*row)
+            renderables.append(table)
+        else:
+            # Piped output skips Rich's table layout for a pre-padded grid
+            grid = format_grid(("File", "Status", "Size", "Modified"), rows, {2})
+            renderables.append(Text("MCP File Status\n" + grid))
 
     if watch:
-        console.print(
-            f"[dim]Monitoring would refresh every {interval} seconds...[/dim]"
-        )
-        console.print(
-            "[yellow]Note: Full monitoring requires integration with running MCP server.[/yellow]"
-        )
+        lines = [
+            f"[dim]Monitoring would refresh every {interval} seconds...[/dim]",
+            "[yellow]Note: Full monitoring requires integration with running MCP server.[/yellow]",
+        ]
+        renderables.append("\n".join(lines))
+
+    # Render everything in a single console write
+    console.print(Group(*renderables))
 
 
 @cli.command()
@@ -462,6 +610,7 @@ def monitor(project_root: Optional[str], watch: bool, interval: int):
 )
 def optimize(project_root: str, dry_run: bool):
     """Optimize performance of MCP files."""
+    console = get_console()
     project_path = Path(project_root)
 
     console.print(
@@ -472,40 +621,37 @@ def optimize(project_root: str, dry_run: bool):
 
     # Check operation queue
     queue_file = project_path / "mcp-operations.json"
-    if queue_file.exists():
-        stat = queue_file.stat()
-        size_mb = stat.st_size / 1024 / 1024
-
-        if size_mb > 10:  # 10MB threshold
-            optimizations.append(
-                f"Large operation queue: {size_mb:.1f}MB - Consider cleanup"
-            )
+    try:
+        # The size check and the parse share one open descriptor
+        with open(queue_file, "rb") as queue:
+            size_mb = os.fstat(queue.fileno()).st_size / 1024 / 1024
 
-        try:
-            with open(queue_file, "r") as f:
-                data = json.load(f)
-                operations = data.get("operations", [])
+            if size_mb > 10:  # 10MB threshold
+                optimizations.append(
+                    f"Large operation queue: {size_mb:.1f}MB - Consider cleanup"
+                )
 
-                completed = sum(
-                    1 for op in operations if op.get("status") == "COMPLETED"
+            completed, total = count_queue_statuses(queue)
+            if completed > total * 0.5:
+                optimizations.append(
+                    f"Queue has {completed} completed operations - Consider compaction"
                 )
-                if completed > len(operations) * 0.5:
-                    optimizations.append(
-                        f"Queue has {completed} completed operations - Consider compaction"
-                    )
-        except (OSError, json.JSONDecodeError, KeyError):
-            optimizations.append("Cannot parse operation queue - May be corrupted")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        optimizations.append("Cannot parse operation queue - May be corrupted")
+
+    # One directory pass finds both temporary and backup files
+    temp_files, backup_files = scan_cleanup_candidates(project_path)
 
     # Check for temporary files
-    temp_files = list(project_path.glob("*.tmp"))
     if temp_files:
-        total_size = sum(f.stat().st_size for f in temp_files)
+        total_size = sum(st.st_size for _, st in temp_files)
         optimizations.append(
             f"Found {len(temp_files)} temporary files ({total_size / 1024:.1f}KB)"
         )
 
     # Check for old backup files
-    backup_files = list(project_path.glob("*.corrupted_*"))
     if len(backup_files) > 5:
         optimizations.append(
             f"Found {len(backup_files)} backup files - Keep only recent ones"
@@ -522,7 +668,9 @@ def optimize(project_root: str, dry_run: bool):
             )
         else:
             if click.confirm("\nApply optimizations?"):
-                apply_optimizations(project_path, optimizations)
+                apply_optimizations(
+                    project_path, optimizations, (temp_files, backup_files)
+                )
             else:
                 console.print("[yellow]Optimizations cancelled.[/yellow]")
     else:
@@ -531,30 +679,119 @@ def optimize(project_root: str, dry_run: bool):
         )
 
 
-def apply_optimizations(project_path: Path, optimizations: list):
+def count_queue_statuses(queue: BinaryIO) -> Tuple[int, int]:
+    """Return (completed, total) counts from an open queue, or raise ValueError."""
+    # The queue is read front to back once; let the kernel read ahead further
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(queue.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+    if not IJSON_AVAILABLE:
+        data = load_json(queue.read())
+        if not isinstance(data, dict):
+            raise ValueError("Queue file must contain a JSON object")
+        operations = data.get("operations", [])
+        completed = sum(
+            1
+            for op in operations
+            if isinstance(op, dict) and op.get("status") == "COMPLETED"
+        )
+        return completed, len(operations)
+
+    # Stream parse events so only the two counters are kept in memory;
+    # the parser reads straight from the mapping, skipping a buffered copy
+    completed = total = 0
+    try:
+        with mmap.mmap(queue.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            events = ijson.parse(mm)
+            if next(events, (None, None, None))[1] != "start_map":
+                raise ValueError("Queue file must contain a JSON object")
+            for prefix, event, value in events:
+                if prefix == "operations.item" and event == "start_map":
+                    total += 1
+                elif (
+                    prefix == "operations.item.status"
+                    and event == "string"
+                    and value == "COMPLETED"
+                ):
+                    completed += 1
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid queue file: {e}") from e
+    return completed, total
+
+
+def scan_cleanup_candidates(project_path: Path) -> Tuple[FileStats, FileStats]:
+    """Return (path, stat) pairs for temporary and corrupted-backup files."""
+    temp_files: FileStats = []
+    backup_files: FileStats = []
+    with os.scandir(project_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".tmp"):
+                matches = temp_files
+            elif ".corrupted_" in entry.name:
+                matches = backup_files
+            else:
+                continue
+            try:
+                if entry.is_file():
+                    matches.append((entry.path, entry.stat()))
+            except OSError:
+                # Removed between listing and stat
+                pass
+    return temp_files, backup_files
+
+
+def _unlink_quietly(path: str) -> bool:
+    """Remove a file, reporting whether it was removed."""
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
+
+
+def unlink_files(paths: Iterable[str]) -> int:
+    """Remove files, overlapping the unlink calls for larger batches."""
+    paths = list(paths)
+    if len(paths) < UNLINK_PARALLEL_THRESHOLD:
+        return sum(map(_unlink_quietly, paths))
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(len(paths), UNLINK_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(_unlink_quietly, paths))
+
+
+def apply_optimizations(
+    project_path: Path,
+    optimizations: list,
+    candidates: Optional[Tuple[FileStats, FileStats]] = None,
+):
     """Apply the identified optimizations."""
+    from rich.progress import Progress
+
+    console = get_console()
+    temp_files, backup_files = candidates or scan_cleanup_candidates(project_path)
+
     with Progress(console=console) as progress:
         task = progress.add_task("Applying optimizations...", total=len(optimizations))
 
         for opt in optimizations:
             if "temporary files" in opt:
                 # Clean up temporary files
-                temp_files = list(project_path.glob("*.tmp"))
-                for temp_file in temp_files:
-                    try:
-                        temp_file.unlink()
-                    except OSError:
-                        pass
+                unlink_files(path for path, _ in temp_files)
 
             elif "backup files" in opt:
-                # Keep only 5 most recent backup files
-                backup_files = list(project_path.glob("*.corrupted_*"))
-                backup_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                for backup_file in backup_files[5:]:
-                    try:
-                        backup_file.unlink()
-                    except OSError:
-                        pass
+                # Keep only 5 most recent backup files, using the scanned mtimes
+                backup_files = sorted(
+                    backup_files, key=lambda item: item[1].st_mtime, reverse=True
+                )
+                unlink_files(path for path, _ in backup_files[5:])
 
             progress.advance(task)
 
@@ -565,8 +802,9 @@ def apply_optimizations(project_path: Path, optimizations: list):
 @click.option("--export-path", type=click.Path(), help="Export configuration to file")
 def export_config(export_path: Optional[str]):
     """Export current performance configuration."""
+    console = get_console()
     try:
-        config = get_performance_config()
+        config = load_performance_config(None)
 
         config_dict = {
             "profile": config.profile,
@@ -591,11 +829,10 @@ def export_config(export_path: Optional[str]):
         }
 
         if export_path:
-            with open(export_path, "w") as f:
-                json.dump(config_dict, f, indent=2)
+            Path(export_path).write_bytes(dump_json(config_dict))
             console.print(f"[green]Configuration exported to {export_path}[/green]")
         else:
-            console.print(json.dumps(config_dict, indent=2))
+            console.print(dump_json(config_dict).decode("utf-8"))
 
     except Exception as e:
         console.print(f"[bold red]Error exporting configuration: {e}[/bold red]")
@@ -2,8 +2,14 @@
 Tests for the ModeClassifier.
 """
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mcp.server.fastmcp import FastMCP
+
 from src.specforged.core.classifier import ModeClassifier
 from src.specforged.models import UserMode
+from src.specforged.tools.classification import setup_classification_tools
 
 
 def test_classifier_initialization():
@@ -105,3 +111,26 @@ def test_mixed_patterns():
     # This should lean toward do mode due to stronger "fix" pattern
     result = classifier.classify("Fix the code and update the spec")
     assert result.primary_mode == UserMode.DO
+
+
+def test_classify_mode_tool_caches_results():
+    """Test that the classify_mode tool reuses results for repeated input"""
+    classifier = ModeClassifier()
+    mcp = FastMCP("test")
+    setup_classification_tools(mcp, classifier)
+    classify_mode = mcp._tool_manager._tools["classify_mode"].fn
+    ctx = MagicMock()
+    ctx.info = AsyncMock()
+
+    with patch.object(classifier, "classify", wraps=classifier.classify) as spy:
+        first = asyncio.run(classify_mode("Fix the login bug", ctx))
+        first["reasoning"].append("changed by caller")
+        second = asyncio.run(classify_mode("Fix the login bug", ctx))
+        long_input = "Create a spec for " + "x" * 2000
+        asyncio.run(classify_mode(long_input, ctx))
+        asyncio.run(classify_mode(long_input, ctx))
+
+    assert spy.call_count == 2
+    assert second["mode"] == "do"
+    assert "changed by caller" not in second["reasoning"]
+    assert ctx.info.await_count == 4
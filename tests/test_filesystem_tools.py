@@ -0,0 +1,323 @@
+"""
+Tests for the project-scoped filesystem MCP tools.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from src.specforged.core.project_detector import ProjectDetector
+from src.specforged.tools import filesystem
+from src.specforged.tools.filesystem import setup_filesystem_tools
+
+
+@pytest.fixture
+def project_dir():
+    """Create a temporary project directory"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir).resolve()
+
+
+@pytest.fixture
+def tools(project_dir):
+    """Register the filesystem tools against the temporary project"""
+    spec_manager = MagicMock()
+    spec_manager.project_detector = ProjectDetector(project_dir, trusted=True)
+    mcp = FastMCP("test")
+    setup_filesystem_tools(mcp, spec_manager)
+    registered = {name: tool.fn for name, tool in mcp._tool_manager._tools.items()}
+    fs_write = registered["fs_write"]
+
+    # Per-operation call shapes, routed through the consolidated fs_write tool
+    async def edit_block(file_path, old_string, new_string, ctx, **kwargs):
+        return await fs_write(
+            "edit_block",
+            file_path,
+            ctx,
+            old_string=old_string,
+            new_string=new_string,
+            **kwargs,
+        )
+
+    async def write_file(path, content, ctx, mode="rewrite"):
+        action = "write" if mode == "rewrite" else "append"
+        return await fs_write(action, path, ctx, content=content)
+
+    return dict(registered, edit_block=edit_block, write_file=write_file)
+
+
+def test_registered_filesystem_tools():
+    """Test that write-side operations are exposed through a single tool"""
+    spec_manager = MagicMock()
+    mcp = FastMCP("test")
+    setup_filesystem_tools(mcp, spec_manager)
+    assert set(mcp._tool_manager._tools) == {"read_file", "fs_write", "batch_execute"}
+
+
+@pytest.mark.asyncio
+async def test_fs_write_actions(tools, project_dir):
+    """Test the mkdir action and rejection of unknown actions"""
+    made = await tools["fs_write"]("mkdir", "docs/api", MagicMock())
+    assert made["status"] == "success"
+    assert (project_dir / "docs" / "api").is_dir()
+
+    unknown = await tools["fs_write"]("delete", "docs", MagicMock())
+    assert unknown == {"status": "error", "message": "Unknown action: delete"}
+
+
+@pytest.mark.asyncio
+async def test_edit_block_replaces_expected_occurrences(tools, project_dir):
+    """Test that edit_block replaces exactly the expected occurrences"""
+    target = project_dir / "notes.txt"
+    target.write_text("alpha beta alpha gamma")
+
+    result = await tools["edit_block"](
+        "notes.txt", "alpha", "delta", MagicMock(), expected_replacements=2
+    )
+
+    assert result["status"] == "success"
+    assert target.read_text() == "delta beta delta gamma"
+
+
+@pytest.mark.asyncio
+async def test_edit_block_reports_exact_count_on_mismatch(tools, project_dir):
+    """Test that a count mismatch reports every occurrence and leaves the file"""
+    target = project_dir / "notes.txt"
+    target.write_text("x x x x")
+
+    result = await tools["edit_block"]("notes.txt", "x", "y", MagicMock())
+
+    assert result["status"] == "error"
+    assert result["message"].startswith("Found 4 occurrence(s), expected 1.")
+    assert target.read_text() == "x x x x"
+
+
+@pytest.mark.asyncio
+async def test_edit_block_missing_string(tools, project_dir):
+    """Test that a missing search string is reported as zero occurrences"""
+    (project_dir / "notes.txt").write_text("nothing here")
+
+    result = await tools["edit_block"]("notes.txt", "absent", "y", MagicMock())
+
+    assert result["status"] == "error"
+    assert "Found 0 occurrence(s)" in result["message"]
+
+
+@pytest.mark.asyncio
+async def test_edit_block_streams_large_files(tools, project_dir, monkeypatch):
+    """Test chunked editing, including matches that straddle chunk boundaries"""
+    monkeypatch.setattr(filesystem, "STREAM_EDIT_THRESHOLD", 1)
+    monkeypatch.setattr(filesystem, "STREAM_CHUNK_SIZE", 7)
+    target = project_dir / "big.txt"
+    target.write_text("héllo world, héllo again, héllo end")
+    target.chmod(0o640)
+
+    result = await tools["edit_block"](
+        "big.txt", "héllo", "bye", MagicMock(), expected_replacements=3
+    )
+
+    assert result["status"] == "success"
+    assert target.read_text() == "bye world, bye again, bye end"
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in project_dir.iterdir()] == ["big.txt"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold", [1, 1 << 30])
+async def test_edit_block_keeps_crlf_line_endings(
+    tools, project_dir, monkeypatch, threshold
+):
+    """Test that text copied from read_file edits CRLF files in both paths"""
+    monkeypatch.setattr(filesystem, "STREAM_EDIT_THRESHOLD", threshold)
+    monkeypatch.setattr(filesystem, "STREAM_CHUNK_SIZE", 4)
+    target = project_dir / "crlf.txt"
+    target.write_bytes(b"one\r\ntwo\r\nthree\r\n")
+
+    read = await tools["read_file"]("crlf.txt", MagicMock())
+    assert read["content"] == "one\ntwo\nthree\n"
+
+    lf = await tools["edit_block"]("crlf.txt", "one\ntwo", "1\n2", MagicMock())
+    assert lf["status"] == "success"
+    assert target.read_bytes() == b"1\r\n2\r\nthree\r\n"
+
+    crlf = await tools["edit_block"]("crlf.txt", "2\r\n", "2\r\n2b\n", MagicMock())
+    assert crlf["status"] == "success"
+    assert target.read_bytes() == b"1\r\n2\r\n2b\r\nthree\r\n"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold", [1, 1 << 30])
+async def test_edit_block_keeps_lf_line_endings(
+    tools, project_dir, monkeypatch, threshold
+):
+    """Test that CRLF in old_string still matches an LF file"""
+    monkeypatch.setattr(filesystem, "STREAM_EDIT_THRESHOLD", threshold)
+    target = project_dir / "lf.txt"
+    target.write_bytes(b"one\ntwo\n")
+
+    result = await tools["edit_block"]("lf.txt", "one\r\ntwo", "x\r\ny", MagicMock())
+    assert result["status"] == "success"
+    assert target.read_bytes() == b"x\ny\n"
+
+
+@pytest.mark.asyncio
+async def test_edit_block_streaming_mismatch_keeps_file(
+    tools, project_dir, monkeypatch
+):
+    """Test that a chunked edit with the wrong count leaves the file untouched"""
+    monkeypatch.setattr(filesystem, "STREAM_EDIT_THRESHOLD", 1)
+    monkeypatch.setattr(filesystem, "STREAM_CHUNK_SIZE", 4)
+    target = project_dir / "big.txt"
+    target.write_text("abab abab abab")
+
+    result = await tools["edit_block"]("big.txt", "ab", "x", MagicMock())
+
+    assert result["status"] == "error"
+    assert result["message"].startswith("Found 6 occurrence(s), expected 1.")
+    assert target.read_text() == "abab abab abab"
+    assert [p.name for p in project_dir.iterdir()] == ["big.txt"]
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_runs_operations(tools, project_dir):
+    """Test that batched operations run and report results in request order"""
+    (project_dir / "a.txt").write_text("one")
+
+    result = await tools["batch_execute"](
+        [
+            {"tool": "read_file", "args": {"path": "a.txt"}},
+            {
+                "tool": "fs_write",
+                "args": {"action": "write", "path": "out/b.txt", "content": "two"},
+            },
+            {"tool": "fs_write", "args": {"action": "mkdir", "path": "docs"}},
+        ],
+        MagicMock(),
+        max_concurrent=2,
+    )
+
+    assert result["status"] == "success"
+    assert result["results"][0]["content"] == "one"
+    assert (project_dir / "out" / "b.txt").read_text() == "two"
+    assert (project_dir / "docs").is_dir()
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_reports_failures(tools, project_dir):
+    """Test that an unknown tool fails and stop_on_error skips the rest"""
+    result = await tools["batch_execute"](
+        [
+            {"tool": "delete_everything", "args": {}},
+            {"tool": "read_file", "args": {"filename": "a.txt"}},
+            {
+                "tool": "fs_write",
+                "args": {"action": "write", "path": "c.txt", "content": "x"},
+            },
+        ],
+        MagicMock(),
+        max_concurrent=1,
+        stop_on_error=True,
+    )
+
+    statuses = [item["status"] for item in result["results"]]
+    assert result["status"] == "error"
+    assert statuses == ["error", "skipped", "skipped"]
+    assert "Unknown tool" in result["results"][0]["message"]
+    assert not (project_dir / "c.txt").exists()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "old_string, new_string, expected, status",
+    [
+        ("", "x", 1, "error"),
+        ("a", "b", 0, "error"),
+        ("same", "same", 1, "success"),
+    ],
+)
+async def test_edit_block_degenerate_edits_skip_io(
+    tools, project_dir, old_string, new_string, expected, status
+):
+    """Test that degenerate edits return before reading the file"""
+    result = await tools["edit_block"](
+        "missing.txt",
+        old_string,
+        new_string,
+        MagicMock(),
+        expected_replacements=expected,
+    )
+
+    assert result["status"] == status
+    assert not (project_dir / "missing.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_write_file_recreates_removed_parent(tools, project_dir):
+    """Test that a remembered parent directory is recreated if removed"""
+    first = await tools["write_file"]("out/a.txt", "one", MagicMock())
+    assert first["status"] == "success"
+
+    (project_dir / "out" / "a.txt").unlink()
+    (project_dir / "out").rmdir()
+
+    second = await tools["write_file"]("out/a.txt", "two", MagicMock())
+    assert second["status"] == "success"
+    assert (project_dir / "out" / "a.txt").read_text() == "two"
+
+    await tools["write_file"]("out/a.txt", "+", MagicMock(), mode="append")
+    assert (project_dir / "out" / "a.txt").read_text() == "two+"
+
+
+@pytest.mark.asyncio
+async def test_read_file_served_from_cache_until_changed(tools, project_dir):
+    """Test that unchanged files are not re-read and edits are picked up"""
+    target = project_dir / "a.txt"
+    target.write_text("first")
+    assert (await tools["read_file"]("a.txt", MagicMock()))["content"] == "first"
+
+    with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+        cached = await tools["read_file"]("a.txt", MagicMock())
+    assert cached["content"] == "first"
+
+    target.write_text("second version")
+    assert (await tools["read_file"]("a.txt", MagicMock()))[
+        "content"
+    ] == "second version"
+
+    await tools["edit_block"]("a.txt", "second", "third", MagicMock())
+    assert (await tools["read_file"]("a.txt", MagicMock()))[
+        "content"
+    ] == "third version"
+
+
+def test_content_cache_eviction(project_dir):
+    """Test that the content cache evicts least recently used entries"""
+    cache = filesystem._ContentCache(max_entries=2, max_bytes=10)
+    a, b, c = (project_dir / name for name in "abc")
+
+    cache.put(a, (1,), "aaaa")
+    cache.put(b, (1,), "bbbb")
+    assert cache.get(a, (1,)) == "aaaa"
+    cache.put(c, (1,), "cccc")
+
+    assert cache.get(b, (1,)) is None
+    assert cache.get(a, (2,)) is None
+    assert cache.get(a, (1,)) == "aaaa"
+    cache.put(b, (1,), "bbbbbbbb")
+    assert cache.get(a, (1,)) is None
+    assert cache.get(c, (1,)) is None
+    cache.put(c, (1,), "x" * 11)
+    assert cache.get(c, (1,)) is None
+
+
+def test_append_bytes_creates_and_appends(project_dir):
+    """Test that appends create the file and add to the end"""
+    target = project_dir / "log.txt"
+
+    filesystem._append_bytes(target, "first\n".encode("utf-8"))
+    filesystem._append_bytes(target, "zweite Zeile ü\n".encode("utf-8"))
+
+    assert target.read_text(encoding="utf-8") == "first\nzweite Zeile ü\n"
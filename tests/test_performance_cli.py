@@ -0,0 +1,309 @@
+"""
+Tests for the SpecForge performance CLI commands.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from specforged.tools import performance_cli
+from specforged.tools.performance_cli import cli
+
+
+@pytest.fixture
+def project_dir():
+    """Create a temporary project directory"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def test_config_renders_in_single_write():
+    """Test that the config command emits all tables in one console write"""
+    with patch.object(performance_cli.get_console(), "print") as mock_print:
+        result = CliRunner().invoke(cli, ["config", "--profile", "performance"])
+
+    assert result.exit_code == 0
+    assert mock_print.call_count == 1
+    group = mock_print.call_args.args[0]
+    titles = [getattr(r, "title", None) for r in group.renderables]
+    assert titles[1:] == [
+        "Cache Configuration",
+        "Batching Configuration",
+        "Memory Configuration",
+    ]
+
+
+def test_display_benchmark_results_single_write():
+    """Test that benchmark results and targets are rendered together"""
+    results = {
+        "LRU Cache Performance": {"status": "✅ PASSED", "hit_rate": 0.5},
+        "Queue Processing Throughput": {"status": "❌ FAILED"},
+    }
+    with patch.object(performance_cli.get_console(), "print") as mock_print:
+        performance_cli.display_benchmark_results(results)
+
+    assert mock_print.call_count == 1
+    targets = mock_print.call_args.args[0].renderables[-1].plain
+    assert "✅ Cache hit rate: > 40%" in targets
+    assert "❌ Queue throughput: ≥ 50 ops/sec" in targets
+
+
+def test_monitor_reports_mcp_files(project_dir):
+    """Test that monitor lists present and missing MCP files"""
+    (project_dir / "mcp-operations.json").write_text('{"operations": []}')
+
+    result = CliRunner().invoke(
+        cli, ["monitor", "--project-root", str(project_dir), "--watch"]
+    )
+
+    assert result.exit_code == 0
+    assert "mcp-operations.json" in result.output
+    assert "Missing" in result.output
+    assert "refresh every 30 seconds" in result.output
+
+
+@pytest.mark.parametrize("use_ijson", [False, True])
+def test_count_queue_statuses(project_dir, monkeypatch, use_ijson):
+    """Test completed/total counting with and without the streaming parser"""
+    if use_ijson and performance_cli.ijson is None:
+        pytest.skip("ijson not installed")
+    monkeypatch.setattr(performance_cli, "IJSON_AVAILABLE", use_ijson)
+    queue_file = project_dir / "mcp-operations.json"
+    queue_file.write_text(
+        json.dumps(
+            {
+                "operations": [
+                    {"id": "1", "status": "COMPLETED", "params": {"status": "x"}},
+                    {"id": "2", "status": "PENDING"},
+                    {"id": "3", "status": "COMPLETED"},
+                    {"id": "4"},
+                ]
+            }
+        )
+    )
+
+    with open(queue_file, "rb") as queue:
+        assert performance_cli.count_queue_statuses(queue) == (2, 4)
+
+    for corrupted in ('{"operations": [{"status": ', "", "[]"):
+        queue_file.write_text(corrupted)
+        with open(queue_file, "rb") as queue, pytest.raises(ValueError):
+            performance_cli.count_queue_statuses(queue)
+
+
+def test_optimize_reports_queue_compaction(project_dir):
+    """Test that optimize suggests compaction for mostly-completed queues"""
+    operations = [{"id": str(i), "status": "COMPLETED"} for i in range(3)]
+    (project_dir / "mcp-operations.json").write_text(
+        json.dumps({"operations": operations})
+    )
+
+    result = CliRunner().invoke(
+        cli, ["optimize", "--project-root", str(project_dir), "--dry-run"]
+    )
+
+    assert result.exit_code == 0
+    assert "Queue has 3 completed operations" in result.output
+
+    (project_dir / "mcp-operations.json").write_text("{broken")
+    result = CliRunner().invoke(
+        cli, ["optimize", "--project-root", str(project_dir), "--dry-run"]
+    )
+    assert "Cannot parse operation queue" in result.output
+
+
+def test_optimize_cleans_temp_and_old_backups(project_dir):
+    """Test that applied optimizations remove temp files and old backups"""
+    (project_dir / "a.tmp").write_text("x" * 100)
+    (project_dir / "keep.json").write_text("{}")
+    for i in range(7):
+        backup = project_dir / f"mcp-operations.json.corrupted_{i}"
+        backup.write_text("{}")
+        os.utime(backup, (1_000_000 + i, 1_000_000 + i))
+
+    result = CliRunner().invoke(
+        cli, ["optimize", "--project-root", str(project_dir)], input="y\n"
+    )
+
+    assert result.exit_code == 0
+    assert "Found 1 temporary files" in result.output
+    assert "Found 7 backup files" in result.output
+    assert sorted(p.name for p in project_dir.iterdir()) == [
+        "keep.json",
+        *(f"mcp-operations.json.corrupted_{i}" for i in range(2, 7)),
+    ]
+
+
+@pytest.mark.parametrize("count", [3, 40])
+def test_unlink_files(project_dir, count):
+    """Test sequential and pooled unlinking, ignoring already-missing files"""
+    paths = [project_dir / f"{i}.tmp" for i in range(count)]
+    for path in paths:
+        path.write_text("x")
+    paths[0].unlink()
+
+    removed = performance_cli.unlink_files(str(path) for path in paths)
+
+    assert removed == count - 1
+    assert list(project_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("TRUE", True),
+        ("false", False),
+        ("42", 42),
+        ("-1", -1),
+        ("1_024", 1024),
+        ("0.7", 0.7),
+        ("1e6", 1e6),
+        ("[1, 2]", [1, 2]),
+        ("balanced", "balanced"),
+        ("__import__('os')", "__import__('os')"),
+    ],
+)
+def test_parse_setting_value(raw, expected):
+    """Test that update values parse as literals and fall back to strings"""
+    assert performance_cli.parse_setting_value(raw) == expected
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_dump_json_round_trip(monkeypatch, use_orjson):
+    """Test JSON helpers with and without orjson, stringifying unknown types"""
+    if use_orjson and performance_cli.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(performance_cli, "ORJSON_AVAILABLE", use_orjson)
+
+    payload = performance_cli.dump_json({"path": Path("a/b"), "ratio": 0.5, 1: "x"})
+
+    assert isinstance(payload, bytes)
+    assert payload.startswith(b'{\n  "')
+    assert performance_cli.load_json(payload) == {
+        "path": str(Path("a/b")),
+        "ratio": 0.5,
+        "1": "x",
+    }
+
+
+def test_export_config_writes_json(project_dir):
+    """Test that export_config writes the configuration as JSON"""
+    export_path = project_dir / "perf.json"
+
+    result = CliRunner().invoke(
+        cli, ["export-config", "--export-path", str(export_path)]
+    )
+
+    assert result.exit_code == 0
+    exported = json.loads(export_path.read_bytes())
+    assert set(exported) == {"profile", "cache", "batching", "memory", "concurrency"}
+
+
+def test_format_grid_aligns_columns():
+    """Test that the plain grid pads by display width and right-aligns"""
+    grid = performance_cli.format_grid(
+        ("File", "Status", "Size"),
+        [("a.json", "✅ Found", "1.0 KB"), ("longer.json", "❌ Missing", "-")],
+        right_aligned={2},
+    )
+
+    assert grid.splitlines() == [
+        "File         Status        Size",
+        "a.json       ✅ Found    1.0 KB",
+        "longer.json  ❌ Missing       -",
+    ]
+
+
+def test_monitor_uses_rich_table_on_terminal(project_dir):
+    """Test that interactive terminals still get the Rich table"""
+    console = performance_cli.get_console()
+    with (
+        patch.object(type(console), "is_terminal", True),
+        patch.object(console, "print") as mock_print,
+    ):
+        CliRunner().invoke(cli, ["monitor", "--project-root", str(project_dir)])
+
+    table = mock_print.call_args.args[0].renderables[-1]
+    assert table.title == "MCP File Status"
+    assert table.row_count == 3
+
+
+def test_load_performance_config_memoized(project_dir):
+    """Test that unchanged config files are loaded once per process"""
+    performance_cli._load_config_cached.cache_clear()
+    config_path = project_dir / "perf.yml"
+    result = CliRunner().invoke(
+        cli,
+        ["set-profile", "--profile", "performance", "--config-path", str(config_path)],
+    )
+    assert result.exit_code == 0
+
+    manager = performance_cli.get_config_manager(config_path)
+    with patch.object(manager, "load_config", wraps=manager.load_config) as load:
+        first = performance_cli.load_performance_config(config_path)
+        first.memory.max_queue_size = 1
+        second = performance_cli.load_performance_config(config_path)
+        assert load.call_count == 1
+        assert second.memory.max_queue_size == 50000
+
+        config_path.write_text(config_path.read_text() + "\n# edited\n")
+        performance_cli.load_performance_config(config_path)
+        assert load.call_count == 2
+
+
+def test_monitor_formats_size_and_mtime(project_dir):
+    """Test the size and local modification time shown for found files"""
+    target = project_dir / "mcp-results.json"
+    target.write_bytes(b"x" * 2048)
+    os.utime(target, (1_700_000_000, 1_700_000_000))
+    expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(1_700_000_000))
+
+    result = CliRunner().invoke(cli, ["monitor", "--project-root", str(project_dir)])
+
+    row = next(line for line in result.output.splitlines() if "mcp-results" in line)
+    assert "2.0 KB" in row
+    assert row.endswith(expected)
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available"
+)
+def test_count_queue_statuses_advises_sequential_reads(project_dir):
+    """Test that the queue read is flagged as sequential to the kernel"""
+    queue_file = project_dir / "mcp-operations.json"
+    queue_file.write_text('{"operations": [{"status": "COMPLETED"}]}')
+
+    with (
+        patch.object(os, "posix_fadvise") as fadvise,
+        open(queue_file, "rb") as queue,
+    ):
+        assert performance_cli.count_queue_statuses(queue) == (1, 1)
+        fd = queue.fileno()
+
+    fadvise.assert_called_once_with(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def test_import_does_not_load_server_stack():
+    """Test that importing the CLI module leaves MCP, Rich and asyncio unloaded"""
+    code = (
+        "import sys, specforged.tools.performance_cli; "
+        "print([m for m in ('mcp', 'rich', 'asyncio') if m in sys.modules])"
+    )
+    package_root = Path(performance_cli.__file__).resolve().parents[2]
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": str(package_root)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
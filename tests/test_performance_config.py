@@ -0,0 +1,79 @@
+"""
+Tests for performance configuration loading.
+"""
+
+import copy
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.specforged.config.performance import PerformanceConfigManager
+
+
+@pytest.fixture
+def config_dir():
+    """Create a temporary directory for configuration files"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def test_load_config_writes_and_uses_json_cache(config_dir):
+    """Test that a parsed YAML config is served from its JSON sidecar"""
+    config_path = config_dir / "specforge-performance.yml"
+    config_path.write_text(yaml.safe_dump({"memory": {"max_queue_size": 1234}}))
+
+    first = PerformanceConfigManager(config_path).load_config("balanced")
+    cache_path = config_dir / "specforge-performance.cache.json"
+    assert cache_path.exists()
+    assert first.memory.max_queue_size == 10000
+
+    with patch.object(yaml, "load", side_effect=AssertionError("re-parsed")):
+        cached = PerformanceConfigManager(config_path)._load_from_file()
+    assert cached.memory.max_queue_size == 1234
+    assert sorted(p.name for p in config_dir.iterdir()) == [
+        "specforge-performance.cache.json",
+        "specforge-performance.yml",
+    ]
+
+
+def test_load_config_ignores_stale_cache(config_dir):
+    """Test that editing the YAML file invalidates the sidecar cache"""
+    config_path = config_dir / "perf.yml"
+    config_path.write_text(yaml.safe_dump({"memory": {"max_queue_size": 1}}))
+    PerformanceConfigManager(config_path)._load_from_file()
+
+    config_path.write_text(yaml.safe_dump({"memory": {"max_queue_size": 22}}))
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    config = PerformanceConfigManager(config_path)._load_from_file()
+    assert config.memory.max_queue_size == 22
+
+
+def test_load_config_recovers_from_corrupt_cache(config_dir):
+    """Test that an unreadable sidecar falls back to parsing the YAML"""
+    config_path = config_dir / "perf.yml"
+    config_path.write_text(yaml.safe_dump({"profile": "minimal"}))
+    (config_dir / "perf.cache.json").write_text("{not json")
+
+    config = PerformanceConfigManager(config_path)._load_from_file()
+    assert config.profile == "minimal"
+
+
+def test_profile_configs_shared_and_not_mutated():
+    """Test that profile defaults are built once and left untouched"""
+    first = PerformanceConfigManager()
+    second = PerformanceConfigManager()
+    assert first._profile_configs is second._profile_configs
+
+    snapshot = copy.deepcopy(first._profile_configs)
+    config = first.load_config("development")
+    first.update_config({"memory": {"max_queue_size": 7}, "extra": {"a": 1}})
+
+    assert config.profile == "development"
+    assert config.concurrency.debounce_delay_ms == 100
+    assert second._profile_configs == snapshot
@@ -5,6 +5,13 @@ Tests all security components including input validation, path security,
 rate limiting, file operations, data sanitization, and audit logging.
 """
 
+import fcntl
+import gc
+import hashlib
+import math
+import mmap
+import os
+import stat
 import tempfile
 import time
 from datetime import datetime
@@ -12,6 +19,7 @@ from pathlib import Path
 
 import pytest
 
+from src.specforged.security import secure_file_ops
 from src.specforged.security.audit_logger import (
     SecurityAuditLogger,
     SecurityEventSeverity,
@@ -42,8 +50,11 @@ from src.specforged.security.rate_limiter import (
 )
 from src.specforged.security.secure_file_ops import (
     AtomicFileWriter,
+    DirectoryHandleCache,
     SecureFileError,
     SecureFileOperations,
+    _access_from_stat,
+    secure_file_lock,
 )
 
 
@@ -318,6 +329,48 @@ class TestRateLimiting:
         assert stats is not None
         assert stats["is_banned"] or stats["violation_count"] >= 10
 
+    def test_global_stats_counters(self):
+        """Test that global statistics reflect accepted and rejected requests."""
+        client_id = "stats_client"
+
+        for i in range(5):
+            self.rate_limiter.check_rate_limit(client_id, "heartbeat")
+
+        with pytest.raises(RateLimitExceeded):
+            self.rate_limiter.check_rate_limit(client_id, "heartbeat")
+
+        stats = self.rate_limiter.get_global_stats()
+        assert stats["total_requests"] == 6
+        assert stats["rejected_requests"] == 1
+        assert stats["banned_clients"] == 0
+        assert stats["active_clients"] == 1
+
+    def test_rejection_reports_retry_after(self):
+        """Test that rejected requests carry a positive retry-after."""
+        client_id = "retry_client"
+
+        for i in range(5):
+            self.rate_limiter.check_rate_limit(client_id, "heartbeat")
+
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            self.rate_limiter.check_rate_limit(client_id, "heartbeat")
+
+        assert exc_info.value.limit_type == "token_bucket"
+        assert exc_info.value.retry_after > 0
+
+    def test_request_weight_uses_content_size(self):
+        """Test that large content increases the request weight."""
+        small = self.client_limiter._content_size({"content": "x" * 100})
+        unicode_size = self.client_limiter._content_size({"content": "\u00e9" * 10})
+        assert small == 100
+        assert unicode_size == 20
+
+        # A precomputed size skips measuring the payload entirely
+        with pytest.raises(RateLimitExceeded):
+            self.client_limiter.check_operation_allowed(
+                "heartbeat", {}, {"source": "weight"}, content_bytes=200 * 1024
+            )
+
     def test_rate_limit_recovery(self):
         """Test that rate limits recover over time."""
         client_id = "test_client"
@@ -418,6 +471,337 @@ class TestSecureFileOperations:
         with pytest.raises(SecureFileError):
             self.file_ops.read_json_safely(test_file)
 
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_json_round_trip_independent_of_orjson(self, monkeypatch, use_orjson):
+        """Test that JSON output and parsing do not depend on orjson."""
+        if use_orjson and secure_file_ops.orjson is None:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(secure_file_ops, "ORJSON_AVAILABLE", use_orjson)
+        test_file = self.temp_dir / "values.json"
+
+        self.file_ops.write_json_safely(test_file, {"v": float("nan"), "n": 1})
+        assert test_file.read_text() == '{\n  "n": 1,\n  "v": NaN\n}'
+        assert math.isnan(self.file_ops.read_json_safely(test_file)["v"])
+
+        with pytest.raises(SecureFileError):
+            self.file_ops.write_json_safely(test_file, {"when": datetime.now()})
+
+    def test_file_fingerprint_and_info(self):
+        """Test fast fingerprints and purpose-gated file info."""
+        test_file = self.temp_dir / "fingerprint.txt"
+        test_file.write_text("fingerprint me")
+
+        fingerprint = self.file_ops.calculate_file_fingerprint(test_file)
+        algorithm, digest = fingerprint.split(":")
+        assert algorithm in ("crc32c", "crc32")
+        assert len(digest) == 8
+
+        info = self.file_ops.get_file_info(test_file, purpose="integrity")
+        assert info["fingerprint"] == fingerprint
+        assert info["hash_sha256"] is None
+
+        info = self.file_ops.get_file_info(test_file)
+        assert info["hash_sha256"] == self.file_ops.calculate_file_hash(test_file)
+        assert info["fingerprint"] is None
+
+        # Changing the content changes the fingerprint
+        test_file.write_text("fingerprint me again")
+        assert self.file_ops.calculate_file_fingerprint(test_file) != fingerprint
+
+    @pytest.mark.parametrize("use_crc32c", [False, True])
+    def test_file_fingerprint_values(self, monkeypatch, use_crc32c):
+        """Test mapped fingerprints across windows and for empty files."""
+        if use_crc32c and secure_file_ops.google_crc32c is None:
+            pytest.skip("google-crc32c not installed")
+        monkeypatch.setattr(secure_file_ops, "CRC32C_AVAILABLE", use_crc32c)
+        monkeypatch.setattr(secure_file_ops, "FINGERPRINT_CHUNK_SIZE", 3)
+        test_file = self.temp_dir / "windows.txt"
+        test_file.write_bytes(b"123456789")
+
+        # Check values for the standard "123456789" test vector
+        expected = "crc32c:e3069283" if use_crc32c else "crc32:cbf43926"
+        assert self.file_ops.calculate_file_fingerprint(test_file) == expected
+
+        test_file.write_bytes(b"")
+        assert self.file_ops.calculate_file_fingerprint(test_file).endswith(":00000000")
+
+    def test_file_hash_cache_invalidation(self):
+        """Test that cached hashes are reused until the file changes."""
+        test_file = self.temp_dir / "cached.txt"
+        test_file.write_text("first version")
+
+        first = self.file_ops.calculate_file_hash(test_file)
+        assert self.file_ops.calculate_file_hash(test_file) == first
+        assert len(self.file_ops._hash_cache) == 1
+
+        test_file.write_text("second version!")
+        second = self.file_ops.calculate_file_hash(test_file)
+        assert second != first
+        assert second == hashlib.sha256(b"second version!").hexdigest()
+
+    def test_integrity_detects_change_with_restored_mtime(self):
+        """Test that a same-size edit with the old mtime restored is detected."""
+        test_file = self.temp_dir / "tamper.txt"
+        test_file.write_bytes(b"AAAA")
+        original = test_file.stat()
+        good_hash = self.file_ops.calculate_file_hash(test_file)
+
+        test_file.write_bytes(b"BBBB")
+        os.utime(test_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+
+        assert self.file_ops.calculate_file_hash(test_file) != good_hash
+        assert not self.file_ops.verify_file_integrity(test_file, good_hash)
+
+    def test_file_hash_mapped_windows(self, monkeypatch):
+        """Test that windowed hashing of large files matches hashlib."""
+        monkeypatch.setattr(secure_file_ops, "HASH_WINDOW_SIZE", mmap.PAGESIZE)
+        content = os.urandom(mmap.PAGESIZE * 5 + 123)
+        test_file = self.temp_dir / "large.bin"
+        test_file.write_bytes(content)
+
+        digest = self.file_ops.calculate_file_hash(test_file)
+        assert digest == hashlib.sha256(content).hexdigest()
+
+    def test_unchanged_content_skips_write(self):
+        """Test that rewriting identical content is a no-op."""
+        test_file = self.temp_dir / "dedup.txt"
+        self.file_ops.write_file_safely(test_file, "same content")
+        inode = test_file.stat().st_ino
+
+        self.file_ops.write_file_safely(test_file, "same content")
+        assert test_file.stat().st_ino == inode
+        assert not list(self.temp_dir.glob("dedup.txt.backup.*"))
+
+        copy_target = self.temp_dir / "dedup_copy.txt"
+        self.file_ops.copy_file_safely(test_file, copy_target)
+        copy_inode = copy_target.stat().st_ino
+        self.file_ops.copy_file_safely(test_file, copy_target)
+        assert copy_target.stat().st_ino == copy_inode
+        assert copy_target.read_text() == "same content"
+
+    def test_skip_write_detects_change_with_restored_mtime(self):
+        """Test that identical-content skips never rely on a stale digest."""
+        test_file = self.temp_dir / "restored.txt"
+        self.file_ops.write_file_safely(test_file, "AAAA")
+        # The skipped rewrite caches the digest of the current file
+        self.file_ops.write_file_safely(test_file, "AAAA")
+        original = test_file.stat()
+
+        test_file.write_bytes(b"BBBB")
+        os.utime(test_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+
+        self.file_ops.write_file_safely(test_file, "AAAA")
+        assert test_file.read_bytes() == b"AAAA"
+
+        copy_target = self.temp_dir / "restored_copy.txt"
+        self.file_ops.copy_file_safely(test_file, copy_target)
+        self.file_ops.copy_file_safely(test_file, copy_target)
+        copied = copy_target.stat()
+        copy_target.write_bytes(b"CCCC")
+        os.utime(copy_target, ns=(copied.st_atime_ns, copied.st_mtime_ns))
+
+        self.file_ops.copy_file_safely(test_file, copy_target)
+        assert copy_target.read_bytes() == b"AAAA"
+
+    def test_batched_rewrite_to_original_content_wins(self):
+        """Test that the last batched write wins over an unchanged-content skip."""
+        target = self.temp_dir / "batched_revert.txt"
+        target.write_text("A")
+
+        with self.file_ops.batch():
+            self.file_ops.write_file_safely(target, "B")
+            self.file_ops.write_file_safely(target, "A")
+
+        assert target.read_text() == "A"
+
+    def test_batched_writes(self):
+        """Test that batched writes only appear once the batch commits."""
+        first = self.temp_dir / "batch_a.txt"
+        second = self.temp_dir / "batch_b.txt"
+
+        with self.file_ops.batch():
+            self.file_ops.write_file_safely(first, "a")
+            self.file_ops.write_file_safely(second, "b")
+            assert not first.exists()
+            assert not second.exists()
+
+        assert first.read_text() == "a"
+        assert second.read_text() == "b"
+
+        # A failing batch leaves no files or temporary files behind
+        third = self.temp_dir / "batch_c.txt"
+        with pytest.raises(RuntimeError):
+            with self.file_ops.batch():
+                self.file_ops.write_file_safely(third, "c")
+                raise RuntimeError("abort")
+
+        assert not third.exists()
+        assert not list(self.temp_dir.glob(".batch_c.txt.tmp.*"))
+
+    def test_directory_handle_cache(self):
+        """Test that directory handles are reused and refreshed when replaced."""
+        cache = DirectoryHandleCache(max_entries=1)
+        subdir = self.temp_dir / "synced"
+        subdir.mkdir()
+
+        cache.fsync(subdir)
+        cache.fsync(subdir)
+        assert len(cache._fds) == 1
+
+        subdir.rmdir()
+        subdir.mkdir()
+        cache.fsync(subdir)
+        assert cache._fds[subdir][1][1] == subdir.stat().st_ino
+
+        cache.fsync(self.temp_dir)
+        assert list(cache._fds) == [self.temp_dir]
+
+        cache.close()
+        assert not cache._fds
+
+    def test_directory_handles_released(self):
+        """Test that cached directory handles close on exit and on collection."""
+        with SecureFileOperations(self.path_handler) as file_ops:
+            file_ops.write_file_safely(self.temp_dir / "a.txt", "a")
+            dir_cache = file_ops._dir_cache
+            assert dir_cache._fds
+        assert not dir_cache._fds
+
+        file_ops = SecureFileOperations(self.path_handler)
+        file_ops.write_file_safely(self.temp_dir / "b.txt", "b")
+        dir_cache = file_ops._dir_cache
+        assert dir_cache._fds
+        del file_ops
+        gc.collect()
+        assert not dir_cache._fds
+
+    def test_backup_preserves_previous_content(self):
+        """Test that overwriting a file keeps the previous version as backup."""
+        test_file = self.temp_dir / "versioned.txt"
+        self.file_ops.write_file_safely(test_file, "version 1")
+        self.file_ops.write_file_safely(test_file, "version 2")
+
+        backups = list(self.temp_dir.glob("versioned.txt.backup.*"))
+        assert len(backups) == 1
+        assert backups[0].read_text() == "version 1"
+        assert test_file.read_text() == "version 2"
+
+        # Rapid successive writes keep distinct backups
+        self.file_ops.write_file_safely(test_file, "version 3")
+        backups = sorted(self.temp_dir.glob("versioned.txt.backup.*"))
+        assert [b.read_text() for b in backups] == ["version 1", "version 2"]
+
+    def test_copy_file_fallbacks(self, monkeypatch):
+        """Test that copies succeed when in-kernel copy helpers are unavailable."""
+        source = self.temp_dir / "copy_source.bin"
+        source.write_bytes(os.urandom(256 * 1024))
+
+        def unsupported(*args, **kwargs):
+            raise OSError("unsupported")
+
+        dest = self.temp_dir / "copy_kernel.bin"
+        self.file_ops.copy_file_safely(source, dest)
+        assert dest.read_bytes() == source.read_bytes()
+
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+        dest = self.temp_dir / "copy_fallback.bin"
+        self.file_ops.copy_file_safely(source, dest)
+        assert dest.read_bytes() == source.read_bytes()
+
+    def test_read_bytes_and_newlines(self):
+        """Test raw byte reads and text-mode newline handling."""
+        test_file = self.temp_dir / "crlf.txt"
+        test_file.write_bytes("line one\r\nline tw\u00f6\r".encode("utf-8"))
+
+        assert self.file_ops.read_bytes_safely(test_file) == test_file.read_bytes()
+        assert self.file_ops.read_file_safely(test_file) == "line one\nline tw\u00f6\n"
+
+        empty_file = self.temp_dir / "empty.txt"
+        empty_file.write_bytes(b"")
+        assert self.file_ops.read_file_safely(empty_file) == ""
+        assert self.file_ops.read_bytes_safely(empty_file) == b""
+
+    def test_get_file_infos_preserves_order(self):
+        """Test bulk file information gathering."""
+        paths = []
+        for i in range(5):
+            path = self.temp_dir / f"info_{i}.txt"
+            path.write_text(f"content {i}")
+            paths.append(path)
+
+        infos = self.file_ops.get_file_infos(paths, max_workers=3)
+        assert [info["path"] for info in infos] == [str(p.resolve()) for p in paths]
+        assert infos[2]["hash_sha256"] == hashlib.sha256(b"content 2").hexdigest()
+        assert self.file_ops.get_file_infos([]) == []
+
+    def test_secure_file_lock_timeout(self):
+        """Test that a contended exclusive lock times out cleanly."""
+        test_file = self.temp_dir / "locked.txt"
+        test_file.write_text("locked")
+
+        with secure_file_lock(test_file, lock_type=fcntl.LOCK_EX) as handle:
+            assert handle.read() == "locked"
+
+            start = time.monotonic()
+            with pytest.raises(SecureFileError):
+                with secure_file_lock(test_file, lock_type=fcntl.LOCK_EX, timeout=0.1):
+                    pass
+            assert time.monotonic() - start < 2
+
+        # Lock is released again after the context exits
+        with secure_file_lock(test_file, lock_type=fcntl.LOCK_EX, timeout=0.1):
+            pass
+
+    def test_access_from_stat(self, monkeypatch):
+        """Test permission-bit based access checks for owner and others."""
+
+        def fake_stat(mode, uid, gid):
+            return os.stat_result((mode, 0, 0, 1, uid, gid, 0, 0, 0, 0))
+
+        monkeypatch.setattr(os, "getuid", lambda: 1000)
+        monkeypatch.setattr(os, "getgid", lambda: 1000)
+        monkeypatch.setattr(os, "getgroups", lambda: [1000])
+
+        assert _access_from_stat(fake_stat(0o100640, 1000, 50)) == (True, True, False)
+        assert _access_from_stat(fake_stat(0o100640, 0, 1000)) == (True, False, False)
+        assert _access_from_stat(fake_stat(0o100755, 0, 0)) == (True, False, True)
+
+        monkeypatch.setattr(os, "getuid", lambda: 0)
+        assert _access_from_stat(fake_stat(0o100600, 1000, 1000)) == (True, True, False)
+
+    def test_atomic_writer_permissions(self):
+        """Test that committed files get the requested permission bits."""
+        default_file = self.temp_dir / "default_mode.txt"
+        self.file_ops.write_file_safely(default_file, "content")
+        assert stat.S_IMODE(default_file.stat().st_mode) == 0o644
+
+        private_file = self.temp_dir / "private_mode.txt"
+        with AtomicFileWriter(private_file, mode_bits=0o600) as f:
+            f.write("private")
+        assert stat.S_IMODE(private_file.stat().st_mode) == 0o600
+
+    def test_atomic_writer_temp_name_collision(self):
+        """Test that a leftover temporary file does not block a write."""
+        test_file = self.temp_dir / "collide.txt"
+        next_id = next(secure_file_ops._temp_counter) + 1
+        stale = self.temp_dir / f".collide.txt.tmp.{os.getpid()}.{next_id}"
+        stale.write_text("stale")
+
+        with AtomicFileWriter(test_file) as f:
+            f.write("fresh")
+
+        assert test_file.read_text() == "fresh"
+        assert stale.read_text() == "stale"
+
+    def test_should_secure_delete(self):
+        """Test detection of sensitive files by suffix and name."""
+        assert self.file_ops._should_secure_delete(Path("server.PEM"))
+        assert self.file_ops._should_secure_delete(Path("config.yaml"))
+        assert self.file_ops._should_secure_delete(Path("My_Secrets.txt"))
+        assert self.file_ops._should_secure_delete(Path("API_KEY.txt"))
+        assert not self.file_ops._should_secure_delete(Path("notes.md"))
+
     def test_secure_file_deletion(self):
         """Test secure file deletion."""
         test_file = self.temp_dir / "sensitive.key"
@@ -429,6 +813,13 @@ class TestSecureFileOperations:
         # File should be gone
         assert not test_file.exists()
 
+    def test_delete_missing_file(self):
+        """Test deletion of a path that does not exist."""
+        missing = self.temp_dir / "missing.txt"
+        self.file_ops.delete_file_safely(missing, require_confirmation=False)
+        with pytest.raises(SecureFileError):
+            self.file_ops.delete_file_safely(missing)
+
 
 class TestDataSanitization:
     """Test data sanitization and privacy protection."""
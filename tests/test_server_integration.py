@@ -5,13 +5,18 @@ Tests the complete server setup including queue processing,
 conflict detection, error recovery, and basic server functionality.
 """
 
+import copy
+import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import mcp.types as types
 import pytest
 
+from src.specforged import server as server_module
+from src.specforged.core.project_detector import ProjectDetector
 from src.specforged.core.queue_processor import (
     Operation,
     OperationQueue,
@@ -20,7 +25,21 @@ from src.specforged.core.queue_processor import (
     QueueProcessor,
 )
 from src.specforged.core.spec_manager import SpecificationManager
-from src.specforged.server import create_server, setup_server_tools
+from src.specforged.server import (
+    _read_sync_state,
+    create_server,
+    install_event_loop_policy,
+    setup_server_tools,
+)
+from src.specforged.server_config import (
+    ConfigurationLoader,
+    ServerConfig,
+    _cached_loader,
+    _detect_project_root_cached,
+    _parse_yaml_cached,
+    get_config_paths,
+    load_configuration,
+)
 
 
 class TestServerIntegration:
@@ -279,3 +298,342 @@ class TestServerIntegration:
         # Verify all tool decorators were called
         tool_calls = mock_mcp.tool.call_args_list
         assert len(tool_calls) >= 3
+
+    def test_configuration_cache_invalidation(self, temp_dir, monkeypatch):
+        """Test that config files are parsed once until they change."""
+        (temp_dir / "pyproject.toml").write_text("")
+        config_file = temp_dir / ".specforged.yaml"
+        config_file.write_text("name: First\n")
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setenv("HOME", str(temp_dir / "home"))
+        monkeypatch.delenv("SPECFORGED_NAME", raising=False)
+        _parse_yaml_cached.cache_clear()
+
+        first = load_configuration()
+        again = load_configuration()
+        assert first.name == again.name == "First"
+        assert first is not again
+        assert _parse_yaml_cached.cache_info().misses == 1
+
+        config_file.write_text("name: Second server\n")
+        assert load_configuration().name == "Second server"
+        assert _parse_yaml_cached.cache_info().misses == 2
+
+    def test_project_root_detection_is_cached(self, temp_dir, monkeypatch):
+        """Test that project root detection walks the tree once per cwd."""
+        (temp_dir / "pyproject.toml").write_text("")
+        nested = temp_dir / "src" / "pkg"
+        nested.mkdir(parents=True)
+        monkeypatch.chdir(nested)
+        _detect_project_root_cached.cache_clear()
+
+        assert ConfigurationLoader().project_root == temp_dir.resolve()
+        assert ConfigurationLoader().project_root == temp_dir.resolve()
+        info = _detect_project_root_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_config_file_name_preference(self, temp_dir, monkeypatch):
+        """Test that the most preferred config file name present is loaded."""
+        user_dir = temp_dir / "home" / ".specforged"
+        user_dir.mkdir(parents=True)
+        (user_dir / "specforged.yml").write_text("log_level: DEBUG\n")
+        (user_dir / "config.yml").write_text("log_level: WARNING\n")
+        (temp_dir / "specforged.yaml").write_text("name: Fallback\n")
+        (temp_dir / ".specforged.yml").write_text("name: Preferred\n")
+        monkeypatch.setenv("HOME", str(temp_dir / "home"))
+        for key in ("SPECFORGED_NAME", "SPECFORGED_LOG_LEVEL"):
+            monkeypatch.delenv(key, raising=False)
+
+        config = load_configuration(temp_dir)
+        assert config.log_level == "WARNING"
+        assert config.name == "Preferred"
+
+    def test_project_config_read_as_bytes(self, temp_dir, monkeypatch):
+        """Test that non-ASCII config values survive the binary read."""
+        (temp_dir / ".specforged.yaml").write_text(
+            "name: Spécification\n" + "# padding\n" * 2000 + "port: 9100\n",
+            encoding="utf-8",
+        )
+        monkeypatch.delenv("SPECFORGED_NAME", raising=False)
+        monkeypatch.delenv("SPECFORGED_PORT", raising=False)
+
+        config = ConfigurationLoader(temp_dir)._load_project_config()
+        assert config == {"name": "Spécification", "port": 9100}
+
+    def test_config_parse_cached_by_file_state(self, temp_dir):
+        """Test that unchanged config files are not parsed again."""
+        config_file = temp_dir / ".specforged.yaml"
+        config_file.write_text("cors_origins:\n  - http://a\n")
+        loader = ConfigurationLoader(temp_dir)
+        _parse_yaml_cached.cache_clear()
+
+        first = loader._load_project_config()
+        first["cors_origins"].append("http://b")
+        assert loader._load_project_config() == {"cors_origins": ["http://a"]}
+        assert _parse_yaml_cached.cache_info().hits == 1
+
+        config_file.write_text("cors_origins:\n  - http://c\n  - http://d\n")
+        assert loader._load_project_config()["cors_origins"][0] == "http://c"
+        assert _parse_yaml_cached.cache_info().misses == 2
+
+    def test_config_file_removed_after_listing(self, temp_dir, capsys):
+        """Test that a config file vanishing after the listing is skipped quietly."""
+        (temp_dir / ".specforged.yml").write_text("name: Second choice\n")
+        loader = ConfigurationLoader(temp_dir)
+
+        with patch(
+            "src.specforged.server_config._present_config_names",
+            return_value=[".specforged.yaml", ".specforged.yml"],
+        ):
+            assert loader._load_project_config() == {"name": "Second choice"}
+        assert capsys.readouterr().out == ""
+
+    def test_server_config_uses_slots(self):
+        """Test that ServerConfig stores fields in slots and stays mutable."""
+        config = ServerConfig()
+        assert not hasattr(config, "__dict__")
+        config.project_root = "/srv/project"
+        assert copy.deepcopy(config).project_root == "/srv/project"
+        with pytest.raises(AttributeError):
+            config.unknown_option = True
+
+    def test_server_config_cors_default_shared(self, temp_dir):
+        """Test that the cors_origins default is one shared immutable tuple."""
+        assert ServerConfig().cors_origins == ("*",)
+        assert ServerConfig().cors_origins is ServerConfig().cors_origins
+
+        (temp_dir / ".specforged.yaml").write_text("cors_origins: [http://a]\n")
+        assert load_configuration(temp_dir).cors_origins == ["http://a"]
+
+    def test_config_source_precedence(self, temp_dir, monkeypatch):
+        """Test that environment beats project config, which beats user config."""
+        user_dir = temp_dir / "home" / ".specforged"
+        user_dir.mkdir(parents=True)
+        (user_dir / "config.yaml").write_text("name: User\nport: 8100\nhost: 0.0.0.0\n")
+        (temp_dir / ".specforged.yaml").write_text("name: Project\nport: 8200\n")
+        monkeypatch.setenv("HOME", str(temp_dir / "home"))
+        monkeypatch.setenv("SPECFORGED_PORT", "8300")
+        monkeypatch.delenv("SPECFORGED_NAME", raising=False)
+        monkeypatch.delenv("SPECFORGED_HOST", raising=False)
+
+        config = load_configuration(temp_dir)
+        assert (config.host, config.name, config.port) == ("0.0.0.0", "Project", 8300)
+
+    def test_env_config_conversion(self, temp_dir, monkeypatch, capsys):
+        """Test that environment overrides are converted per config key."""
+        monkeypatch.setenv("SPECFORGED_NAME", "Env server")
+        monkeypatch.setenv("SPECFORGED_PORT", "9001")
+        monkeypatch.setenv("SPECFORGED_DEBUG", "Yes")
+        monkeypatch.setenv("SPECFORGED_CORS_ENABLED", "off")
+        monkeypatch.setenv("SPECFORGED_MAX_REQUESTS", "many")
+
+        env_config = ConfigurationLoader(temp_dir)._load_env_config()
+        assert env_config["name"] == "Env server"
+        assert env_config["port"] == 9001
+        assert env_config["debug_mode"] is True
+        assert env_config["cors_enabled"] is False
+        assert "max_requests_per_minute" not in env_config
+        assert "SPECFORGED_MAX_REQUESTS" in capsys.readouterr().out
+
+    def test_env_config_without_specforged_vars(self, temp_dir, monkeypatch):
+        """Test that no overrides are produced when no SPECFORGE vars are set."""
+        for name in list(os.environ):
+            if name.startswith("SPECFORGE"):
+                monkeypatch.delenv(name)
+        assert ConfigurationLoader(temp_dir)._load_env_config() == {}
+
+        monkeypatch.setenv("SPECFORGE_BASE_DIR", "specs")
+        assert ConfigurationLoader(temp_dir)._load_env_config() == {"base_dir": "specs"}
+
+    def test_config_loader_shared_between_helpers(self, temp_dir, monkeypatch):
+        """Test that the module helpers share one loader per root and home."""
+        monkeypatch.setenv("HOME", str(temp_dir / "home"))
+        _cached_loader.cache_clear()
+
+        with patch(
+            "src.specforged.server_config.ConfigurationLoader",
+            wraps=ConfigurationLoader,
+        ) as mock_loader:
+            load_configuration(temp_dir)
+            paths = get_config_paths(temp_dir)
+            assert mock_loader.call_count == 1
+
+            monkeypatch.setenv("HOME", str(temp_dir / "other"))
+            assert get_config_paths(temp_dir)["user"] != paths["user"]
+            assert mock_loader.call_count == 2
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_read_sync_state(self, temp_dir, monkeypatch, use_orjson):
+        """Test reading missing, empty and populated sync state files."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(server_module, "ORJSON_AVAILABLE", use_orjson)
+        sync_file = temp_dir / "sync.json"
+        assert _read_sync_state(sync_file) is None
+
+        sync_file.write_text("  \n")
+        assert _read_sync_state(sync_file) is None
+
+        sync_file.write_text('{"mcp_server_online": true}')
+        assert _read_sync_state(sync_file) == {"mcp_server_online": True}
+
+    @pytest.mark.asyncio
+    async def test_server_health_reports_worst_check(self, mcp_server):
+        """Test that a failing check makes the overall health unhealthy."""
+        tools = mcp_server._tool_manager._tools
+        health = await tools["get_server_health"].fn()
+        assert set(health["checks"]) == {
+            "queue_processor",
+            "specification_manager",
+            "filesystem",
+        }
+
+        with patch.object(
+            mcp_server.queue_processor,
+            "known_failed_count",
+            side_effect=RuntimeError("queue unavailable"),
+        ):
+            health = await tools["get_server_health"].fn()
+
+        assert health["health"] == "unhealthy"
+        assert health["checks"]["queue_processor"] == {
+            "status": "unhealthy",
+            "error": "queue unavailable",
+        }
+
+    def test_install_event_loop_policy(self, monkeypatch):
+        """Test that uvloop's policy is installed only when uvloop is available."""
+        fake_uvloop = MagicMock()
+        monkeypatch.setattr(server_module, "uvloop", fake_uvloop)
+        with patch("asyncio.set_event_loop_policy") as set_policy:
+            monkeypatch.setattr(server_module, "UVLOOP_AVAILABLE", False)
+            install_event_loop_policy()
+            set_policy.assert_not_called()
+
+            monkeypatch.setattr(server_module, "UVLOOP_AVAILABLE", True)
+            install_event_loop_policy()
+            set_policy.assert_called_once_with(fake_uvloop.EventLoopPolicy())
+
+    def test_base_dir_symlink_resolved(self, temp_dir):
+        """Test that a symlinked base_dir is resolved to its real location."""
+        project = temp_dir / "project"
+        project.mkdir()
+        link = temp_dir / "link"
+        link.symlink_to(project, target_is_directory=True)
+
+        with patch("src.specforged.server.ProjectDetector") as mock_detector_class:
+            mock_detector_class.return_value.project_root = project
+            create_server(base_dir=link / "specs")
+
+        mock_detector_class.assert_called_once_with(working_dir=project.resolve())
+
+    def test_trusted_project_root(self, temp_dir):
+        """Test that a trusted working dir is used without ascending."""
+        (temp_dir / ".git").mkdir()
+        nested = temp_dir / "pkg"
+        nested.mkdir()
+
+        assert ProjectDetector(working_dir=nested).project_root == temp_dir
+        assert (
+            ProjectDetector(working_dir=nested, trusted=True).project_root
+            == nested.resolve()
+        )
+
+    def test_trusted_symlinked_project_root(self, temp_dir):
+        """Test that paths validate under a trusted symlinked or '..' root."""
+        project = temp_dir / "project"
+        project.mkdir()
+        (project / "a.txt").write_text("x")
+        (project / "sub").mkdir()
+        link = temp_dir / "link"
+        link.symlink_to(project, target_is_directory=True)
+
+        for root in (link, project / "sub" / ".."):
+            detector = ProjectDetector(working_dir=root, trusted=True)
+            assert detector.project_root == project.resolve()
+            assert detector.validate_path("a.txt") == project.resolve() / "a.txt"
+
+    @pytest.mark.asyncio
+    async def test_status_snapshot_tracks_queue_file(self, queue_processor):
+        """Test that status counts follow saves and external queue edits."""
+        snapshot = await queue_processor.get_status_snapshot()
+        assert snapshot["total"] == 0
+
+        queue = OperationQueue(
+            operations=[
+                Operation(
+                    id=f"op-{i}",
+                    type=OperationType.HEARTBEAT,
+                    status=status,
+                    timestamp=datetime.now(timezone.utc),
+                )
+                for i, status in enumerate(
+                    [OperationStatus.PENDING, OperationStatus.FAILED]
+                )
+            ]
+        )
+        await queue_processor.save_operation_queue(queue)
+
+        with patch.object(
+            queue_processor,
+            "load_operation_queue",
+            wraps=queue_processor.load_operation_queue,
+        ) as mock_load:
+            snapshot = await queue_processor.get_status_snapshot()
+            mock_load.assert_not_called()
+        assert (snapshot["total"], snapshot["pending"], snapshot["failed"]) == (
+            2,
+            1,
+            1,
+        )
+
+        # Simulate the extension rewriting the queue file
+        queue.operations[0].status = OperationStatus.COMPLETED
+        queue_processor.queue_file.write_text(queue.model_dump_json())
+        snapshot = await queue_processor.get_status_snapshot()
+        assert (snapshot["pending"], snapshot["completed"]) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_process_operation_queue_throttled(self, queue_processor):
+        """Test that queue processing is skipped within the interval."""
+        with patch.object(queue_processor, "process_operation_queue") as mock_process:
+            assert await queue_processor.process_operation_queue_if_due(60.0)
+            mock_process.assert_called_once()
+
+        # A real pass records when it ran, so an immediate repeat is skipped
+        await queue_processor.process_operation_queue()
+        with patch.object(queue_processor, "process_operation_queue") as mock_process:
+            assert not await queue_processor.process_operation_queue_if_due(60.0)
+            assert await queue_processor.process_operation_queue_if_due(0.0)
+            mock_process.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_known_failed_count(self, queue_processor):
+        """Test that failure counts are only known once the queue is seen."""
+        assert queue_processor.known_failed_count() is None
+
+        queue = OperationQueue(
+            operations=[
+                Operation(
+                    id="op-failed",
+                    type=OperationType.HEARTBEAT,
+                    status=OperationStatus.FAILED,
+                    timestamp=datetime.now(timezone.utc),
+                )
+            ]
+        )
+        await queue_processor.save_operation_queue(queue)
+        assert queue_processor.known_failed_count() == 1
+
+        queue.operations.clear()
+        await queue_processor.save_operation_queue(queue)
+        assert queue_processor.known_failed_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_prompts_and_resources_registered(self, mcp_server):
+        """Test that prompts and resources are served through FastMCP."""
+        handler = mcp_server._mcp_server.request_handlers[types.ListPromptsRequest]
+        result = await handler(types.ListPromptsRequest(method="prompts/list"))
+
+        assert result.root.prompts
+        assert await mcp_server.list_resource_templates()
@@ -0,0 +1,108 @@
+"""
+Tests for the project templates and TemplateManager.
+"""
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.specforged.core.spec_manager import SpecificationManager
+from src.specforged.templates import TemplateManager
+from src.specforged.templates.rest_api import get_rest_api_template
+from src.specforged.templates.web_app import (
+    get_web_app_tasks,
+    get_web_app_template,
+    get_web_app_template_json,
+)
+
+
+@pytest.fixture
+def temp_spec_dir():
+    """Create a temporary directory for testing"""
+    temp_dir = Path(tempfile.mkdtemp())
+    yield temp_dir
+    shutil.rmtree(temp_dir)
+
+
+def test_get_template_returns_read_only_view():
+    """Test that templates are shared read-only views of the cached builders"""
+    manager = TemplateManager()
+
+    template = manager.get_template("rest-api")
+    assert template is manager.get_template("rest-api")
+    assert template["name"] == get_rest_api_template()["name"]
+    with pytest.raises(TypeError):
+        template["name"] = "Changed"
+    with pytest.raises(TypeError):
+        template["components"][0]["name"] = "Changed"
+    with pytest.raises(AttributeError):
+        template["user_stories"].clear()
+    assert get_rest_api_template() is get_rest_api_template()
+
+
+def test_get_unknown_template():
+    """Test that unknown template keys return None"""
+    manager = TemplateManager()
+    assert manager.get_template("missing") is None
+    assert manager.get_template_tasks("missing") is None
+
+
+def test_apply_template_to_spec(temp_spec_dir):
+    """Test applying a template adds stories, requirements and design"""
+    spec_manager = SpecificationManager(temp_spec_dir)
+    spec = spec_manager.create_specification("Service", spec_id="service")
+    manager = TemplateManager()
+
+    with patch.object(spec_manager, "save_specification") as mock_save:
+        assert manager.apply_template_to_spec(spec_manager, spec.id, "rest-api")
+    mock_save.assert_called_with("service")
+
+    template = manager.get_template("rest-api")
+    stories = spec_manager.specs["service"].user_stories
+    assert len(stories) == len(template["user_stories"])
+    first = stories[0]
+    assert first.as_a == template["user_stories"][0]["as_a"]
+    assert [req.id for req in first.requirements][:2] == [
+        f"{first.id}-R01",
+        f"{first.id}-R02",
+    ]
+    assert spec.design["data_models"] == template["data_models"]
+    assert spec.design["components"] == get_rest_api_template()["components"]
+    spec.design["components"].append({"name": "Extra"})
+    assert len(template["components"]) == len(get_rest_api_template()["components"])
+
+
+def test_available_templates_are_read_only():
+    """Test that the available-template summary is shared and immutable"""
+    manager = TemplateManager()
+    available = manager.get_available_templates()
+
+    assert available is manager.get_available_templates()
+    assert available["rest-api"]["name"] == "REST API Service"
+    with pytest.raises(TypeError):
+        available["new"] = {}
+    with pytest.raises(TypeError):
+        available["web-app"]["name"] = "Changed"
+
+
+def test_web_app_template_built_once():
+    """Test that the web app template is memoized and viewed read-only"""
+    assert get_web_app_template() is get_web_app_template()
+
+    manager = TemplateManager()
+    template = manager.get_template("web-app")
+    assert template["data_models"].startswith("interface User {")
+    assert template["data_models"] is get_web_app_template()["data_models"]
+    assert json.loads(get_web_app_template_json()) == get_web_app_template()
+    assert manager.get_template_tasks("web-app") == get_web_app_tasks()
+
+
+def test_web_app_template_json():
+    """Test that the pre-serialized template matches the template dict"""
+    payload = get_web_app_template_json()
+    assert payload is get_web_app_template_json()
+    assert json.loads(payload) == get_web_app_template()